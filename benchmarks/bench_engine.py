@@ -0,0 +1,178 @@
+"""
+End-to-end benchmark of the debate engine against the deterministic stub LLM.
+
+Runs simple, judged and panel debates through their runners with the "stub"
+provider (fixed latency, no jitter or errors) and reports, per mode:
+
+- wall time per debate and the time spent inside LLM calls (summed over threads)
+- per-message overhead outside the LLM (prompt building, scoring, threads),
+  measured by rerunning the debate with a zero-latency stub
+- prompt tokens sent per turn as the history grows
+- peak traced memory of one debate
+- throughput with N debates running concurrently
+
+Results are printed and optionally written as JSON for tracking across
+releases.
+
+Usage:
+    python benchmarks/bench_engine.py --epochs 3 --latency-ms 20 --concurrency 1 4 16 \\
+        --output bench_engine.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from autodebater import __version__
+from autodebater.debate_runners import RunnerConfig, runner_for
+from autodebater.stub_llm import StubChatModel, count_tokens
+
+MODES = ("simple", "judged", "panel")
+MOTION = "Cities should ban private cars from their centres"
+
+
+class _Meter:
+    """Totals of time and prompt tokens spent in stub LLM calls."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.llm_s = 0.0
+        self.prompt_tokens = 0
+
+    def snapshot(self) -> tuple:
+        with self.lock:
+            return self.calls, self.llm_s, self.prompt_tokens
+
+
+def _instrument(meter: _Meter) -> None:
+    invoke = StubChatModel.invoke
+
+    def metered(self, messages):
+        tokens = sum(count_tokens(m[1] if isinstance(m, (tuple, list)) else str(m.content))
+                     for m in messages)
+        start = time.perf_counter()
+        try:
+            return invoke(self, messages)
+        finally:
+            with meter.lock:
+                meter.calls += 1
+                meter.llm_s += time.perf_counter() - start
+                meter.prompt_tokens += tokens
+
+    StubChatModel.invoke = metered
+
+
+def _run(mode: str, epochs: int, motion: str, meter: _Meter = None) -> dict:
+    config = RunnerConfig(motion=motion, epochs=epochs, llm="stub", expertise_cache=False)
+    runner = runner_for(mode, config)
+    turn_tokens = []
+    start = time.perf_counter()
+    before = meter.snapshot() if meter else None
+    last_tokens = before[2] if meter else 0
+    messages = 0
+    for _ in runner.run_debate():
+        messages += 1
+        if meter:
+            tokens = meter.snapshot()[2]
+            turn_tokens.append(tokens - last_tokens)
+            last_tokens = tokens
+    wall = time.perf_counter() - start
+    result = {"wall_s": wall, "messages": messages}
+    if meter:
+        after = meter.snapshot()
+        result.update(calls=after[0] - before[0], llm_s=after[1] - before[1],
+                      prompt_tokens_per_message=turn_tokens)
+    return result
+
+
+def _stub_latency(latency_ms: float, tokens_per_second: float) -> None:
+    os.environ["AUTODEBATER_STUB_LATENCY_MS"] = str(latency_ms)
+    os.environ["AUTODEBATER_STUB_TOKENS_PER_SECOND"] = str(tokens_per_second)
+
+
+def _bench_mode(mode: str, args, meter: _Meter) -> dict:
+    _stub_latency(0, 0)
+    instant = [_run(mode, args.epochs, MOTION) for _ in range(args.repeat)]
+    overheads = [r["wall_s"] / r["messages"] * 1000 for r in instant]
+    _stub_latency(args.latency_ms, args.tokens_per_second)
+
+    runs = [_run(mode, args.epochs, MOTION, meter) for _ in range(args.repeat)]
+    walls = [r["wall_s"] for r in runs]
+
+    tracemalloc.start()
+    _run(mode, args.epochs, MOTION)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    throughput = {}
+    for n in args.concurrency:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            # Distinct motions so identical requests are not coalesced across debates
+            done = list(pool.map(lambda i: _run(mode, args.epochs, f"{MOTION} (#{i})"), range(n)))
+        elapsed = time.perf_counter() - start
+        throughput[str(n)] = {
+            "wall_s": round(elapsed, 3),
+            "debates_per_s": round(n / elapsed, 3),
+            "messages_per_s": round(sum(r["messages"] for r in done) / elapsed, 1),
+        }
+
+    first = runs[0]
+    return {
+        "messages": first["messages"],
+        "llm_calls": first["calls"],
+        "wall_s": {"p50": round(statistics.median(walls), 4), "max": round(max(walls), 4)},
+        "llm_s_p50": round(statistics.median(r["llm_s"] for r in runs), 4),
+        "overhead_ms_per_message": {"p50": round(statistics.median(overheads), 3),
+                                    "max": round(max(overheads), 3)},
+        "prompt_tokens_per_message": first["prompt_tokens_per_message"],
+        "prompt_tokens_total": sum(first["prompt_tokens_per_message"]),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "throughput": throughput,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5, help="Sequential debates per mode")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub time to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="Stub output rate (0 = instant)")
+    parser.add_argument("--output", default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    os.environ.update({
+        "AUTODEBATER_STUB_JITTER": "0",
+        "AUTODEBATER_STUB_ERROR_RATE": "0",
+        "AUTODEBATER_STUB_SEED": "0",
+    })
+    meter = _Meter()
+    _instrument(meter)
+
+    results = {
+        "benchmark": "engine",
+        "version": __version__,
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "params": {"epochs": args.epochs, "repeat": args.repeat, "latency_ms": args.latency_ms,
+                   "tokens_per_second": args.tokens_per_second, "concurrency": args.concurrency},
+        "modes": {mode: _bench_mode(mode, args, meter) for mode in args.modes},
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
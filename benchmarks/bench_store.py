@@ -0,0 +1,90 @@
+"""
+Benchmark DebateStore load, list and full-text search latency against a
+large database.
+
+Usage:
+    python benchmarks/bench_store.py --debates 10000 --messages 12
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from autodebater.dialogue import DialogueHistory, DialogueMessage
+from autodebater.persistence import DebateStore
+
+
+# Synthetic vocabulary so term frequencies look like prose rather than one
+# word repeated in every row.
+_VOCAB = [f"w{n:04d}" for n in range(5000)]
+_TERMS = ["w0042", "w0100 w0101", "w123*", "w4999", "w0007 w0008 w0009"]
+
+
+def _populate(store: DebateStore, debates: int, messages: int) -> list:
+    ids = []
+    for n in range(debates):
+        debate_id = str(uuid.uuid4())
+        history = DialogueHistory()
+        for m in range(messages):
+            history.add_message(
+                DialogueMessage(
+                    name=f"speaker{m % 4}",
+                    role="judge" if m % 3 == 2 else "debater",
+                    message=" ".join(random.choices(_VOCAB, k=60)),
+                    debate_id=debate_id,
+                    judgement=float(m % 100) if m % 3 == 2 else None,
+                )
+            )
+        store.save(history, f"Motion number {n}")
+        ids.append(debate_id)
+    return ids
+
+
+def _time(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--debates", type=int, default=10_000)
+    parser.add_argument("--messages", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--db", default=None, help="Reuse an existing database file")
+    args = parser.parse_args()
+
+    db_path = args.db or str(Path(tempfile.mkdtemp()) / "bench.db")
+    store = DebateStore(db_path=db_path)
+
+    start = time.perf_counter()
+    ids = _populate(store, args.debates, args.messages)
+    populate_s = time.perf_counter() - start
+
+    results = {
+        "debates": args.debates,
+        "messages_per_debate": args.messages,
+        "populate_s": round(populate_s, 2),
+        "load": _time(lambda: store.load(random.choice(ids)), args.repeat),
+        "list_debates": _time(store.list_debates, max(args.repeat // 20, 5)),
+        "page_debates": _time(lambda: store.page_debates(limit=50), args.repeat),
+        "search": _time(lambda: store.search(random.choice(_TERMS)), args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Load test for the FastAPI app: N concurrent debates, M SSE viewers per debate.
+
+The app is served by uvicorn in this process (on its own event loop thread)
+against a throwaway database, with every debate using the "stub" LLM provider,
+so no API keys or network access are needed. The harness reports:
+
+- message delivery latency, from the message being produced to a viewer receiving it
+- event-loop lag of the server loop (how late a 50 ms timer fires)
+- thread count and resident memory, sampled during the run
+- error rates: failed debate creations, failed or truncated streams, debates
+  ending in an error event
+
+A summary is printed and the full results are written as JSON with --output.
+
+Usage:
+    python benchmarks/load_api.py --debates 50 --viewers 4 --mode judged --epochs 2 \\
+        --latency-ms 300 --output load_api.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import httpx
+import uvicorn
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:  # not Linux: fall back to the peak
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _percentiles(samples: list) -> dict:
+    if not samples:
+        return {"count": 0}
+    samples = sorted(samples)
+
+    def pick(q: float) -> float:
+        return round(samples[min(len(samples) - 1, int(len(samples) * q))], 2)
+
+    return {"count": len(samples), "p50": round(statistics.median(samples), 2),
+            "p95": pick(0.95), "p99": pick(0.99), "max": round(samples[-1], 2)}
+
+
+class _Server:
+    """uvicorn on a dedicated thread and event loop, so its loop lag can be probed."""
+
+    def __init__(self, app):
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_until_complete, args=(self.server.serve(),),
+                                       daemon=True)
+        self.lags_ms: list = []
+
+    def start(self) -> str:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        asyncio.run_coroutine_threadsafe(self._probe_lag(), self.loop)
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def _probe_lag(self, interval: float = 0.05):
+        while not self.server.should_exit:
+            start = self.loop.time()
+            await asyncio.sleep(interval)
+            self.lags_ms.append((self.loop.time() - start - interval) * 1000)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(10)
+
+
+async def _viewer(client: httpx.AsyncClient, debate_id: str, stats: dict, timeout: float):
+    try:
+        async with client.stream("GET", f"/api/debates/{debate_id}/stream", timeout=timeout) as response:
+            if response.status_code != 200:
+                stats["stream_errors"] += 1
+                return
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    stats["streams_completed"] += 1
+                    return
+                payload = json.loads(data)
+                if "error" in payload:
+                    stats["debate_errors"] += 1
+                elif "seq" in payload:
+                    produced = datetime.fromisoformat(payload["timestamp"])
+                    stats["latencies_ms"].append((datetime.now() - produced).total_seconds() * 1000)
+                    stats["messages_received"] += 1
+        stats["streams_truncated"] += 1
+    except (httpx.HTTPError, asyncio.TimeoutError):
+        stats["stream_errors"] += 1
+
+
+async def _drive(base_url: str, args, stats: dict):
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        request = {"mode": args.mode, "llm": "stub", "epochs": args.epochs, "expertise_cache": False}
+
+        async def one(n: int):
+            try:
+                response = await client.post("/api/debates", json={**request, "motion": f"Load test motion #{n}"})
+                response.raise_for_status()
+            except httpx.HTTPError:
+                stats["create_errors"] += 1
+                return
+            debate_id = response.json()["debate_id"]
+            await asyncio.gather(*(_viewer(client, debate_id, stats, args.timeout) for _ in range(args.viewers)))
+
+        await asyncio.gather(*(one(n) for n in range(args.debates)))
+
+
+def _sample(stop: threading.Event, samples: dict):
+    while not stop.wait(0.2):
+        samples["threads"].append(threading.active_count())
+        samples["rss_mb"].append(_rss_mb())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--debates", type=int, default=20)
+    parser.add_argument("--viewers", type=int, default=3, help="SSE clients per debate")
+    parser.add_argument("--mode", choices=("simple", "judged", "panel"), default="judged")
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=8, help="AUTODEBATER_JOB_WORKERS for the server")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Stub time to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=600.0, help="Per-stream timeout in seconds")
+    parser.add_argument("--output", default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    workdir = tempfile.mkdtemp(prefix="autodebater-load-")
+    os.chdir(workdir)  # the store, expertise cache and anything else file-backed stay in here
+    os.environ.update({
+        "AUTODEBATER_JOB_WORKERS": str(args.workers),
+        "AUTODEBATER_STUB_LATENCY_MS": str(args.latency_ms),
+        "AUTODEBATER_STUB_TOKENS_PER_SECOND": str(args.tokens_per_second),
+        "AUTODEBATER_STUB_JITTER": str(args.jitter),
+        "AUTODEBATER_STUB_ERROR_RATE": str(args.error_rate),
+        "AUTODEBATER_STUB_SEED": "0",
+    })
+    from autodebater import api  # imported late: reads the environment at import
+
+    server = _Server(api.app)
+    base_url = server.start()
+    stats = {"create_errors": 0, "stream_errors": 0, "streams_truncated": 0, "streams_completed": 0,
+             "debate_errors": 0, "messages_received": 0, "latencies_ms": []}
+    samples = {"threads": [], "rss_mb": []}
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample, args=(stop, samples), daemon=True)
+    sampler.start()
+
+    start = time.perf_counter()
+    asyncio.run(_drive(base_url, args, stats))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    server.stop()
+
+    streams = args.debates * args.viewers
+    report = {
+        "benchmark": "api_load",
+        "params": vars(args),
+        "elapsed_s": round(elapsed, 2),
+        "debates_per_min": round(args.debates / elapsed * 60, 2),
+        "messages_delivered_per_s": round(stats["messages_received"] / elapsed, 1),
+        "delivery_latency_ms": _percentiles(stats["latencies_ms"]),
+        "event_loop_lag_ms": _percentiles(server.lags_ms),
+        "threads": {"max": max(samples["threads"], default=threading.active_count())},
+        "rss_mb": {"max": round(max(samples["rss_mb"], default=_rss_mb()), 1)},
+        "errors": {
+            "create": stats["create_errors"],
+            "stream": stats["stream_errors"],
+            "truncated": stats["streams_truncated"],
+            "debate": stats["debate_errors"],
+            "stream_error_rate": round((stats["stream_errors"] + stats["streams_truncated"]) / max(streams, 1), 4),
+        },
+        "streams_completed": stats["streams_completed"],
+    }
+
+    lat, lag = report["delivery_latency_ms"], report["event_loop_lag_ms"]
+    print(f"{args.debates} {args.mode} debates x {args.viewers} viewers in {elapsed:.1f}s "
+          f"({report['debates_per_min']} debates/min)")
+    print(f"  delivery latency ms  p50={lat.get('p50')} p95={lat.get('p95')} max={lat.get('max')}")
+    print(f"  event-loop lag ms    p50={lag.get('p50')} p95={lag.get('p95')} max={lag.get('max')}")
+    print(f"  threads max={report['threads']['max']}  rss max={report['rss_mb']['max']} MB")
+    print(f"  errors {report['errors']}  streams completed {stats['streams_completed']}/{streams}")
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
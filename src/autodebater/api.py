@@ -1,34 +1,63 @@
 """
 FastAPI backend for AutoDebater.
 Debates run in background threads; messages are streamed to clients via SSE.
+Handlers never touch SQLite or the profile file on the event loop: that work
+runs on the shared I/O executor (see autodebater.concurrency).
 """
 
 import asyncio
+import bisect
+import html
 import json
 import logging
 import os
 import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-
-from autodebater.debate_runners import (
-    BasicJudgedDebateRunner,
-    BasicSimpleDebateRunner,
-    ExpertPanelRunner,
-    RunnerConfig,
-)
-from autodebater.persistence import DebateExporter, DebateStore
+from pydantic import BaseModel, Field, field_validator
+
+from autodebater.debate_runners import RUNNER_MODES, RunnerConfig, runner_for
+from autodebater import metrics
+from autodebater.concurrency import run_io
+from autodebater.errors import DebateCancelled
+from autodebater.hooks import global_hooks
+from autodebater.jobs import JOB_MAX_ATTEMPTS, JobWorker
+from autodebater.llm import LLMWrapperFactory
+from autodebater.persistence import AsyncDebateStore, DebateStore
 from autodebater.profile import ProfileStore
+from autodebater.scoring import JudgingCadence
+from autodebater.stopping import from_spec
+from autodebater.tracing import Tracer
+from autodebater.transcript_cache import (CACHE_CONTROL, CachedTranscript,
+                                          TranscriptCache, choose_encoding,
+                                          render_transcript)
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="AutoDebater API", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(application: FastAPI):  # pylint: disable=unused-argument
+    metrics.install()
+    tracer = None
+    if _TRACE_DIR:
+        tracer = Tracer(_TRACE_DIR, _TRACE_FORMAT).attach(global_hooks)
+    await run_io(_get_store)  # run schema migrations once, at startup
+    worker = _get_job_worker()  # picks up jobs left queued or interrupted by a restart
+    yield
+    worker.stop(timeout=1.0)
+    if tracer is not None:
+        tracer.detach()
+
+
+app = FastAPI(title="AutoDebater API", version="1.0.0", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,9 +69,59 @@ app.add_middleware(
 # In-memory registry of running/completed debates
 _debates: dict = {}
 
+# Snippet highlight sentinels; swapped for <mark> tags after HTML-escaping the text.
+_SNIPPET_MARKS = ("\x02", "\x03")
+
+# Default grace period before a debate nobody is watching is cancelled (unset = never)
+_IDLE_CANCEL_SECONDS = (
+    float(os.environ.get("AUTODEBATER_IDLE_CANCEL_SECONDS", "0")) or None
+)
+
+# Write a trace file per debate (<debate_id>.trace.json or .jsonl) into this directory
+_TRACE_DIR = os.environ.get("AUTODEBATER_TRACE_DIR") or None
+_TRACE_FORMAT = os.environ.get("AUTODEBATER_TRACE_FORMAT", "chrome")
+
+# Rendered payloads of completed debates, keyed by debate_id
+_transcripts = TranscriptCache()
+
+# One store per process: connections are reused per thread and the schema is
+# migrated once, on first use, instead of on every request.
+_store: Optional[DebateStore] = None
+_store_lock = threading.Lock()
+
+
+def _get_store() -> DebateStore:
+    global _store  # pylint: disable=global-statement
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DebateStore()
+    return _store
+
+
+def _astore() -> AsyncDebateStore:
+    """The shared store, with every call offloaded to the I/O executor."""
+    return AsyncDebateStore(_get_store())
+
+
+# Runs debate jobs from the durable queue in the store
+_job_worker: Optional[JobWorker] = None
+_job_worker_lock = threading.Lock()
+
+
+def _get_job_worker() -> JobWorker:
+    global _job_worker  # pylint: disable=global-statement
+    if _job_worker is None:
+        with _job_worker_lock:
+            if _job_worker is None:
+                _job_worker = JobWorker(_get_store(), _execute_job)
+                _job_worker.start()
+    return _job_worker
+
+
+class DebateTemplate(BaseModel):
+    """Debate settings shared by a single debate and every debate of a batch."""
 
-class DebateRequest(BaseModel):
-    motion: str
     mode: str = "judged"          # "judged" | "simple" | "panel"
     llm: str = "openai"
     epochs: int = 2
@@ -53,9 +132,52 @@ class DebateRequest(BaseModel):
     use_tools: Optional[bool] = None  # None = mode-dependent default
     domains: Optional[List[str]] = None
     context: Optional[str] = None     # override profile context for this debate
+    # wall-clock budget for the whole debate
+    deadline_seconds: Optional[float] = None
+    # cancel after this long with no SSE viewer
+    idle_cancel_seconds: Optional[float] = None
+    stopping: Optional[List[dict]] = None  # e.g. [{"policy": "stability", "window": 3}]
+    judging: str = "message"  # judging cadence: message | epoch | every:k | end
+    expertise_cache: bool = True  # False re-discovers judge expertise for variety
+
+    @field_validator("mode")
+    @classmethod
+    def _check_mode(cls, mode):
+        if mode not in RUNNER_MODES:
+            raise ValueError(f"Unknown mode {mode!r}; use one of {RUNNER_MODES}")
+        return mode
+
+    @field_validator("llm")
+    @classmethod
+    def _check_llm(cls, llm):
+        if llm not in LLMWrapperFactory.llms:
+            raise ValueError(
+                f"Unknown llm {llm!r}; use one of {tuple(LLMWrapperFactory.llms)}"
+            )
+        return llm
+
+    @field_validator("stopping")
+    @classmethod
+    def _check_stopping(cls, specs):
+        return [from_spec(spec).spec() for spec in specs] if specs else specs
+
+    @field_validator("judging")
+    @classmethod
+    def _check_judging(cls, cadence):
+        JudgingCadence(cadence)
+        return cadence
+
+
+class DebateRequest(DebateTemplate):
+    motion: str
+
+
+class BatchRequest(BaseModel):
+    motions: List[str] = Field(..., min_length=1, max_length=1000)
+    template: DebateTemplate = Field(default_factory=DebateTemplate)
 
 
-def _build_runner(req: DebateRequest):
+def _build_runner(req: DebateRequest, debate_id: Optional[str] = None):
     # Panel defaults to tools-on (evidence-backed discussion); debates default off
     use_tools = req.use_tools if req.use_tools is not None else (req.mode == "panel")
     # Auto-load profile unless the request supplies explicit context
@@ -71,18 +193,115 @@ def _build_runner(req: DebateRequest):
         use_tools=use_tools,
         domains=req.domains,
         context=context,
+        deadline_seconds=req.deadline_seconds,
+        debate_id=debate_id,
+        stopping=req.stopping,
+        judging=req.judging,
+        expertise_cache=req.expertise_cache,
     )
-    if req.mode == "panel":
-        return ExpertPanelRunner(config)
-    if req.mode == "simple":
-        return BasicSimpleDebateRunner.from_config(config)
-    return BasicJudgedDebateRunner.from_config(config)
+    return runner_for(req.mode, config)
+
+
+def _check_provider(llm: str) -> None:
+    """Fail fast, before queueing, if this server cannot create *llm* clients.
+
+    A missing API key, for instance, is reported as 422 instead of failing the job.
+    """
+    try:
+        LLMWrapperFactory.llms[llm]()
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _sse_event(payload: dict) -> str:
+    """Render one message as an SSE event whose id is the message's sequence number."""
+    return f"id: {payload['seq']}\ndata: {json.dumps(payload)}\n\n"
+
+
+def _parse_last_event_id(value: Optional[str]) -> int:
+    """Sequence number the client already has, or -1 to start from the beginning."""
+    try:
+        return int(value) if value else -1
+    except ValueError:
+        return -1
+
+
+def _publish(record: dict, msg) -> None:
+    """Append a yielded message to a live record, serialising it exactly once."""
+    payload = msg.to_dict()
+    record["events"].append(_sse_event(payload))
+    record["messages"].append(payload)
+
+
+def _new_record(motion: str, mode: str, runner=None) -> dict:
+    """In-memory state of one live debate, shared by its thread and SSE viewers."""
+    return {
+        "motion": motion,
+        "mode": mode,
+        "messages": [],
+        "events": [],
+        "done": False,
+        "error": None,
+        "cancelled": None,
+        "runner": runner,
+        "subscribers": 0,
+        "last_seen": time.monotonic(),
+    }
+
+
+def _record_status(record: dict) -> str:
+    if record["cancelled"]:
+        return "cancelled"
+    if record["error"]:
+        return "failed"
+    return "completed" if record["done"] else "running"
+
+
+def _idle_watchdog(record: dict, grace: float):
+    """Cancellation watchdog that fires after *grace* seconds without an SSE client."""
+
+    def check():
+        if (
+            record["subscribers"] == 0
+            and time.monotonic() - record["last_seen"] > grace
+        ):
+            return f"no viewers for {grace:g}s"
+        return None
+
+    return check
+
+
+def _render_completed(debate_id: str) -> Optional[CachedTranscript]:
+    store = _get_store()
+    meta = store.get_debate_meta(debate_id)
+    if meta is None or meta["status"] != "completed":
+        return None
+    return render_transcript(meta, store.load(debate_id), _sse_event)
+
+
+async def _cached_transcript(debate_id: str) -> Optional[CachedTranscript]:
+    """Cached payloads for a completed, persisted debate.
+
+    They are rendered off the event loop on first use.
+    """
+    record = _debates.get(debate_id)
+    if record is not None and not record["done"]:
+        return None
+    entry = _transcripts.get(debate_id)
+    if entry is None:
+        entry = await run_io(_render_completed, debate_id)
+        if entry is not None:
+            _transcripts.put(debate_id, entry)
+    return entry
 
 
 def _run_in_thread(debate_id: str, runner):
     try:
         for msg in runner.run_debate():
-            _debates[debate_id]["messages"].append(msg.to_dict())
+            _publish(_debates[debate_id], msg)
+    except DebateCancelled as exc:
+        logger.info("Debate %s cancelled: %s", debate_id, exc.reason)
+        _debates[debate_id]["cancelled"] = exc.reason
     except Exception as exc:
         logger.exception("Debate %s failed: %s", debate_id, exc)
         _debates[debate_id]["error"] = str(exc)
@@ -90,92 +309,247 @@ def _run_in_thread(debate_id: str, runner):
         _debates[debate_id]["done"] = True
         # Persist on completion
         try:
-            motion = _debates[debate_id]["motion"]
-            DebateStore().save(runner.debate.dialogue_history, motion)
+            record = _debates[debate_id]
+            _get_store().save(
+                runner.debate.dialogue_history,
+                record["motion"],
+                mode=record["mode"],
+                status=_record_status(record),
+            )
+            _transcripts.invalidate(debate_id)
         except Exception:
             pass
 
 
+def _execute_job(job: dict) -> str:
+    """
+    Job handler: run one queued debate under the job's id. A debate that fails
+    raises, so the worker requeues it while attempts remain; a retry resumes
+    from the debate's last checkpoint instead of starting over. The checkpoint
+    is dropped once the job is over: completed, cancelled or out of attempts.
+    """
+    try:
+        status = _run_job(job)
+    except Exception:
+        if job.get("attempts", 0) >= job.get("max_attempts", JOB_MAX_ATTEMPTS):
+            _get_store().delete_checkpoint(job["job_id"])
+        raise
+    _get_store().delete_checkpoint(job["job_id"])
+    return status
+
+
+def _run_job(job: dict) -> str:
+    debate_id = job["job_id"]
+    req = DebateRequest(**job["request"])
+    store = _get_store()
+    record = _debates.get(debate_id)
+    if record is None or record["done"]:  # first attempt after a restart, or a retry
+        record = _debates[debate_id] = _new_record(req.motion, req.mode)
+    runner = _build_runner(req, debate_id=debate_id)
+    checkpoint = store.load_checkpoint(debate_id)
+    if checkpoint is not None:
+        runner.resume(checkpoint["state"])
+        for msg in runner.debate.dialogue_history.messages:
+            _publish(record, msg)
+    runner.checkpoint_to(store)
+    record["runner"] = runner
+    grace = req.idle_cancel_seconds or _IDLE_CANCEL_SECONDS
+    if grace:
+        runner.debate.cancel_token.watchdog = _idle_watchdog(record, grace)
+    if record["cancelled"]:  # DELETE arrived while the job was being claimed
+        runner.cancel(record["cancelled"])
+    _run_in_thread(debate_id, runner)
+    if record["error"]:
+        raise RuntimeError(record["error"])
+    return _record_status(record)
+
+
+def _job_record(job: Optional[dict]) -> Optional[dict]:
+    """Live record for a queued or running job; viewers can attach before it starts."""
+    if job is None or job["state"] not in ("queued", "running"):
+        return None
+    request = job["request"]
+    return _debates.setdefault(
+        job["job_id"], _new_record(request["motion"], request.get("mode", "judged"))
+    )
+
+
+def _cancel_record(record: dict, reason: str) -> None:
+    """Cancel a live debate: at its next turn boundary, or as soon as it is built."""
+    if record["runner"] is None:  # claimed by a worker, still being built
+        record["cancelled"] = reason
+    else:
+        record["runner"].cancel(reason)
+
+
+_FINISHED_JOB_STATES = ("completed", "failed", "cancelled")
+
+
+def _batch_item(job: dict) -> dict:
+    return {
+        "index": job["batch_index"],
+        "motion": job["request"]["motion"],
+        "debate_id": job["job_id"],
+        "status": job["state"],
+        "final_score": job["final_score"],
+        "error": job["error"],
+    }
+
+
+def _batch_done(jobs: list) -> bool:
+    return all(job["state"] in _FINISHED_JOB_STATES for job in jobs)
+
+
+def _batch_progress(batch_id: str, jobs: list) -> dict:
+    counts = dict.fromkeys(("queued", "running", "completed", "failed", "cancelled"), 0)
+    for job in jobs:
+        counts[job["state"]] += 1
+    return {
+        "batch_id": batch_id,
+        "created_at": jobs[0]["created_at"],
+        "total": len(jobs),
+        "counts": counts,
+        "done": _batch_done(jobs),
+        "items": [_batch_item(job) for job in jobs],
+    }
+
+
+def _export_batch(batch_id: str, jobs: list) -> dict:
+    store = _get_store()
+    debates = []
+    for job in jobs:
+        entry = _batch_item(job)
+        entry["meta"] = store.get_debate_meta(job["job_id"])
+        entry["messages"] = [m.to_dict() for m in store.load(job["job_id"])]
+        debates.append(entry)
+    return {
+        "batch_id": batch_id,
+        "created_at": jobs[0]["created_at"],
+        "debates": debates,
+    }
+
+
+async def _batch_jobs(batch_id: str) -> list:
+    jobs = await _astore().batch_jobs(batch_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    return jobs
+
+
 @app.get("/api/profile")
 async def get_profile():
-    content = ProfileStore().load()
+    content = await ProfileStore().aload()
     return {"content": content or ""}
 
 
 @app.put("/api/profile")
 async def save_profile(payload: dict):
-    ProfileStore().save(payload.get("content", ""))
+    await ProfileStore().asave(payload.get("content", ""))
     return {"status": "saved"}
 
 
 @app.post("/api/debates")
 async def create_debate(req: DebateRequest):
-    runner = _build_runner(req)
-    debate_id = runner.debate.debate_id
-    _debates[debate_id] = {
-        "motion": req.motion,
-        "mode": req.mode,
-        "messages": [],
-        "done": False,
-        "error": None,
-    }
-    thread = threading.Thread(target=_run_in_thread, args=(debate_id, runner), daemon=True)
-    thread.start()
+    """
+    Queue a debate as a durable job; it is streamable right away and survives
+    a server restart (an interrupted debate resumes from its last checkpoint).
+    The settings are checked first, so a bad mode or llm, or a provider with
+    no credentials, is a 422 rather than a job that fails on every attempt.
+    """
+    await run_io(_check_provider, req.llm)
+    debate_id = str(uuid.uuid4())
+    _debates[debate_id] = _new_record(req.motion, req.mode)
+    await _astore().enqueue_job(
+        debate_id, req.model_dump(), max_attempts=JOB_MAX_ATTEMPTS
+    )
+    _get_job_worker().notify()
     return {"debate_id": debate_id, "mode": req.mode, "motion": req.motion}
 
 
 @app.get("/api/debates/{debate_id}/stream")
-async def stream_debate(debate_id: str):
-    """SSE endpoint — streams messages as they are produced."""
-
-    # Check active debates first
-    if debate_id in _debates:
-        record = _debates[debate_id]
+async def stream_debate(
+    debate_id: str,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    SSE endpoint — streams messages as they are produced.
+
+    Every message event carries its sequence number as the SSE ``id``. A client
+    reconnecting with ``Last-Event-ID`` resumes after that message instead of
+    receiving the whole transcript again.
+    """
+    after = _parse_last_event_id(last_event_id)
+
+    # Check active debates first (including queued jobs, e.g. after a restart)
+    record = _debates.get(debate_id)
+    if record is None:
+        record = _job_record(await _astore().get_job(debate_id))
+    if record is not None:
 
         async def generate_live():
-            index = 0
-            while True:
-                messages = record["messages"]
-                while index < len(messages):
-                    yield f"data: {json.dumps(messages[index])}\n\n"
-                    index += 1  # noqa: F821  (nonlocal via closure is fine here)
-                if record["done"]:
-                    if record["error"]:
-                        yield f"data: {json.dumps({'error': record['error']})}\n\n"
-                    yield "data: [DONE]\n\n"
-                    break
-                await asyncio.sleep(0.15)
-
-        # Rebind index in a mutable container to avoid Python closure gotcha
-        async def generate_live_fixed():
-            idx = 0
-            while True:
-                messages = record["messages"]
-                while idx < len(messages):
-                    yield f"data: {json.dumps(messages[idx])}\n\n"
-                    idx += 1
-                if record["done"]:
-                    if record["error"]:
-                        yield f"data: {json.dumps({'error': record['error']})}\n\n"
-                    yield "data: [DONE]\n\n"
-                    break
-                await asyncio.sleep(0.15)
+            record["subscribers"] += 1
+            try:
+                idx = bisect.bisect_right(
+                    record["messages"], after, key=lambda m: m["seq"]
+                )
+                while True:
+                    events = record["events"]
+                    while idx < len(events):
+                        yield events[idx]
+                        idx += 1
+                    if record["done"]:
+                        if record["error"]:
+                            yield f"data: {json.dumps({'error': record['error']})}\n\n"
+                        if record["cancelled"]:
+                            cancelled = {"cancelled": record["cancelled"]}
+                            yield f"data: {json.dumps(cancelled)}\n\n"
+                        yield "data: [DONE]\n\n"
+                        break
+                    await asyncio.sleep(0.15)
+            finally:
+                record["subscribers"] -= 1
+                record["last_seen"] = time.monotonic()
 
         return StreamingResponse(
-            generate_live_fixed(),
+            generate_live(),
             media_type="text/event-stream",
             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
+    # Completed debates replay from pre-rendered (and pre-compressed) frames
+    entry = await _cached_transcript(debate_id)
+    if entry is not None:
+        headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        if after < 0:
+            encoding = choose_encoding(accept_encoding, entry.stream_bodies)
+            if encoding != "identity":
+                headers["Content-Encoding"] = encoding
+            headers["Vary"] = "Accept-Encoding"
+            return Response(
+                entry.stream_bodies[encoding],
+                media_type="text/event-stream",
+                headers=headers,
+            )
+
+        async def replay_cached():
+            for event in entry.events[bisect.bisect_right(entry.seqs, after):]:
+                yield event
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(
+            replay_cached(), media_type="text/event-stream", headers=headers
+        )
+
     # Fall back to persisted history
-    store = DebateStore()
-    messages = store.load(debate_id)
-    if not messages:
+    store = _astore()
+    messages = await store.load(debate_id, after_seq=None if after < 0 else after)
+    if not messages and (after < 0 or await store.get_debate_meta(debate_id) is None):
         raise HTTPException(status_code=404, detail="Debate not found")
 
     async def replay():
         for msg in messages:
-            yield f"data: {json.dumps(msg.to_dict())}\n\n"
+            yield _sse_event(msg.to_dict())
         yield "data: [DONE]\n\n"
 
     return StreamingResponse(
@@ -186,16 +560,77 @@ async def stream_debate(debate_id: str):
 
 
 @app.get("/api/debates")
-async def list_debates():
-    return DebateStore().list_debates()
+async def list_debates(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    mode: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    motion_prefix: Optional[str] = None,
+):
+    """Keyset-paginated debate summaries, newest first.
+
+    Pass ``next_cursor`` back as ``cursor`` to fetch the next page.
+    """
+    try:
+        return await _astore().page_debates(
+            limit=limit, cursor=cursor, mode=mode, since=since, until=until,
+            motion_prefix=motion_prefix,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.get("/api/search")
+async def search(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """Ranked full-text search over messages and motions, with highlighted snippets."""
+    hits = await _astore().search(
+        q, limit=limit + 1, offset=offset, highlight=_SNIPPET_MARKS
+    )
+    for hit in hits:
+        hit["snippet"] = (
+            html.escape(hit["snippet"])
+            .replace(_SNIPPET_MARKS[0], "<mark>")
+            .replace(_SNIPPET_MARKS[1], "</mark>")
+        )
+    next_offset = offset + limit if len(hits) > limit else None
+    return {"query": q, "items": hits[:limit], "next_offset": next_offset}
 
 
 @app.get("/api/debates/{debate_id}")
-async def get_debate(debate_id: str):
-    store = DebateStore()
-    messages = store.load(debate_id)
-    debates = store.list_debates()
-    meta = next((d for d in debates if d["debate_id"] == debate_id), None)
+async def get_debate(
+    debate_id: str,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """
+    Debate metadata and transcript. Completed debates are served from the
+    pre-compressed transcript cache with a strong ETag and an immutable
+    Cache-Control; a matching If-None-Match gets a 304.
+    """
+    entry = await _cached_transcript(debate_id)
+    if entry is not None:
+        encoding = choose_encoding(accept_encoding, entry.bodies)
+        headers = {
+            "ETag": entry.etag_for(encoding),
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if entry.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(
+            entry.bodies[encoding], media_type="application/json", headers=headers
+        )
+
+    store = _astore()
+    messages = await store.load(debate_id)
+    meta = await store.get_debate_meta(debate_id)
     if not meta and debate_id not in _debates:
         raise HTTPException(status_code=404, detail="Debate not found")
     if not meta and debate_id in _debates:
@@ -204,15 +639,185 @@ async def get_debate(debate_id: str):
             "motion": _debates[debate_id]["motion"],
             "mode": _debates[debate_id]["mode"],
             "created_at": None,
+            "status": _record_status(_debates[debate_id]),
         }
     return {"meta": meta, "messages": [m.to_dict() for m in messages]}
 
 
+@app.delete("/api/debates/{debate_id}", status_code=202)
+async def cancel_debate(debate_id: str):
+    """
+    Cooperatively cancel a queued or running debate. A running one stops at the
+    next turn (or tool iteration) boundary and its partial transcript is saved
+    as ``cancelled``. A debate that has already finished is a 409.
+    """
+    store = _astore()
+    record = _debates.get(debate_id)
+    # Not running here: still queued, or requeued for a retry after a failed attempt
+    not_running = record is None or record["runner"] is None or record["done"]
+    if not_running and await store.cancel_job(debate_id):
+        await store.delete_checkpoint(debate_id)  # left by an earlier failed attempt
+        if record is not None:  # end its live stream
+            record["cancelled"] = "cancelled by client"
+            record["done"] = True
+        return {"debate_id": debate_id, "status": "cancelled"}
+    if record is None:
+        job = await store.get_job(debate_id)
+        # claimed, live record not created yet
+        if job is not None and job["state"] == "running":
+            record = _job_record(job)
+        elif job is None and await store.get_debate_meta(debate_id) is None:
+            raise HTTPException(status_code=404, detail="Debate not found")
+    if record is None or record["done"]:
+        raise HTTPException(status_code=409, detail="Debate is not running")
+    _cancel_record(record, "cancelled by client")
+    return {"debate_id": debate_id, "status": "cancelling"}
+
+
+@app.get("/api/jobs")
+async def list_jobs(
+    state: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Queue depth (counts per state) and the oldest jobs, optionally by state."""
+    store = _astore()
+    stats = await store.job_stats()
+    items = await store.list_jobs(state=state, limit=limit)
+    return {
+        "depth": stats["counts"]["queued"],
+        "counts": stats["counts"],
+        "oldest_queued_at": stats["oldest_queued_at"],
+        "items": items,
+    }
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = await _astore().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.post("/api/batches", status_code=202)
+async def create_batch(req: BatchRequest):
+    """
+    Queue one debate job per motion, all sharing ``template``. They run on the
+    job workers like any other debate (durably, with retries), and each one is
+    streamable on its own under its debate_id.
+    """
+    await run_io(_check_provider, req.template.llm)
+    batch_id = uuid.uuid4().hex
+    template = req.template.model_dump()
+    jobs = [(str(uuid.uuid4()), DebateRequest(motion=motion, **template).model_dump())
+            for motion in req.motions]
+    await _astore().enqueue_batch(batch_id, jobs, max_attempts=JOB_MAX_ATTEMPTS)
+    _get_job_worker().notify()
+    return {"batch_id": batch_id, "total": len(jobs)}
+
+
+@app.get("/api/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    """Aggregate progress from the batch's job rows: status counts and every item."""
+    return _batch_progress(batch_id, await _batch_jobs(batch_id))
+
+
+@app.get("/api/batches/{batch_id}/results")
+async def stream_batch_results(batch_id: str):
+    """NDJSON feed: one line per finished debate, in completion order.
+
+    The stream ends once the whole batch is done.
+    """
+    jobs = await _batch_jobs(batch_id)
+
+    async def generate():
+        sent = set()
+        current = jobs
+        while True:
+            finished = sorted(
+                (
+                    j
+                    for j in current
+                    if j["state"] in _FINISHED_JOB_STATES and j["job_id"] not in sent
+                ),
+                key=lambda j: j["updated_at"],
+            )
+            for job in finished:
+                sent.add(job["job_id"])
+                yield json.dumps(_batch_item(job)) + "\n"
+            if len(sent) == len(current):
+                break
+            await asyncio.sleep(0.25)
+            current = await _astore().batch_jobs(batch_id)
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/batches/{batch_id}/export")
+async def export_batch(batch_id: str):
+    """Every transcript and final score of a finished batch, as one JSON document."""
+    jobs = await _batch_jobs(batch_id)
+    if not _batch_done(jobs):
+        raise HTTPException(status_code=409, detail="Batch is still running")
+    return await run_io(_export_batch, batch_id, jobs)
+
+
+@app.delete("/api/batches/{batch_id}", status_code=202)
+async def cancel_batch(batch_id: str):
+    """Cancel a batch: drop queued debates and stop running ones at their next turn."""
+    await _batch_jobs(batch_id)
+    store = _astore()
+    await store.cancel_batch(batch_id)
+    for job in await store.batch_jobs(batch_id):
+        record = _debates.get(job["job_id"])
+        if job["state"] == "running":
+            _cancel_record(_job_record(job), "batch cancelled")
+        elif job["state"] == "cancelled":
+            if job["attempts"]:  # requeued after a failed attempt
+                await store.delete_checkpoint(job["job_id"])
+            if record is not None and not record["done"]:
+                # never started: end its live stream
+                record["cancelled"] = "batch cancelled"
+                record["done"] = True
+    return {"batch_id": batch_id, "status": "cancelling"}
+
+
 @app.get("/api/health")
 async def health():
     return {"status": "ok"}
 
 
+def _live_debate_gauges() -> tuple:
+    records = list(_debates.values())
+    active = sum(1 for r in records if r["runner"] is not None and not r["done"])
+    subscribers = sum(r["subscribers"] for r in records)
+    return active, subscribers
+
+
+metrics.gauge("autodebater_debates_active",
+              "Debates currently running in this process.",
+              lambda: {(): _live_debate_gauges()[0]})
+metrics.gauge("autodebater_sse_subscribers", "Open SSE streams of live debates.",
+              lambda: {(): _live_debate_gauges()[1]})
+metrics.gauge("autodebater_debates_queued", "Debate jobs waiting in the durable queue.",
+              lambda: {(): _get_store().job_stats()["counts"]["queued"]})
+metrics.gauge("autodebater_jobs", "Debate jobs in the store, by state.",
+              lambda: {(state,): n
+                       for state, n in _get_store().job_stats()["counts"].items()},
+              labelnames=("state",))
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Prometheus scrape endpoint; sync so the gauges' store queries run off-loop."""
+    metrics.install()
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # ── Serve React SPA (production build) ──────────────────────────────────────
 _WEBAPP_DIST = Path(__file__).parent.parent.parent.parent / "webapp" / "dist"
 
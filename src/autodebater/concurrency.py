@@ -0,0 +1,122 @@
+"""
+Concurrency helpers shared by the API and the debate engine.
+
+Blocking work (SQLite queries, profile file reads and writes) is pushed onto a
+dedicated, bounded I/O thread pool so that ``async def`` handlers never stall
+the event loop — and with it every live SSE stream in the process.
+
+CancellationToken carries cooperative cancellation (and an optional
+wall-clock deadline) into a running debate; SingleFlight coalesces
+concurrent identical calls into one.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable, Optional
+
+from autodebater.errors import DebateCancelled
+
+IO_WORKERS = int(os.environ.get("AUTODEBATER_IO_WORKERS", "8"))
+
+_io_executor: ThreadPoolExecutor | None = None
+_io_lock = threading.Lock()
+
+
+def io_executor() -> ThreadPoolExecutor:
+    """Return the process-wide I/O executor, creating it on first use."""
+    global _io_executor  # pylint: disable=global-statement
+    if _io_executor is None:
+        with _io_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=IO_WORKERS, thread_name_prefix="autodebater-io"
+                )
+    return _io_executor
+
+
+async def run_io(func, *args, **kwargs):
+    """Run a blocking callable on the I/O executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation for one debate.
+
+    The debate calls check() between turns (and participants between tool
+    iterations); it raises DebateCancelled once cancel() has been called, the
+    deadline has passed, or the optional watchdog returns a reason.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+        self.deadline: Optional[float] = None  # time.monotonic() value
+        self.watchdog: Optional[Callable[[], Optional[str]]] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def set_deadline(self, seconds: Optional[float]) -> None:
+        """Arm a wall-clock deadline *seconds* from now (None disarms it)."""
+        self.deadline = time.monotonic() + seconds if seconds else None
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set():
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.cancel("deadline exceeded")
+            elif self.watchdog is not None:
+                reason = self.watchdog()
+                if reason:
+                    self.cancel(reason)
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self.cancelled:
+            raise DebateCancelled(self.reason)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key: the first caller runs the
+    function, callers arriving while it is in flight wait for and share its
+    result (or exception). Nothing is cached once the call has finished.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
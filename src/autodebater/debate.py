@@ -8,34 +8,264 @@ for a debate
 
 import logging
 import re
+import threading
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Generator
+from typing import Any, Callable, Generator, List, Optional
 
-from autodebater.dialogue import DialogueHistory, DialogueMessage
-from autodebater.errors import JudgementParseError
+from autodebater.concurrency import CancellationToken
+from autodebater.dialogue import DialogueHistory, DialogueMessage, TurnMetrics
+from autodebater.errors import CheckpointError, JudgementParseError
+from autodebater.hooks import (DEBATE_END, DEBATE_START, JUDGE_RETRY, SCORE_UPDATE,
+                               TURN_END, TURN_START, HookRegistry, global_hooks)
 from autodebater.participants import Debater, Judge, Moderator, PanelParticipant
-from autodebater.scoring import geometric_mean
+from autodebater.scoring import JudgingCadence, geometric_mean
+from autodebater.stopping import StoppingPolicy
 
 logger = logging.getLogger(__name__)
 
 
+def _prepare_quietly(participant):
+    try:
+        participant.prepare()
+    except Exception:  # pylint: disable=broad-except
+        # The participant retries on its first reply, where the error surfaces normally
+        logger.warning("Warm-up failed for %s", participant.name, exc_info=True)
+
+
+def _metrics_of(participant) -> Optional[TurnMetrics]:
+    """The latency/usage/cost of *participant*'s latest turn, if it recorded any."""
+    metrics = getattr(participant, "last_metrics", None)
+    return metrics if isinstance(metrics, TurnMetrics) else None
+
+
 class Debate(ABC):
     """
     Core Debate function, handles the logic to pass
     messages dependening on the debate type.
+
+    All loop state (turn, epoch, the message the next speaker answers) lives on
+    the instance, so a debate can be checkpointed after every completed turn
+    and resumed from that checkpoint with resume().
+
+    Lifecycle events for the debate and everyone in it go out on self.hooks;
+    iterate run() rather than debate() to also get debate_start/debate_end.
     """
 
-    def __init__(self, motion: str, epochs: int = 10):
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self, motion: str, epochs: int = 10, debate_id: Optional[str] = None):
         self.debaters = []
         self.motion = motion
-        self.debate_id = str(uuid.uuid4())
+        self.debate_id = debate_id or str(uuid.uuid4())
         self.dialogue_history = DialogueHistory()
         self.epochs = epochs
+        self.next_seq = 0
+        self.cancel_token = CancellationToken()
+        self.turn = 0  # completed speaker turns
+        self.epoch = 0  # completed epochs (moderated debates)
+        # what the next speaker answers
+        self.prompt_msg: Optional[DialogueMessage] = None
+        self.on_checkpoint: Optional[Callable[[dict], None]] = None
+        self.stopping_policies: List[StoppingPolicy] = []
+        self.score_trace: List[float] = []  # running score after each turn
+        self.stop_reason: Optional[str] = None
+        self.hooks = HookRegistry(parent=global_hooks, owner=self)
+
+    def _join(self, participant) -> None:
+        """Share cancellation and route the participant's hook events through here."""
+        participant.cancel_token = self.cancel_token
+        hooks = getattr(participant, "hooks", None)
+        if isinstance(hooks, HookRegistry):
+            hooks.parent = self.hooks
 
     def add_debaters(self, debater: Debater):
+        self._join(debater)
         self.debaters.append(debater)
 
+    def cancel(self, reason: str = "cancelled"):
+        """Request cooperative cancellation.
+
+        The debate stops at its next turn boundary.
+        """
+        self.cancel_token.cancel(reason)
+
+    def _participants(self) -> list:
+        members = []
+        for group in self._participant_groups().values():
+            if isinstance(group, list):
+                members.extend(group)
+            elif group is not None:
+                members.append(group)
+        return members
+
+    def _warm_up(self) -> list:
+        """
+        Start prepare() for every participant that still needs it (e.g. judges
+        discovering their expertise) on background threads, so that work overlaps
+        the opening statement and the first turn instead of sitting on the
+        critical path. A participant that needs its preparation before replying
+        waits for it (see DynamicExpertJudge.prepare).
+        """
+        threads = []
+        for participant in self._participants():
+            if not participant.prepared:
+                thread = threading.Thread(
+                    target=_prepare_quietly, args=(participant,),
+                    name=f"warm-up-{participant.name}", daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+        return threads
+
+    def add_stopping_policy(self, policy: StoppingPolicy):
+        self.stopping_policies.append(policy)
+
+    def _raw_scores(self) -> list:
+        return []
+
+    def _check_stopping(self, running_score: float) -> Optional[str]:
+        """
+        Record this turn's running score and ask each stopping policy whether
+        to end early. Policies are only consulted once every debater has spoken.
+        """
+        self.score_trace.append(running_score)
+        if self.turn < len(self.debaters):
+            return None
+        for policy in self.stopping_policies:
+            reason = policy.check(self.score_trace, self._raw_scores())
+            if reason:
+                return reason
+        return None
+
+    def _stop_message(self, reason: str) -> DialogueMessage:
+        """Transcript record of an early stop, spoken by the moderator."""
+        moderator = getattr(self, "moderator", None)
+        return DialogueMessage(
+            name=moderator.name if moderator is not None else "mod",
+            role="moderator",
+            message=f"Ending after {self.turn} turns: {reason}.",
+            debate_id=self.debate_id,
+        )
+
+    def _emit(self, msg: DialogueMessage, record: bool = True) -> DialogueMessage:
+        """
+        Stamp a message with the next sequence number before it is yielded.
+        Sequence numbers are stable ids for resuming streams; messages that are
+        only shown live (e.g. running-score updates) pass record=False and are
+        kept out of the dialogue history.
+        """
+        msg.seq = self.next_seq
+        self.next_seq += 1
+        if record:
+            self.dialogue_history.add_message(msg)
+        return msg
+
+    def _participant_groups(self) -> dict:
+        return {"debaters": self.debaters}
+
+    def _score_state(self) -> dict:
+        return {}
+
+    def _load_score_state(self, state: dict) -> None:
+        pass
+
+    def checkpoint(self) -> dict:
+        """Full, JSON-serialisable state of the debate and all of its participants."""
+        participants = {}
+        for group, members in self._participant_groups().items():
+            if isinstance(members, list):
+                participants[group] = [p.state() for p in members]
+            else:
+                participants[group] = members.state() if members is not None else None
+        return {
+            "version": self.CHECKPOINT_VERSION,
+            "kind": type(self).__name__,
+            "debate_id": self.debate_id,
+            "motion": self.motion,
+            "epochs": self.epochs,
+            "turn": self.turn,
+            "epoch": self.epoch,
+            "next_seq": self.next_seq,
+            "prompt_seq": self.prompt_msg.seq if self.prompt_msg is not None else None,
+            "history": [m.to_dict() for m in self.dialogue_history.messages],
+            "scores": self._score_state(),
+            "score_trace": self.score_trace,
+            "stop_reason": self.stop_reason,
+            "participants": participants,
+        }
+
+    def resume(self, checkpoint: dict) -> "Debate":
+        """
+        Restore the state captured by checkpoint(). Participants must already be
+        attached in the same order as when the checkpoint was taken (e.g. by
+        rebuilding the runner from the same config); iterating debate() then
+        continues after the last completed turn without repeating any call.
+        """
+        if checkpoint.get("kind") != type(self).__name__:
+            raise CheckpointError(
+                f"Checkpoint is for a {checkpoint.get('kind')}, "
+                f"not a {type(self).__name__}"
+            )
+        if checkpoint.get("version") != self.CHECKPOINT_VERSION:
+            raise CheckpointError(
+                f"Unsupported checkpoint version {checkpoint.get('version')}"
+            )
+        for group, members in self._participant_groups().items():
+            saved = checkpoint["participants"].get(group)
+            if isinstance(members, list):
+                if len(saved or []) != len(members):
+                    raise CheckpointError(
+                        f"Checkpoint has {len(saved or [])} {group}, "
+                        f"debate has {len(members)}"
+                    )
+                for participant, state in zip(members, saved):
+                    participant.load_state(state)
+            elif members is not None and saved is not None:
+                members.load_state(saved)
+
+        self.debate_id = checkpoint["debate_id"]
+        self.motion = checkpoint["motion"]
+        self.epochs = checkpoint["epochs"]
+        self.turn = checkpoint["turn"]
+        self.epoch = checkpoint["epoch"]
+        self.next_seq = checkpoint["next_seq"]
+        self.dialogue_history = DialogueHistory()
+        for data in checkpoint["history"]:
+            self.dialogue_history.add_message(DialogueMessage.from_dict(data))
+        self.prompt_msg = next(
+            (
+                m
+                for m in self.dialogue_history.messages
+                if m.seq == checkpoint["prompt_seq"]
+            ),
+            None,
+        )
+        self._load_score_state(checkpoint["scores"])
+        self.score_trace = list(checkpoint.get("score_trace", []))
+        self.stop_reason = checkpoint.get("stop_reason")
+        return self
+
+    def _checkpoint(self) -> None:
+        """Hand a checkpoint to on_checkpoint, if set, after every completed turn."""
+        if self.on_checkpoint is not None:
+            self.on_checkpoint(self.checkpoint())
+
+    def _take_turn(self, speaker) -> str:
+        """The speaker's reply to the prompt, announced as turn_start/turn_end."""
+        with self.hooks.timed(TURN_START, TURN_END, turn=self.turn,
+                              participant=speaker.name, role=speaker.role) as info:
+            response = speaker.respond([self.prompt_msg])
+            info["metrics"] = _metrics_of(speaker)
+        return response
+
+    def run(self) -> Generator[DialogueMessage, Any, None]:
+        """Iterate debate(), emitting debate_start and debate_end around it."""
+        with self.hooks.timed(DEBATE_START, DEBATE_END, kind=type(self).__name__,
+                              motion=self.motion, from_turn=self.turn) as info:
+            yield from self.debate()
+            info.update(turns=self.turn, stop_reason=self.stop_reason)
+
     @abstractmethod
     def debate(self) -> Generator[DialogueMessage, Any, None]:
         pass
@@ -50,19 +280,25 @@ class SimpleDebate(Debate):
     def debate(self):
         steps = self.epochs * len(self.debaters)
 
-        msg = DialogueMessage("mod", "moderator", "Please begin", self.debate_id)
-        yield msg
-        self.dialogue_history.add_message(msg)
-        i = 0
-        while i < steps:
-            speaker = self.debaters[i % len(self.debaters)]
-            response = speaker.respond([msg])
-            msg = DialogueMessage(
-                speaker.name, speaker.role, response, self.debate_id, speaker.stance
+        if self.prompt_msg is None:
+            msg = self._emit(
+                DialogueMessage("mod", "moderator", "Please begin", self.debate_id)
             )
-            self.dialogue_history.add_message(msg)
+            self.prompt_msg = msg
+            self._checkpoint()
+            yield msg
+        while self.turn < steps:
+            self.cancel_token.check()
+            speaker = self.debaters[self.turn % len(self.debaters)]
+            response = self._take_turn(speaker)
+            msg = self._emit(DialogueMessage(
+                speaker.name, speaker.role, response, self.debate_id, speaker.stance,
+                metrics=_metrics_of(speaker),
+            ))
+            self.turn += 1
+            self.prompt_msg = msg
+            self._checkpoint()
             yield msg
-            i += 1
 
 
 class JudgedDebate(Debate):
@@ -72,19 +308,86 @@ class JudgedDebate(Debate):
     debate they're leaning towards.
     """
 
-    def __init__(self, motion: str, epochs: int = 10):
+    def __init__(self, motion: str, epochs: int = 10, debate_id: Optional[str] = None,
+                 judging: str = "message"):
         self.judges = []
         self.moderator: Moderator = None
         self.running_score = 50
         self.scores = []
-        super().__init__(motion, epochs)
+        self.judging = JudgingCadence(judging)
+        super().__init__(motion, epochs, debate_id)
 
     def add_judge(self, judge: Judge):
+        self._join(judge)
         self.judges.append(judge)
 
     def add_moderator(self, moderator: Moderator):
+        self._join(moderator)
         self.moderator = moderator
 
+    def _participant_groups(self) -> dict:
+        return {
+            "debaters": self.debaters,
+            "judges": self.judges,
+            "moderator": self.moderator,
+        }
+
+    def _score_state(self) -> dict:
+        return {"scores": self.scores, "running_score": self.running_score}
+
+    def _load_score_state(self, state: dict) -> None:
+        self.scores = list(state["scores"])
+        self.running_score = state["running_score"]
+
+    def _raw_scores(self) -> list:
+        return self.scores
+
+    def _judge_message(self, msg: DialogueMessage):
+        """Have every judge score *msg* (and anything observed since its last score)."""
+        for judge in self.judges:
+            judgement = judge.respond([msg])
+            judge_msg = DialogueMessage(
+                judge.name,
+                judge.role,
+                judgement,
+                self.debate_id,
+                metrics=_metrics_of(judge),
+            )
+
+            try:
+                score, _ = self.parse_judgement(judgement)
+                judge_msg.judgement = score
+                self.scores.append(score)
+            except JudgementParseError:
+                logger.warning(
+                    "Judge %s returned malformed output; retrying once.", judge.name
+                )
+                self.hooks.emit(JUDGE_RETRY, participant=judge.name, turn=self.turn)
+                correction = DialogueMessage(
+                    "mod",
+                    "moderator",
+                    "Your response must start with a number 0-100 followed by a "
+                    "space and your justification.",
+                    self.debate_id,
+                )
+                judgement = judge.respond([correction])
+                judge_msg.message = judgement
+                retry_metrics = _metrics_of(judge)
+                if judge_msg.metrics and retry_metrics:
+                    judge_msg.metrics = judge_msg.metrics.merge(retry_metrics)
+                try:
+                    score, _ = self.parse_judgement(judgement)
+                    judge_msg.judgement = score
+                    self.scores.append(score)
+                except JudgementParseError as e:
+                    logger.exception(e)
+                    raise
+
+            self.running_score = geometric_mean(self.scores)
+            self.hooks.emit(SCORE_UPDATE, participant=judge.name, turn=self.turn,
+                            score=judge_msg.judgement, running_score=self.running_score)
+            yield self._emit(judge_msg)
+
     def parse_judgement(self, judgement):
         match = re.match(r"^(\d+(?:\.\d+)?)\s+(.+)$", judgement.strip(), re.DOTALL)
         if not match:
@@ -101,107 +404,98 @@ class JudgedDebate(Debate):
 
     def debate(self):
         steps = self.epochs * len(self.debaters)
+        self._warm_up()
+
+        if self.prompt_msg is None:
+            metrics = None
+            if self.moderator is not None:
+                opening_text = self.moderator.opening_statement()
+                mod_name = self.moderator.name
+                metrics = _metrics_of(self.moderator)
+            else:
+                first_debater_name = self.debaters[0].name
+                opening_text = f"{first_debater_name} - please begin"
+                mod_name = "mod"
+
+            msg = self._emit(DialogueMessage(
+                name=mod_name,
+                role="moderator",
+                message=opening_text,
+                debate_id=self.debate_id,
+                metrics=metrics,
+            ))
+            self.prompt_msg = msg
+            self._checkpoint()
+            yield msg
 
-        i = 0
-        if self.moderator is not None:
-            opening_text = self.moderator.opening_statement()
-            mod_name = self.moderator.name
-        else:
-            first_debater_name = self.debaters[i].name
-            opening_text = f"{first_debater_name} - please begin"
-            mod_name = "mod"
-
-        msg = DialogueMessage(
-            name=mod_name,
-            role="moderator",
-            message=opening_text,
-            debate_id=self.debate_id,
-        )
-        self.dialogue_history.add_message(msg)
-        yield msg
-
-        epoch = 0
-        while i < steps:
-            speaker = self.debaters[i % len(self.debaters)]
-            response = speaker.respond([msg])
+        while self.turn < steps and self.stop_reason is None:
+            self.cancel_token.check()
+            speaker = self.debaters[self.turn % len(self.debaters)]
+            response = self._take_turn(speaker)
             msg = DialogueMessage(
                 name=speaker.name,
                 role=speaker.role,
                 message=response,
                 debate_id=self.debate_id,
                 stance=speaker.stance,
+                metrics=_metrics_of(speaker),
             )
-            self.dialogue_history.add_message(msg)
-            yield msg
-
-            for judge in self.judges:
-                judgement = judge.respond([msg])
-                judge_msg = DialogueMessage(
-                    judge.name, judge.role, judgement, self.debate_id
+            yield self._emit(msg)
+
+            judged = self.judging.due(self.turn + 1, steps, len(self.debaters))
+            if judged:
+                yield from self._judge_message(msg)
+                moderator_message = DialogueMessage(
+                    "mod",
+                    "moderator",
+                    f"Current Score is {self.running_score}",
+                    self.debate_id,
                 )
-
-                try:
-                    score, _ = self.parse_judgement(judgement)
-                    judge_msg.judgement = score
-                    self.scores.append(score)
-                except JudgementParseError:
-                    logger.warning(
-                        "Judge %s returned malformed output; retrying once.", judge.name
-                    )
-                    correction = DialogueMessage(
-                        "mod",
-                        "moderator",
-                        "Your response must start with a number 0-100 followed by a space and your justification.",
-                        self.debate_id,
-                    )
-                    judgement = judge.respond([correction])
-                    judge_msg.message = judgement
-                    try:
-                        score, _ = self.parse_judgement(judgement)
-                        judge_msg.judgement = score
-                        self.scores.append(score)
-                    except JudgementParseError as e:
-                        logger.exception(e)
-                        raise
-
-                self.dialogue_history.add_message(judge_msg)
-                self.running_score = geometric_mean(self.scores)
-                yield judge_msg
-
-            moderator_message = DialogueMessage(
-                "mod",
-                "moderator",
-                f"Current Score is {self.running_score}",
-                self.debate_id,
-            )
-            yield moderator_message
-            i += 1
+                yield self._emit(moderator_message, record=False)
+            else:
+                for judge in self.judges:
+                    judge.observe([msg])
+            self.turn += 1
+
+            reason = None
+            if self.judges and judged:
+                reason = self._check_stopping(self.running_score)
+            if reason:
+                self.stop_reason = reason
+                stop_msg = self._emit(self._stop_message(reason))
+                self._checkpoint()
+                yield stop_msg
+                break
 
             # After each full epoch (all debaters have spoken), yield moderator question
-            if self.moderator is not None and (i % len(self.debaters) == 0):
-                epoch += 1
-                if epoch < self.epochs:
+            pending = []
+            if self.moderator is not None and (self.turn % len(self.debaters) == 0):
+                self.epoch += 1
+                if self.epoch < self.epochs:
                     question_text = self.moderator.generate_question(self.dialogue_history)
-                    q_msg = DialogueMessage(
+                    msg = self._emit(DialogueMessage(
                         name=self.moderator.name,
                         role="moderator",
                         message=question_text,
                         debate_id=self.debate_id,
-                    )
-                    self.dialogue_history.add_message(q_msg)
-                    msg = q_msg
-                    yield q_msg
+                        metrics=_metrics_of(self.moderator),
+                    ))
+                    pending.append(msg)
+            self.prompt_msg = msg
+            self._checkpoint()
+            yield from pending
 
         if self.moderator is not None:
+            self.cancel_token.check()
             closing_text = self.moderator.closing_statement(self.dialogue_history)
             closing_msg = DialogueMessage(
                 name=self.moderator.name,
                 role="moderator",
                 message=closing_text,
                 debate_id=self.debate_id,
+                metrics=_metrics_of(self.moderator),
             )
-            self.dialogue_history.add_message(closing_msg)
-            yield closing_msg
+            yield self._emit(closing_msg)
 
 
 class ExpertPanelDebate(Debate):
@@ -211,19 +505,73 @@ class ExpertPanelDebate(Debate):
     contribution. Requires a Moderator to open, probe, and synthesise.
     """
 
-    def __init__(self, motion: str, epochs: int = 3):
+    def __init__(self, motion: str, epochs: int = 3, debate_id: Optional[str] = None,
+                 judging: str = "message"):
         self.judges = []
         self.moderator: Moderator = None
         self.convergence_scores = []
         self.convergence_score = 0.0
-        super().__init__(motion, epochs)
+        self.judging = JudgingCadence(judging)
+        super().__init__(motion, epochs, debate_id)
 
     def add_judge(self, judge: Judge):
+        self._join(judge)
         self.judges.append(judge)
 
     def add_moderator(self, moderator: Moderator):
+        self._join(moderator)
         self.moderator = moderator
 
+    def _participant_groups(self) -> dict:
+        return {
+            "debaters": self.debaters,
+            "judges": self.judges,
+            "moderator": self.moderator,
+        }
+
+    def _score_state(self) -> dict:
+        return {"convergence_scores": self.convergence_scores,
+                "convergence_score": self.convergence_score}
+
+    def _load_score_state(self, state: dict) -> None:
+        self.convergence_scores = list(state["convergence_scores"])
+        self.convergence_score = state["convergence_score"]
+
+    def _raw_scores(self) -> list:
+        return self.convergence_scores
+
+    def _judge_message(self, msg: DialogueMessage):
+        """Have every judge score the panel's convergence after *msg*."""
+        for judge in self.judges:
+            judgement = judge.respond([msg])
+            metrics = _metrics_of(judge)
+            try:
+                score, _ = self.parse_convergence(judgement)
+            except JudgementParseError:
+                logger.warning("Panel judge returned malformed output; retrying.")
+                self.hooks.emit(JUDGE_RETRY, participant=judge.name, turn=self.turn)
+                correction = DialogueMessage(
+                    "mod", "moderator",
+                    "Your response must start with a number 0-100 followed by a "
+                    "space and your assessment.",
+                    self.debate_id,
+                )
+                judgement = judge.respond([correction])
+                retry_metrics = _metrics_of(judge)
+                if metrics and retry_metrics:
+                    metrics = metrics.merge(retry_metrics)
+                score, _ = self.parse_convergence(judgement)
+
+            judge_msg = DialogueMessage(
+                judge.name, judge.role, judgement, self.debate_id, metrics=metrics
+            )
+            judge_msg.judgement = score
+            self.convergence_scores.append(score)
+            self.convergence_score = geometric_mean(self.convergence_scores)
+            self.hooks.emit(SCORE_UPDATE, participant=judge.name, turn=self.turn,
+                            score=score, running_score=self.convergence_score)
+            yield self._emit(judge_msg)
+
     def parse_convergence(self, response: str):
         """Parse a convergence score + assessment from a judge response."""
         match = re.match(r"^(\d+(?:\.\d+)?)\s+(.+)$", response.strip(), re.DOTALL)
@@ -238,74 +586,83 @@ class ExpertPanelDebate(Debate):
 
     def debate(self):
         steps = self.epochs * len(self.debaters)
+        self._warm_up()
 
         # Opening
-        if self.moderator:
-            opening = self.moderator.opening_statement()
-            mod_name = self.moderator.name
-        else:
-            opening = f"Panel discussion on: {self.motion}. Please begin."
-            mod_name = "mod"
-
-        msg = DialogueMessage(name=mod_name, role="moderator",
-                              message=opening, debate_id=self.debate_id)
-        self.dialogue_history.add_message(msg)
-        yield msg
-
-        epoch = 0
-        i = 0
-        while i < steps:
-            panelist = self.debaters[i % len(self.debaters)]
-            response = panelist.respond([msg])
+        if self.prompt_msg is None:
+            metrics = None
+            if self.moderator:
+                opening = self.moderator.opening_statement()
+                mod_name = self.moderator.name
+                metrics = _metrics_of(self.moderator)
+            else:
+                opening = f"Panel discussion on: {self.motion}. Please begin."
+                mod_name = "mod"
+
+            msg = self._emit(DialogueMessage(name=mod_name, role="moderator",
+                                             message=opening, debate_id=self.debate_id,
+                                             metrics=metrics))
+            self.prompt_msg = msg
+            self._checkpoint()
+            yield msg
+
+        while self.turn < steps and self.stop_reason is None:
+            self.cancel_token.check()
+            panelist = self.debaters[self.turn % len(self.debaters)]
+            response = self._take_turn(panelist)
             msg = DialogueMessage(
                 name=panelist.name, role=panelist.role,
                 message=response, debate_id=self.debate_id,
+                metrics=_metrics_of(panelist),
             )
-            self.dialogue_history.add_message(msg)
-            yield msg
-
-            for judge in self.judges:
-                judgement = judge.respond([msg])
-                try:
-                    score, _ = self.parse_convergence(judgement)
-                except JudgementParseError:
-                    logger.warning("Panel judge returned malformed output; retrying.")
-                    correction = DialogueMessage(
-                        "mod", "moderator",
-                        "Your response must start with a number 0-100 followed by a space and your assessment.",
-                        self.debate_id,
-                    )
-                    judgement = judge.respond([correction])
-                    score, _ = self.parse_convergence(judgement)
-
-                judge_msg = DialogueMessage(judge.name, judge.role, judgement, self.debate_id)
-                judge_msg.judgement = score
-                self.convergence_scores.append(score)
-                self.convergence_score = geometric_mean(self.convergence_scores)
-                self.dialogue_history.add_message(judge_msg)
-                yield judge_msg
-
-            score_msg = DialogueMessage(
-                "mod", "moderator",
-                f"Convergence: {self.convergence_score:.1f}/100",
-                self.debate_id,
-            )
-            yield score_msg
-            i += 1
-
-            if self.moderator and (i % len(self.debaters) == 0):
-                epoch += 1
-                if epoch < self.epochs:
+            yield self._emit(msg)
+
+            judged = self.judging.due(self.turn + 1, steps, len(self.debaters))
+            if judged:
+                yield from self._judge_message(msg)
+                score_msg = DialogueMessage(
+                    "mod", "moderator",
+                    f"Convergence: {self.convergence_score:.1f}/100",
+                    self.debate_id,
+                )
+                yield self._emit(score_msg, record=False)
+            else:
+                for judge in self.judges:
+                    judge.observe([msg])
+            self.turn += 1
+
+            reason = (self._check_stopping(self.convergence_score)
+                      if self.judges and judged else None)
+            if reason:
+                self.stop_reason = reason
+                stop_msg = self._emit(self._stop_message(reason))
+                self._checkpoint()
+                yield stop_msg
+                break
+
+            pending = []
+            if self.moderator and (self.turn % len(self.debaters) == 0):
+                self.epoch += 1
+                if self.epoch < self.epochs:
                     question = self.moderator.generate_question(self.dialogue_history)
-                    q_msg = DialogueMessage(self.moderator.name, "moderator",
-                                            question, self.debate_id)
-                    self.dialogue_history.add_message(q_msg)
-                    msg = q_msg
-                    yield q_msg
+                    msg = self._emit(
+                        DialogueMessage(
+                            self.moderator.name,
+                            "moderator",
+                            question,
+                            self.debate_id,
+                            metrics=_metrics_of(self.moderator),
+                        )
+                    )
+                    pending.append(msg)
+            self.prompt_msg = msg
+            self._checkpoint()
+            yield from pending
 
         if self.moderator:
+            self.cancel_token.check()
             closing = self.moderator.closing_statement(self.dialogue_history)
             closing_msg = DialogueMessage(self.moderator.name, "moderator",
-                                          closing, self.debate_id)
-            self.dialogue_history.add_message(closing_msg)
-            yield closing_msg
+                                          closing, self.debate_id,
+                                          metrics=_metrics_of(self.moderator))
+            yield self._emit(closing_msg)
@@ -3,7 +3,7 @@ Module wraps the debate execution into a class
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass
 from typing import Any, Generator, List, Optional
 
 from autodebater.debate import ExpertPanelDebate, JudgedDebate, SimpleDebate
@@ -11,9 +11,11 @@ from autodebater.defaults import (PANEL_JUDGE_PROMPT, PANEL_MODERATOR_SYSTEM_PRO
                                    PANEL_MODERATOR_OPENING_PROMPT, PANEL_MODERATOR_QUESTION_PROMPT,
                                    PANEL_MODERATOR_CLOSING_PROMPT)
 from autodebater.dialogue import DialogueMessage
+from autodebater.expertise_cache import shared_expertise_cache
 from autodebater.names import generate_name
 from autodebater.participants import (BullshitDetector, Debater, DynamicExpertJudge,
                                       Judge, Moderator, PanelParticipant, ToolEnabledDebater)
+from autodebater.stopping import from_spec
 
 
 @dataclass
@@ -29,6 +31,15 @@ class RunnerConfig:
     use_tools: bool = False
     domains: Optional[List[str]] = None  # expert panel only
     context: Optional[str] = None        # injected into every participant's system prompt
+    # wall-clock budget, armed when the debate starts
+    deadline_seconds: Optional[float] = None
+    # fixed id (e.g. a queued job's); generated when unset
+    debate_id: Optional[str] = None
+    # early-termination policy specs (see stopping.from_spec)
+    stopping: Optional[List[dict]] = None
+    judging: str = "message"  # judging cadence: message | epoch | every:k | end
+    # reuse judge expertise discovered for the same motion/model
+    expertise_cache: bool = True
 
     def model_params(self) -> dict:
         params = {}
@@ -49,14 +60,48 @@ DEFAULT_PANEL_DOMAINS = [
 
 class DebateRunner(ABC):
 
+    mode: str  # "judged" | "simple" | "panel", as stored with saved debates
+    config: RunnerConfig
+    debate: Any
+
     @abstractmethod
     def run_debate(self) -> Generator[DialogueMessage, Any, None]:
         pass
 
+    def _add_stopping_policies(self):
+        for spec in self.config.stopping or []:
+            self.debate.add_stopping_policy(from_spec(spec))
+
+    def _start(self):
+        """Arm the per-debate deadline, if any, as the debate begins."""
+        if self.config.deadline_seconds:
+            self.debate.cancel_token.set_deadline(self.config.deadline_seconds)
+
+    def cancel(self, reason: str = "cancelled"):
+        self.debate.cancel(reason)
+
+    def checkpoint_to(self, store) -> None:
+        """Checkpoint the debate and this runner's config to *store* each turn."""
+        config = asdict(self.config)
+
+        def save(state: dict):
+            store.save_checkpoint(
+                self.debate.debate_id, state, mode=self.mode, config=config
+            )
+
+        self.debate.on_checkpoint = save
+
+    def resume(self, checkpoint: dict) -> "DebateRunner":
+        """Continue from *checkpoint* (see Debate.resume) on the next run_debate()."""
+        self.debate.resume(checkpoint)
+        return self
+
 
 class BasicJudgedDebateRunner(DebateRunner):
     """Execute a basic debate with two debaters and two judges."""
 
+    mode = "judged"
+
     def __init__(self, motion: str, epochs: int = 2, llm: str = "openai", **kwargs):
         config = RunnerConfig(
             motion=motion,
@@ -68,6 +113,10 @@ class BasicJudgedDebateRunner(DebateRunner):
             temperature=kwargs.get("temperature"),
             use_tools=kwargs.get("use_tools", False),
             context=kwargs.get("context"),
+            deadline_seconds=kwargs.get("deadline_seconds"),
+            stopping=kwargs.get("stopping"),
+            judging=kwargs.get("judging", "message"),
+            expertise_cache=kwargs.get("expertise_cache", True),
         )
         self._build(config)
 
@@ -78,7 +127,9 @@ class BasicJudgedDebateRunner(DebateRunner):
         return instance
 
     def _build(self, config: RunnerConfig):
-        self.debate = JudgedDebate(motion=config.motion, epochs=config.epochs)
+        self.config = config
+        self.debate = JudgedDebate(motion=config.motion, epochs=config.epochs,
+                                   debate_id=config.debate_id, judging=config.judging)
         mp = config.model_params()
         ctx = config.context
 
@@ -102,6 +153,8 @@ class BasicJudgedDebateRunner(DebateRunner):
         if config.judge_prompt:
             bd_kw["instruction_prompt"] = config.judge_prompt
         j_kw.update(mp); bd_kw.update(mp)
+        if config.expertise_cache:
+            j_kw["expertise_cache"] = shared_expertise_cache()
 
         DebaterClass = ToolEnabledDebater if config.use_tools else Debater
         self.debate.add_debaters(DebaterClass(**d1_kw))
@@ -112,9 +165,11 @@ class BasicJudgedDebateRunner(DebateRunner):
         mod_name = generate_name(used_names)
         self.debate.add_moderator(Moderator(name=mod_name, motion=config.motion,
                                             llm_provider=config.llm, **mp))
+        self._add_stopping_policies()
 
     def run_debate(self):
-        for msg in self.debate.debate():
+        self._start()
+        for msg in self.debate.run():
             yield msg
 
     def get_judgements(self):
@@ -129,6 +184,8 @@ class BasicJudgedDebateRunner(DebateRunner):
 class BasicSimpleDebateRunner(DebateRunner):
     """Execute a basic debate with two debaters, no judges."""
 
+    mode = "simple"
+
     def __init__(self, motion: str, epochs: int = 2, llm: str = "openai", **kwargs):
         config = RunnerConfig(
             motion=motion,
@@ -139,6 +196,7 @@ class BasicSimpleDebateRunner(DebateRunner):
             temperature=kwargs.get("temperature"),
             use_tools=kwargs.get("use_tools", False),
             context=kwargs.get("context"),
+            deadline_seconds=kwargs.get("deadline_seconds"),
         )
         self._build(config)
 
@@ -149,7 +207,9 @@ class BasicSimpleDebateRunner(DebateRunner):
         return instance
 
     def _build(self, config: RunnerConfig):
-        self.debate = SimpleDebate(motion=config.motion, epochs=config.epochs)
+        self.config = config
+        self.debate = SimpleDebate(motion=config.motion, epochs=config.epochs,
+                                   debate_id=config.debate_id)
         mp = config.model_params()
         ctx = config.context
 
@@ -171,16 +231,25 @@ class BasicSimpleDebateRunner(DebateRunner):
         self.debate.add_debaters(DebaterClass(**d2_kw))
 
     def run_debate(self):
-        for msg in self.debate.debate():
+        self._start()
+        for msg in self.debate.run():
             yield msg
 
 
 class ExpertPanelRunner(DebateRunner):
     """Expert panel discussion — no stances, goal is convergence toward a nuanced answer."""
 
+    mode = "panel"
+
     def __init__(self, config: RunnerConfig, domains: Optional[List[str]] = None):
+        self.config = config
         domains = domains or config.domains or DEFAULT_PANEL_DOMAINS
-        self.debate = ExpertPanelDebate(motion=config.motion, epochs=config.epochs)
+        self.debate = ExpertPanelDebate(
+            motion=config.motion,
+            epochs=config.epochs,
+            debate_id=config.debate_id,
+            judging=config.judging,
+        )
         mp = config.model_params()
         ctx = config.context
 
@@ -215,7 +284,21 @@ class ExpertPanelRunner(DebateRunner):
                 **mp,
             )
         )
+        self._add_stopping_policies()
 
     def run_debate(self):
-        for msg in self.debate.debate():
+        self._start()
+        for msg in self.debate.run():
             yield msg
+
+
+RUNNER_MODES = ("judged", "simple", "panel")
+
+
+def runner_for(mode: str, config: RunnerConfig) -> DebateRunner:
+    """Build the runner for a debate *mode*; unknown modes get a judged debate."""
+    if mode == "panel":
+        return ExpertPanelRunner(config)
+    if mode == "simple":
+        return BasicSimpleDebateRunner.from_config(config)
+    return BasicJudgedDebateRunner.from_config(config)
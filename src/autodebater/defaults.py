@@ -18,6 +18,7 @@ LLM_PROVIDER = defaults["llm_provider"]
 OPENAI_MODEL_PARAMS = defaults["openai_model_params"]
 AZURE_OPENAI_MODEL_PARAMS = defaults["azure_openai_model_params"]
 ANTHROPIC_MODEL_PARAMS = defaults["anthropic_model_params"]
+MODEL_PRICES = defaults.get("model_prices", {})
 SYSTEM_PROMPTS = defaults["system_prompts"]
 
 # Optional: Define specific prompts for convenience
@@ -7,9 +7,60 @@ passed back and forth between Participants
 A DialogueMessage is the message format for what is being passed arround
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class TurnMetrics:
+    """
+    Cost of producing one message: wall time, time to first token (streaming
+    only), token usage summed over every LLM call the turn made, tool-loop
+    iterations and the estimated price in USD (None for unpriced models).
+    """
+
+    latency_ms: float = 0.0
+    ttft_ms: Optional[float] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    llm_calls: int = 0
+    tool_iterations: int = 0
+    cost_usd: Optional[float] = None
+
+    def add_call(self, call: dict) -> None:
+        """Fold in one LLM call's usage, as reported by LLMWrapper.last_call."""
+        self.llm_calls += 1
+        self.input_tokens += call.get("input_tokens") or 0
+        self.output_tokens += call.get("output_tokens") or 0
+        self.cached_tokens += call.get("cached_tokens") or 0
+        if self.ttft_ms is None and call.get("ttft_ms") is not None:
+            self.ttft_ms = call["ttft_ms"]
+
+    def merge(self, other: "TurnMetrics") -> "TurnMetrics":
+        """Combined metrics of two attempts at the same message (e.g. a judge retry)."""
+        costs = [c for c in (self.cost_usd, other.cost_usd) if c is not None]
+        return TurnMetrics(
+            latency_ms=self.latency_ms + other.latency_ms,
+            ttft_ms=self.ttft_ms if self.ttft_ms is not None else other.ttft_ms,
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cached_tokens=self.cached_tokens + other.cached_tokens,
+            llm_calls=self.llm_calls + other.llm_calls,
+            tool_iterations=self.tool_iterations + other.tool_iterations,
+            cost_usd=sum(costs) if costs else None,
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> Optional["TurnMetrics"]:
+        if not data:
+            return None
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
 
 @dataclass
@@ -21,9 +72,12 @@ class DialogueMessage:
     stance: str = "neutral"
     judgement: float | None = None  # default
     timestamp: datetime = field(default_factory=datetime.now)
+    seq: int | None = None  # position in the debate's yielded stream, set by Debate
+    metrics: TurnMetrics | None = None  # latency/usage/cost of generating this message
 
     def to_dict(self):
         return {
+            "seq": self.seq,
             "timestamp": self.timestamp.isoformat(),
             "name": self.name,
             "role": self.role,
@@ -31,8 +85,24 @@ class DialogueMessage:
             "judgement": self.judgement,
             "message": self.message,
             "debate_id": self.debate_id,
+            "metrics": self.metrics.to_dict() if self.metrics else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DialogueMessage":
+        """Inverse of to_dict()."""
+        return cls(
+            name=data["name"],
+            role=data["role"],
+            message=data["message"],
+            debate_id=data["debate_id"],
+            stance=data.get("stance") or "neutral",
+            judgement=data.get("judgement"),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            seq=data.get("seq"),
+            metrics=TurnMetrics.from_dict(data.get("metrics")),
+        )
+
 
 class DialogueHistory:
     def __init__(self):
@@ -44,6 +114,17 @@ class DialogueHistory:
     def get_history(self):
         return self.messages
 
+    def metrics_by_participant(self) -> dict:
+        """
+        Each speaker's TurnMetrics, in order of first appearance; unmetered
+        messages are skipped.
+        """
+        grouped: dict = {}
+        for message in self.messages:
+            if message.metrics is not None:
+                grouped.setdefault(message.name, []).append(message.metrics)
+        return grouped
+
 
 class DialogueConverter(object):
     """
@@ -9,3 +9,23 @@ class LLMParsingError(Exception):
 
 class JudgementParseError(LLMParsingError):
     pass
+
+
+class SimulatedLLMError(RuntimeError):
+    """An upstream failure injected by the stub provider's error rate."""
+
+
+class LLMCacheMiss(Exception):
+    """Replay mode found no cached response for an LLM request."""
+
+
+class DebateCancelled(Exception):
+    """Raised inside a running debate once its cancellation token fires."""
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CheckpointError(Exception):
+    """A checkpoint does not match the debate it is being restored into."""
@@ -0,0 +1,89 @@
+"""
+Persistent cache of the expertise a DynamicExpertJudge discovers for a motion.
+
+Discovery costs one LLM call per judge, and re-runs, A/B prompt tests and
+tournaments keep asking the same question about the same motion. Answers are
+stored in the debate store's ``expertise_cache`` table keyed by normalised
+motion, provider and model, and concurrent lookups for the same key (e.g. a
+batch of debates on one motion starting together) share a single LLM call.
+"""
+
+import logging
+import re
+import threading
+from typing import Callable, Optional
+
+from autodebater.concurrency import SingleFlight
+from autodebater.persistence import DebateStore
+
+logger = logging.getLogger(__name__)
+
+_shared: Optional["ExpertiseCache"] = None
+_shared_lock = threading.Lock()
+
+
+def normalise_motion(motion: str) -> str:
+    """Case-fold, collapse whitespace, drop surrounding quotes and final punctuation."""
+    text = re.sub(r"\s+", " ", motion).strip().casefold()
+    return text.strip("\"'").rstrip(".!?;: ")
+
+
+class ExpertiseCache:
+    """
+    Looks up expertise in the store, discovering (once per key) on a miss.
+    Without an explicit *store* the default debate store is opened on first use.
+    """
+
+    def __init__(self, store: Optional[DebateStore] = None):
+        self._store = store
+        self._store_lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    @property
+    def store(self) -> DebateStore:
+        if self._store is None:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = DebateStore()
+        return self._store
+
+    @staticmethod
+    def key(motion: str, provider: str, model: Optional[str]) -> tuple:
+        return normalise_motion(motion), provider, model or ""
+
+    def get_or_discover(
+        self,
+        motion: str,
+        provider: str,
+        model: Optional[str],
+        discover: Callable[[], str],
+    ) -> str:
+        """Return the cached expertise for the key; *discover* runs only on a miss."""
+        key = self.key(motion, provider, model)
+        return self._flight.do(key, self._load_or_discover, key, discover)
+
+    def _load_or_discover(self, key: tuple, discover: Callable[[], str]) -> str:
+        try:
+            cached = self.store.get_expertise(*key)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Expertise cache lookup failed; discovering instead")
+            cached = None
+        if cached is not None:
+            logger.info("Expertise cache hit for %r", key[0])
+            return cached
+        expertise = discover()
+        try:
+            self.store.put_expertise(*key, expertise)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not store discovered expertise")
+        return expertise
+
+
+def shared_expertise_cache() -> ExpertiseCache:
+    """Process-wide cache backed by the default debate store."""
+    global _shared  # pylint: disable=global-statement
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = ExpertiseCache()
+    return _shared
@@ -0,0 +1,188 @@
+"""
+Lifecycle event hooks for debates and participants.
+
+Subscribers are plain callables taking a HookEvent, registered on a
+HookRegistry without subclassing anything:
+
+    from autodebater.hooks import global_hooks
+
+    global_hooks.subscribe(print, "llm_call_end", "tool_call_end")
+
+Every Debate and Participant owns a registry. A participant's registry
+forwards to the debate it joins, and a debate's to ``global_hooks``, so a
+subscriber sees events from everything below where it registered. Events:
+
+- ``debate_start`` / ``debate_end``: around Debate.run()
+- ``turn_start`` / ``turn_end``: one speaker turn (debater or panelist)
+- ``respond_start`` / ``respond_end``: one reply by any participant, with its
+  TurnMetrics
+- ``llm_call_start`` / ``llm_call_end``: one LLM request, with token usage
+- ``tool_call_start`` / ``tool_call_end``: one tool run inside the tool loop
+- ``judge_retry``: a judge's reply could not be parsed and is being retried
+- ``score_update``: a judge score changed the running (or convergence) score
+
+``*_end`` events carry ``duration_ms`` and, if the block raised, ``error``.
+With no subscribers anywhere in the chain, emitting is a single truth test.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEBATE_START = "debate_start"
+DEBATE_END = "debate_end"
+TURN_START = "turn_start"
+TURN_END = "turn_end"
+RESPOND_START = "respond_start"
+RESPOND_END = "respond_end"
+LLM_CALL_START = "llm_call_start"
+LLM_CALL_END = "llm_call_end"
+TOOL_CALL_START = "tool_call_start"
+TOOL_CALL_END = "tool_call_end"
+JUDGE_RETRY = "judge_retry"
+SCORE_UPDATE = "score_update"
+
+EVENTS = (
+    DEBATE_START, DEBATE_END, TURN_START, TURN_END, RESPOND_START, RESPOND_END,
+    LLM_CALL_START, LLM_CALL_END, TOOL_CALL_START, TOOL_CALL_END, JUDGE_RETRY,
+    SCORE_UPDATE,
+)
+
+
+@dataclass
+class HookEvent:
+    """
+    One lifecycle event: *perf_time* is time.perf_counter(), *wall_time*
+    time.time().
+    """
+
+    name: str
+    data: dict
+    debate_id: Optional[str] = None
+    perf_time: float = field(default_factory=time.perf_counter)
+    wall_time: float = field(default_factory=time.time)
+    thread_id: int = field(default_factory=threading.get_ident)
+
+
+class _Timed:
+    """
+    Emit a start event on entry and the matching end event, with duration_ms,
+    on exit.
+    """
+
+    def __init__(self, registry: "HookRegistry", start: str, end: str, data: dict):
+        self.registry = registry
+        self.start_name = start
+        self.end_name = end
+        self.data = data
+        self.started = 0.0
+
+    def __enter__(self) -> dict:
+        self.registry.emit(self.start_name, **self.data)
+        self.started = time.perf_counter()
+        return self.data
+
+    def __exit__(self, exc_type, exc, tb):
+        duration_ms = (time.perf_counter() - self.started) * 1000
+        if exc is not None:
+            self.data["error"] = type(exc).__name__
+        duration_ms = round(duration_ms, 3)
+        self.registry.emit(self.end_name, duration_ms=duration_ms, **self.data)
+        return False
+
+
+class _NotTimed:
+    def __init__(self, data: dict):
+        self.data = data
+
+    def __enter__(self) -> dict:
+        return self.data
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class HookRegistry:
+    """
+    Subscribers for lifecycle events, forwarding everything it emits to its
+    parent. *owner* is the object (e.g. a Debate) whose ``debate_id`` is
+    stamped on events passing through.
+    """
+
+    def __init__(self, parent: Optional["HookRegistry"] = None, owner=None):
+        self.parent = parent
+        self.owner = owner
+        # (callback, frozenset of events or None for all)
+        self._subscribers: list = []
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self, callback: Callable[[HookEvent], None], *events: str
+    ) -> Callable:
+        """Call *callback* for the given events (all events if none are named)."""
+        unknown = set(events) - set(EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown hook events: {sorted(unknown)}")
+        with self._lock:
+            subscriber = (callback, frozenset(events) or None)
+            self._subscribers = self._subscribers + [subscriber]
+        return callback
+
+    def unsubscribe(self, callback: Callable) -> None:
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s[0] != callback]
+
+    def __bool__(self) -> bool:
+        registry = self
+        while registry is not None:
+            if registry._subscribers:
+                return True
+            registry = registry.parent
+        return False
+
+    def _debate_id(self) -> Optional[str]:
+        registry = self
+        while registry is not None:
+            debate_id = getattr(registry.owner, "debate_id", None)
+            if debate_id is not None:
+                return debate_id
+            registry = registry.parent
+        return None
+
+    def emit(self, name: str, **data) -> None:
+        """
+        Deliver an event to subscribers here and up the parent chain; errors
+        are logged.
+        """
+        if not self:
+            return
+        event = HookEvent(name, data, debate_id=self._debate_id())
+        registry = self
+        while registry is not None:
+            # pylint: disable-next=protected-access
+            for callback, events in registry._subscribers:
+                if events is None or name in events:
+                    try:
+                        callback(event)
+                    except Exception:  # pylint: disable=broad-except
+                        logger.exception(
+                            "Hook subscriber %r failed on %s", callback, name
+                        )
+            registry = registry.parent
+
+    def timed(self, start: str, end: str, **data):
+        """
+        Context manager emitting *start* then *end* with duration_ms. The body
+        gets the event data dict and may add to it (e.g. token counts) before
+        the end event goes out.
+        """
+        if not self:
+            return _NotTimed(data)
+        return _Timed(self, start, end, data)
+
+
+global_hooks = HookRegistry()
@@ -0,0 +1,140 @@
+"""
+Lease-based worker for the durable job queue kept in the debate store.
+
+Each worker thread claims one job at a time with ``DebateStore.claim_job`` and
+runs it through a handler; a heartbeat thread keeps the leases of all running
+jobs alive. If the process dies the leases lapse, and after a restart any
+worker (this process or another) claims those jobs again, so interrupted
+debates are retried instead of silently lost.
+"""
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Callable, Optional
+
+from autodebater.persistence import DebateStore
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get("AUTODEBATER_JOB_WORKERS", "4"))
+JOB_LEASE_SECONDS = float(os.environ.get("AUTODEBATER_JOB_LEASE_SECONDS", "30"))
+JOB_MAX_ATTEMPTS = int(os.environ.get("AUTODEBATER_JOB_MAX_ATTEMPTS", "3"))
+
+
+class JobWorker:
+    """
+    Pool of threads that claim jobs under a lease and run them.
+
+    *handler* receives the claimed job dict and returns its final state
+    ("completed" or "cancelled"); an exception counts as a failed attempt and
+    the job is requeued until it has used up its attempts.
+    """
+
+    def __init__(
+        self,
+        store: DebateStore,
+        handler: Callable[[dict], Optional[str]],
+        concurrency: int = JOB_WORKERS,
+        lease_seconds: float = JOB_LEASE_SECONDS,
+        poll_interval: float = 1.0,
+        retry_delay: float = 5.0,
+    ):
+        self.store = store
+        self.handler = handler
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: list = []
+        self._active: set = set()
+        self._active_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads) and not self._stop.is_set()
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._loop, name=f"autodebater-job-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(
+            target=self._heartbeat, name="autodebater-job-heartbeat", daemon=True
+        )
+        heartbeat.start()
+        self._threads.append(heartbeat)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop claiming new jobs and wait up to *timeout* for each thread. Jobs
+        still running when the process exits are picked up again once their
+        leases expire.
+        """
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """Wake an idle worker thread immediately (e.g. right after enqueueing)."""
+        self._wake.set()
+
+    def run_one(self) -> bool:
+        """Claim and run a single job on the calling thread; False if none was ready."""
+        job = self.store.claim_job(self.owner, self.lease_seconds)
+        if job is None:
+            return False
+        self._execute(job)
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.run_one():
+                    continue
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Job worker %s failed to claim a job", self.owner)
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._active_lock:
+                active = list(self._active)
+            for job_id in active:
+                try:
+                    if not self.store.renew_lease(
+                        job_id, self.owner, self.lease_seconds
+                    ):
+                        logger.warning("Lost the lease on job %s", job_id)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Failed to renew the lease on job %s", job_id)
+
+    def _execute(self, job: dict) -> None:
+        job_id = job["job_id"]
+        with self._active_lock:
+            self._active.add(job_id)
+        try:
+            state = self.handler(job) or "completed"
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception("Job %s attempt %d failed", job_id, job["attempts"])
+            self.store.fail_job(
+                job_id, self.owner, str(exc), retry_delay=self.retry_delay
+            )
+        else:
+            self.store.complete_job(job_id, self.owner, state)
+        finally:
+            with self._active_lock:
+                self._active.discard(job_id)
@@ -3,20 +3,67 @@ Module for wrappring LLM function calls.
 Containts an LLM Abstract class with inheritance
 for the different LLM python sdk implemtnations like openai or
 anthropic
+
+Identical requests in flight at the same moment (e.g. a batch of debates on
+one motion asking for the same opening) are coalesced into one provider call
+whose result every caller shares. Pass ``coalesce=False`` for calls whose
+answers should be sampled independently, or set AUTODEBATER_LLM_COALESCE=0.
+
+After every call a wrapper's ``last_call`` holds that call's latency, token
+usage (from LangChain's ``usage_metadata``) and, when responses are streamed
+(AUTODEBATER_LLM_STREAM=1), the time to first token.
 """
 
+import json
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_openai import ChatOpenAI, AzureChatOpenAI
 
+from autodebater.concurrency import SingleFlight
 from autodebater.defaults import ANTHROPIC_MODEL_PARAMS, OPENAI_MODEL_PARAMS
+from autodebater.errors import LLMCacheMiss
+from autodebater.llm_cache import (LLMResponseCache, cache_key, cache_mode,
+                                   shared_response_cache)
+from autodebater.stub_llm import StubChatModel, StubConfig
 
 logger = logging.getLogger(__name__)
 
+COALESCE_REQUESTS = os.environ.get("AUTODEBATER_LLM_COALESCE", "1") != "0"
+STREAM_RESPONSES = os.environ.get("AUTODEBATER_LLM_STREAM", "0") == "1"
+
+_in_flight = SingleFlight()
+
+
+def _with_base_url(model_params: dict, env_var: str) -> dict:
+    """Point the client at *env_var*'s URL (e.g. the local mock server).
+
+    An explicit base_url in *model_params* wins.
+    """
+    base_url = os.getenv(env_var)
+    if base_url and "base_url" not in model_params:
+        return {**model_params, "base_url": base_url}
+    return model_params
+
+
+def usage_of(reply) -> dict:
+    """Input, output and cached-input token counts from a reply's usage_metadata."""
+    usage = getattr(reply, "usage_metadata", None)
+    if not isinstance(usage, dict):
+        return {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}
+    details = usage.get("input_token_details") or {}
+    return {
+        "input_tokens": usage.get("input_tokens") or 0,
+        "output_tokens": usage.get("output_tokens") or 0,
+        "cached_tokens": details.get("cache_read") or 0,
+    }
+
 
 class LLMWrapper(ABC):
     """
@@ -33,6 +80,64 @@ class LLMWrapper(ABC):
     ) -> str:
         pass
 
+    last_call: dict = None
+
+    def invoke_messages(
+        self, messages: list, tools: list = ()
+    ):  # pylint: disable=unused-argument
+        """
+        One turn of the tool loop: invoke the (tool-bound) chat model on
+        LangChain messages and return its AIMessage, recording last_call.
+        The model is already bound to *tools*; only the cache keys on them.
+        """
+        start = time.perf_counter()
+        reply = self.llm.invoke(messages)
+        self.last_call = {
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+            "ttft_ms": None,
+            "coalesced": False,
+            **usage_of(reply),
+        }
+        return reply
+
+    def _call_model(self, messages, start: float, first_token: list):
+        if not STREAM_RESPONSES:
+            return self.llm.invoke(messages)
+        reply = None
+        for chunk in self.llm.stream(messages):
+            if not first_token and chunk.content:
+                first_token.append(time.perf_counter() - start)
+            reply = chunk if reply is None else reply + chunk
+        return reply
+
+    def _invoke(self, messages, coalesce: bool = True) -> str:
+        """
+        Invoke the chat model, sharing the call with identical concurrent
+        requests, and record its metrics in last_call. A caller that joined
+        someone else's request reports no token usage of its own.
+        """
+        start = time.perf_counter()
+        first_token: list = []
+        ran: list = []
+
+        def call():
+            ran.append(True)
+            return self._call_model(messages, start, first_token)
+
+        if coalesce and COALESCE_REQUESTS:
+            key = cache_key(type(self).__name__, self.model_params, messages)
+            reply = _in_flight.do(key, call)
+        else:
+            reply = call()
+        usage = usage_of(reply) if ran else usage_of(None)
+        self.last_call = {
+            "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+            "ttft_ms": round(first_token[0] * 1000, 1) if first_token else None,
+            "coalesced": not ran,
+            **usage,
+        }
+        return reply.content
+
 
 class OpenAILLMWrapper(LLMWrapper):
     """
@@ -46,18 +151,23 @@ class OpenAILLMWrapper(LLMWrapper):
         if len(self.model_params) == 0:
             self.model_params = OPENAI_MODEL_PARAMS
             logger.info("Setting OpenAI model params to %s", self.model_params)
+        self.model_params = _with_base_url(
+            self.model_params, "AUTODEBATER_OPENAI_BASE_URL"
+        )
 
         if os.getenv("OPENAI_API_KEY", None) is None:
             raise ValueError("OPENAI_API_KEY is not set")
 
         # assumes key is set as env var
-        self.llm = ChatOpenAI(**self.model_params)
+        stream_usage = {"stream_usage": True} if STREAM_RESPONSES else {}
+        self.llm = ChatOpenAI(**self.model_params, **stream_usage)
         super().__init__()
 
-    def generate_text_from_messages(self, messages: List[Tuple[str, str]]) -> str:
+    def generate_text_from_messages(
+        self, messages: List[Tuple[str, str]], coalesce: bool = True
+    ) -> str:
 
-        ai_msg = self.llm.invoke(messages)
-        return ai_msg.content
+        return self._invoke(messages, coalesce)
 
 
 class AzureOpenAILLMWrapper(LLMWrapper):
@@ -94,10 +204,11 @@ class AzureOpenAILLMWrapper(LLMWrapper):
         self.llm = AzureChatOpenAI(**self.model_params)
         super().__init__()
 
-    def generate_text_from_messages(self, messages: List[Tuple[str, str]]) -> str:
+    def generate_text_from_messages(
+        self, messages: List[Tuple[str, str]], coalesce: bool = True
+    ) -> str:
 
-        ai_msg = self.llm.invoke(messages)
-        return ai_msg.content
+        return self._invoke(messages, coalesce)
 
 
 class AnthropicLLMWrapper(LLMWrapper):
@@ -112,6 +223,9 @@ class AnthropicLLMWrapper(LLMWrapper):
         if len(self.model_params) == 0:
             self.model_params = ANTHROPIC_MODEL_PARAMS
             logger.info("Setting Anthropic model params to %s", self.model_params)
+        self.model_params = _with_base_url(
+            self.model_params, "AUTODEBATER_ANTHROPIC_BASE_URL"
+        )
 
         if os.getenv("ANTHROPIC_API_KEY", None) is None:
             raise ValueError("ANTHROPIC_API_KEY is not set")
@@ -119,10 +233,105 @@ class AnthropicLLMWrapper(LLMWrapper):
         self.llm = ChatAnthropic(**self.model_params)
         super().__init__()
 
-    def generate_text_from_messages(self, messages: List[Tuple[str, str]]) -> str:
+    def generate_text_from_messages(
+        self, messages: List[Tuple[str, str]], coalesce: bool = True
+    ) -> str:
+
+        return self._invoke(messages, coalesce)
+
+
+class StubLLMWrapper(LLMWrapper):
+    """
+    Offline provider for load tests: role-aware canned replies with simulated
+    latency and errors (see autodebater.stub_llm). Needs no API key.
+    """
+
+    def __init__(self, **model_params):
+
+        self.model_params = model_params
+        self.llm = StubChatModel(StubConfig.from_env(**model_params))
+        super().__init__()
+
+    def generate_text_from_messages(
+        self, messages: List[Tuple[str, str]], coalesce: bool = True
+    ) -> str:
+
+        return self._invoke(messages, coalesce)
+
+
+class CachingLLMWrapper(LLMWrapper):
+    """
+    Serves repeated calls from an LLMResponseCache (see autodebater.llm_cache).
+    In "replay" mode the wrapped model is never called: a miss raises
+    LLMCacheMiss. Tool-loop turns are cached too, as whole AIMessages (tool
+    calls included) stored without their token usage.
+    """
 
-        ai_msg = self.llm.invoke(messages)
-        return ai_msg.content
+    def __init__(
+        self,
+        inner: LLMWrapper,
+        provider: str,
+        cache: LLMResponseCache,
+        mode: str = "on",
+    ):
+        self.inner = inner
+        self.provider = provider
+        self.cache = cache
+        self.mode = mode
+        super().__init__()
+
+    @property
+    def llm(self):
+        return self.inner.llm
+
+    @llm.setter
+    def llm(self, value):
+        self.inner.llm = value
+
+    @property
+    def model_params(self):
+        return self.inner.model_params
+
+    def _lookup(self, key: str, start: float):
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.last_call = {
+                "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+                "ttft_ms": None,
+                "cache_hit": True,
+                **usage_of(None),
+            }
+        elif self.mode == "replay":
+            raise LLMCacheMiss(
+                f"No cached {self.provider} response for request {key[:12]}"
+            )
+        return cached
+
+    def generate_text_from_messages(
+        self, messages: List[Tuple[str, str]], coalesce: bool = True
+    ) -> str:
+        start = time.perf_counter()
+        key = cache_key(self.provider, self.inner.model_params, messages)
+        cached = self._lookup(key, start)
+        if cached is not None:
+            return cached
+        text = self.inner.generate_text_from_messages(messages, coalesce=coalesce)
+        self.last_call = {**(self.inner.last_call or {}), "cache_hit": False}
+        self.cache.put(key, text)
+        return text
+
+    def invoke_messages(self, messages: list, tools: list = ()):
+        start = time.perf_counter()
+        schemas = [convert_to_openai_tool(tool) for tool in tools]
+        key = cache_key(self.provider, self.inner.model_params, messages, tools=schemas)
+        cached = self._lookup(key, start)
+        if cached is not None:
+            return messages_from_dict([json.loads(cached)])[0]
+        reply = self.inner.invoke_messages(messages, tools)
+        self.last_call = {**(self.inner.last_call or {}), "cache_hit": False}
+        stored = reply.model_copy(update={"usage_metadata": None})
+        self.cache.put(key, json.dumps(message_to_dict(stored)))
+        return reply
 
 
 class LLMWrapperFactory:
@@ -132,11 +341,18 @@ class LLMWrapperFactory:
         "openai": OpenAILLMWrapper,
         "azure": AzureOpenAILLMWrapper,
         "anthropic": AnthropicLLMWrapper,
+        "stub": StubLLMWrapper,
     }
 
     @staticmethod
     def create_llm_wrapper(llm_type: str, **model_params):
         """
-        Factory method for creating LLMWrapper objects
+        Factory method for creating LLMWrapper objects; wraps them in a
+        CachingLLMWrapper when AUTODEBATER_LLM_CACHE is "on" or "replay".
         """
-        return LLMWrapperFactory.llms[llm_type](**model_params)
+        wrapper = LLMWrapperFactory.llms[llm_type](**model_params)
+        mode = cache_mode()
+        if mode != "off":
+            cache = shared_response_cache()
+            wrapper = CachingLLMWrapper(wrapper, llm_type, cache, mode)
+        return wrapper
@@ -0,0 +1,225 @@
+"""
+Content-addressed cache of LLM responses for reproducible reruns.
+
+Every ``generate_text_from_messages`` call is keyed by a SHA-256 of the
+provider, the wrapper's model parameters and the canonicalised message list;
+tool-loop turns (``invoke_messages``) also key on the bound tools' schemas.
+Responses live in their own SQLite file, expire after an optional TTL and are
+evicted least-recently-used first once the cache grows past its size limit
+(tracked as a running total, so writes under the limit never scan the table).
+
+The cache is opt-in and configured through the environment:
+
+- ``AUTODEBATER_LLM_CACHE``: ``off`` (default), ``on`` (read-through, record
+  misses) or ``replay`` (read-only; a miss raises LLMCacheMiss)
+- ``AUTODEBATER_LLM_CACHE_DB``: database path (default ``llm_cache.db``)
+- ``AUTODEBATER_LLM_CACHE_MB``: size limit in megabytes (default 256)
+- ``AUTODEBATER_LLM_CACHE_TTL``: entry lifetime in seconds (default 0, never expire)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+CACHE_MODES = ("off", "on", "replay")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+
+CREATE TABLE IF NOT EXISTS cache_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_bytes INTEGER NOT NULL
+);
+INSERT INTO cache_meta (id, total_bytes)
+SELECT 1, (SELECT COALESCE(SUM(size), 0) FROM responses)
+WHERE NOT EXISTS (SELECT 1 FROM cache_meta);
+CREATE TRIGGER IF NOT EXISTS responses_size_insert AFTER INSERT ON responses BEGIN
+    UPDATE cache_meta SET total_bytes = total_bytes + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_update
+AFTER UPDATE OF size ON responses BEGIN
+    UPDATE cache_meta SET total_bytes = total_bytes + new.size - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS responses_size_delete AFTER DELETE ON responses BEGIN
+    UPDATE cache_meta SET total_bytes = total_bytes - old.size;
+END;
+"""
+
+_shared: dict = {}
+_shared_lock = threading.Lock()
+
+
+def cache_mode() -> str:
+    """The configured cache mode, read from AUTODEBATER_LLM_CACHE on every call."""
+    mode = os.environ.get("AUTODEBATER_LLM_CACHE", "off").strip().lower() or "off"
+    if mode not in CACHE_MODES:
+        raise ValueError(
+            f"AUTODEBATER_LLM_CACHE must be one of {CACHE_MODES}, got {mode!r}"
+        )
+    return mode
+
+
+def _canonical_message(message):
+    if isinstance(message, (tuple, list)):
+        return [str(part) for part in message]
+    # LangChain message objects; tool-loop turns also carry tool calls and results
+    canonical = [
+        getattr(message, "type", type(message).__name__),
+        getattr(message, "content", str(message)),
+    ]
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        canonical.append([[c["name"], c["args"], c.get("id")] for c in tool_calls])
+    tool_call_id = getattr(message, "tool_call_id", None)
+    if tool_call_id:
+        canonical.append(tool_call_id)
+    return canonical
+
+
+def cache_key(
+    provider: str, model_params: dict, messages, tools: Optional[list] = None
+) -> str:
+    """SHA-256 over the provider, model parameters, messages and tool schemas."""
+    payload = {
+        "provider": provider,
+        "params": model_params,
+        "messages": [_canonical_message(m) for m in messages],
+    }
+    if tools is not None:
+        payload["tools"] = tools
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with size-bounded LRU eviction and TTLs."""
+
+    def __init__(
+        self,
+        db_path: str = "llm_cache.db",
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds or None
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache":
+        return cls(
+            db_path=os.environ.get("AUTODEBATER_LLM_CACHE_DB", "llm_cache.db"),
+            max_bytes=int(
+                float(os.environ.get("AUTODEBATER_LLM_CACHE_MB", "256")) * 1024 * 1024
+            ),
+            ttl_seconds=float(os.environ.get("AUTODEBATER_LLM_CACHE_TTL", "0")),
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response and mark it used, or None if absent or expired."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response. The total size is kept by triggers in cache_meta, so
+        a write only scans for victims once the cache has outgrown max_bytes.
+        """
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO responses "
+                "(key, response, size, created_at, last_used, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET response = excluded.response, "
+                "size = excluded.size, created_at = excluded.created_at, "
+                "last_used = excluded.last_used, expires_at = excluded.expires_at",
+                (key, response, size, now, now, expires_at),
+            )
+            if self._total(conn) > self.max_bytes:
+                self._evict(conn, now)
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT total_bytes FROM cache_meta").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least-recently-used ones until under max_bytes."""
+        conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        excess = self._total(conn) - self.max_bytes
+        victims = []
+        # Walks idx_responses_last_used from the oldest entry, reading only as far
+        # as it needs to
+        cursor = conn.execute("SELECT key, size FROM responses ORDER BY last_used")
+        for key, size in cursor:
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        cursor.close()
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "entries": entries,
+            "bytes": self._total(conn),
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+def shared_response_cache() -> LLMResponseCache:
+    """Process-wide cache for the configured database path."""
+    path = os.environ.get("AUTODEBATER_LLM_CACHE_DB", "llm_cache.db")
+    cache = _shared.get(path)
+    if cache is None:
+        with _shared_lock:
+            cache = _shared.get(path)
+            if cache is None:
+                cache = _shared[path] = LLMResponseCache.from_env()
+    return cache
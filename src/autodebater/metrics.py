@@ -0,0 +1,256 @@
+"""
+Prometheus metrics, rendered in the text exposition format.
+
+A small self-contained implementation (counters, gauges and histograms with
+labels) so the API can serve ``/metrics`` without an extra dependency. LLM,
+tool, judge and cache metrics are fed by the lifecycle hooks (see
+autodebater.hooks) once install() has subscribed to ``global_hooks``; SQLite
+query latency is observed by DebateStore directly, and point-in-time gauges
+such as active debates are supplied by callbacks at scrape time.
+"""
+
+import bisect
+import threading
+from typing import Callable, Dict, Optional
+
+from autodebater.hooks import (JUDGE_RETRY, LLM_CALL_END, SCORE_UPDATE, TOOL_CALL_END,
+                               HookEvent, global_hooks)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """A named metric family; *labelnames* order the label values of each series."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.documentation}",
+                f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """A monotonically increasing total per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [f"{self.name}{_labels(self.labelnames, k)} {_number(v)}"
+                                for k, v in items]
+
+
+class Gauge(_Metric):
+    """
+    A value computed at scrape time by *callback*, returning
+    {label values: value}.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(),
+                 callback: Callable[[], dict] = None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def render(self) -> list:
+        values = self.callback() if self.callback else {}
+        return self.header() + [f"{self.name}{_labels(self.labelnames, k)} {_number(v)}"
+                                for k, v in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative *buckets*, with their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[tuple, list] = {}  # key -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[-1] if series else 0
+
+    def render(self) -> list:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        lines = self.header()
+        for key, series in items:
+            labels = _labels(self.labelnames, key)
+            cumulative = 0
+            for bound, hits in zip(self.buckets, series):
+                cumulative += hits
+                le = f'le="{_number(bound)}"'
+                bucket = _labels(self.labelnames, key, le)
+                lines.append(f"{self.name}_bucket{bucket} {cumulative}")
+            inf = _labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {series[-1]}")
+            lines.append(f"{self.name}_sum{labels} {_number(float(series[-2]))}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics by name, rendered together in registration order."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _cache_hit_ratio() -> dict:
+    hits = LLM_CACHE_REQUESTS.value(result="hit")
+    misses = LLM_CACHE_REQUESTS.value(result="miss")
+    return {(): hits / (hits + misses)} if hits + misses else {}
+
+
+_LLM_LABELS = ("provider", "model", "role")
+
+LLM_CALL_SECONDS = REGISTRY.register(Histogram(
+    "autodebater_llm_call_duration_seconds", "Latency of LLM calls.", _LLM_LABELS))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "autodebater_llm_tokens_total",
+    "Tokens used by LLM calls, by kind (input, output, cached).",
+    _LLM_LABELS + ("kind",)))
+LLM_ERRORS = REGISTRY.register(Counter(
+    "autodebater_llm_call_errors_total", "LLM calls that raised.", _LLM_LABELS))
+LLM_CACHE_REQUESTS = REGISTRY.register(Counter(
+    "autodebater_llm_cache_requests_total",
+    "Response cache lookups, by result (hit, miss).",
+    ("result",)))
+LLM_CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "autodebater_llm_cache_hit_ratio",
+    "Fraction of response cache lookups served from the cache.",
+    callback=_cache_hit_ratio))
+JUDGE_RETRIES = REGISTRY.register(Counter(
+    "autodebater_judge_parse_retries_total",
+    "Judge replies that could not be parsed and were retried."))
+JUDGE_SCORES = REGISTRY.register(Counter(
+    "autodebater_judge_scores_total", "Judge scores recorded."))
+TOOL_CALL_SECONDS = REGISTRY.register(Histogram(
+    "autodebater_tool_call_duration_seconds", "Latency of tool calls in the tool loop.",
+    ("tool",)))
+SQLITE_QUERY_SECONDS = REGISTRY.register(Histogram(
+    "autodebater_sqlite_query_duration_seconds", "Latency of DebateStore operations.",
+    ("operation",), buckets=QUERY_BUCKETS))
+
+
+def gauge(name: str, documentation: str, callback: Callable[[], dict],
+          labelnames: tuple = ()) -> Gauge:
+    """Register (or replace) a scrape-time gauge, e.g. the API's live debate counts."""
+    return REGISTRY.register(Gauge(name, documentation, labelnames, callback))
+
+
+def _on_event(event: HookEvent) -> None:
+    data = event.data
+    if event.name == LLM_CALL_END:
+        labels = {"provider": data.get("provider"), "model": data.get("model") or "",
+                  "role": data.get("role")}
+        if data.get("error"):
+            LLM_ERRORS.inc(**labels)
+            return
+        LLM_CALL_SECONDS.observe(data.get("duration_ms", 0) / 1000, **labels)
+        for kind in ("input", "output", "cached"):
+            tokens = data.get(f"{kind}_tokens")
+            if tokens:
+                LLM_TOKENS.inc(tokens, kind=kind, **labels)
+        if "cache_hit" in data:
+            LLM_CACHE_REQUESTS.inc(result="hit" if data["cache_hit"] else "miss")
+    elif event.name == TOOL_CALL_END:
+        TOOL_CALL_SECONDS.observe(data.get("duration_ms", 0) / 1000,
+                                  tool=data.get("tool"))
+    elif event.name == JUDGE_RETRY:
+        JUDGE_RETRIES.inc()
+    elif event.name == SCORE_UPDATE:
+        JUDGE_SCORES.inc()
+
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def install() -> None:
+    """Start collecting hook-fed metrics; idempotent."""
+    global _installed  # pylint: disable=global-statement
+    with _install_lock:
+        if not _installed:
+            global_hooks.subscribe(_on_event, LLM_CALL_END, TOOL_CALL_END,
+                                   JUDGE_RETRY, SCORE_UPDATE)
+            _installed = True
+
+
+def render() -> str:
+    return REGISTRY.render()
+
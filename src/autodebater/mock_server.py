@@ -0,0 +1,323 @@
+"""
+Local mock of the OpenAI chat-completions and Anthropic messages APIs.
+
+Unlike the in-process ``stub`` provider, requests made against this server go
+through LangChain's real HTTP clients, serialization and connection pooling,
+which is what benchmarks of those paths need. Replies come from the stub
+model (role-aware text, judge scores, tool calls) and are paced by its latency
+settings: the first token after the simulated time to first token, the rest
+spread over the simulated generation time when streaming.
+
+Run it with ``autodebater mock-server`` and point the wrappers at it:
+
+- ``AUTODEBATER_OPENAI_BASE_URL=http://127.0.0.1:8100/v1``
+- ``AUTODEBATER_ANTHROPIC_BASE_URL=http://127.0.0.1:8100``
+"""
+
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from autodebater.errors import SimulatedLLMError
+from autodebater.stub_llm import StubChatModel, StubConfig
+
+_CHUNK_WORDS = 3
+
+
+def _text_of(content) -> str:
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if isinstance(block, dict) and block.get("type") == "tool_result":
+            parts.append(_text_of(block.get("content")))
+        elif isinstance(block, dict):
+            parts.append(block.get("text", ""))
+    return " ".join(p for p in parts if p)
+
+
+def _openai_messages(body: dict) -> list:
+    return [(m["role"], _text_of(m.get("content"))) for m in body.get("messages", [])]
+
+
+def _anthropic_messages(body: dict) -> list:
+    messages = []
+    if body.get("system"):
+        messages.append(("system", _text_of(body["system"])))
+    for m in body.get("messages", []):
+        content = m.get("content")
+        if isinstance(content, list) and any(
+            isinstance(b, dict) and b.get("type") == "tool_result" for b in content
+        ):
+            messages.append(("tool", _text_of(content)))
+        else:
+            messages.append((m["role"], _text_of(content)))
+    return messages
+
+
+def _chunks(text: str) -> list:
+    words = text.split(" ")
+    return [
+        " ".join(words[i : i + _CHUNK_WORDS])
+        + (" " if i + _CHUNK_WORDS < len(words) else "")
+        for i in range(0, len(words), _CHUNK_WORDS)
+    ]
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+def create_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """Build the mock server; *config* defaults to the AUTODEBATER_STUB_* settings."""
+    model = StubChatModel(config or StubConfig.from_env())
+    ids = itertools.count(1)
+    app = FastAPI(title="AutoDebater mock LLM server")
+
+    def reply_for(messages: list, tool_names: list):
+        bound = (
+            model.bind_tools([SimpleNamespace(name=n) for n in tool_names])
+            if tool_names
+            else model
+        )
+        reply = bound.generate(messages)
+        return (
+            reply,
+            reply.usage_metadata["input_tokens"],
+            reply.usage_metadata["output_tokens"],
+        )
+
+    async def paced(frames: list, first_delay: float, rest_delay: float):
+        await asyncio.sleep(first_delay)
+        gap = rest_delay / max(len(frames) - 1, 1)
+        for i, frame in enumerate(frames):
+            if i and gap:
+                await asyncio.sleep(gap)
+            yield frame
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        tool_names = [
+            t["function"]["name"] for t in body.get("tools", []) if "function" in t
+        ]
+        try:
+            reply, input_tokens, output_tokens = reply_for(
+                _openai_messages(body), tool_names
+            )
+        except SimulatedLLMError as exc:
+            return JSONResponse(
+                {"error": {"message": str(exc), "type": "server_error"}},
+                status_code=500,
+            )
+        first, rest = model.delays(output_tokens)
+        base = {
+            "id": f"chatcmpl-stub-{next(ids)}",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+        }
+        usage = {
+            "prompt_tokens": input_tokens,
+            "completion_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        tool_calls = [
+            {
+                "id": call["id"],
+                "type": "function",
+                "function": {
+                    "name": call["name"],
+                    "arguments": json.dumps(call["args"]),
+                },
+            }
+            for call in reply.tool_calls
+        ]
+        finish = "tool_calls" if tool_calls else "stop"
+
+        if not body.get("stream"):
+            await asyncio.sleep(first + rest)
+            message = {"role": "assistant", "content": reply.content or None}
+            if tool_calls:
+                message["tool_calls"] = tool_calls
+            return {
+                **base,
+                "object": "chat.completion",
+                "usage": usage,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": message,
+                        "finish_reason": finish,
+                        "logprobs": None,
+                    }
+                ],
+            }
+
+        def chunk(delta: dict, finish_reason=None) -> str:
+            return _sse(
+                {
+                    **base,
+                    "object": "chat.completion.chunk",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": delta,
+                            "finish_reason": finish_reason,
+                            "logprobs": None,
+                        }
+                    ],
+                }
+            )
+
+        frames = [chunk({"role": "assistant", "content": ""})]
+        if tool_calls:
+            frames.append(
+                chunk(
+                    {
+                        "tool_calls": [
+                            {"index": i, **c} for i, c in enumerate(tool_calls)
+                        ]
+                    }
+                )
+            )
+        else:
+            frames.extend(chunk({"content": piece}) for piece in _chunks(reply.content))
+        frames.append(chunk({}, finish))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            frames.append(
+                _sse(
+                    {
+                        **base,
+                        "object": "chat.completion.chunk",
+                        "choices": [],
+                        "usage": usage,
+                    }
+                )
+            )
+        frames.append("data: [DONE]\n\n")
+        return StreamingResponse(
+            paced(frames, first, rest), media_type="text/event-stream"
+        )
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        tool_names = [t["name"] for t in body.get("tools", []) if "name" in t]
+        try:
+            reply, input_tokens, output_tokens = reply_for(
+                _anthropic_messages(body), tool_names
+            )
+        except SimulatedLLMError as exc:
+            return JSONResponse(
+                {"type": "error", "error": {"type": "api_error", "message": str(exc)}},
+                status_code=500,
+            )
+        first, rest = model.delays(output_tokens)
+        blocks = [
+            {
+                "type": "tool_use",
+                "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                "name": call["name"],
+                "input": call["args"],
+            }
+            for call in reply.tool_calls
+        ]
+        if not blocks:
+            blocks = [{"type": "text", "text": reply.content}]
+        stop_reason = "tool_use" if reply.tool_calls else "end_turn"
+        message = {
+            "id": f"msg_stub_{next(ids)}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub"),
+            "stop_sequence": None,
+        }
+
+        if not body.get("stream"):
+            await asyncio.sleep(first + rest)
+            return {
+                **message,
+                "content": blocks,
+                "stop_reason": stop_reason,
+                "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+            }
+
+        frames = [
+            _sse(
+                {
+                    "type": "message_start",
+                    "message": {
+                        **message,
+                        "content": [],
+                        "stop_reason": None,
+                        "usage": {"input_tokens": input_tokens, "output_tokens": 0},
+                    },
+                },
+                "message_start",
+            )
+        ]
+        for index, block in enumerate(blocks):
+            if block["type"] == "text":
+                start = {"type": "text", "text": ""}
+                deltas = [
+                    {"type": "text_delta", "text": piece}
+                    for piece in _chunks(block["text"])
+                ]
+            else:
+                start = {**block, "input": {}}
+                deltas = [
+                    {
+                        "type": "input_json_delta",
+                        "partial_json": json.dumps(block["input"]),
+                    }
+                ]
+            frames.append(
+                _sse(
+                    {
+                        "type": "content_block_start",
+                        "index": index,
+                        "content_block": start,
+                    },
+                    "content_block_start",
+                )
+            )
+            frames.extend(
+                _sse(
+                    {"type": "content_block_delta", "index": index, "delta": d},
+                    "content_block_delta",
+                )
+                for d in deltas
+            )
+            frames.append(
+                _sse(
+                    {"type": "content_block_stop", "index": index}, "content_block_stop"
+                )
+            )
+        frames.append(
+            _sse(
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                    "usage": {"output_tokens": output_tokens},
+                },
+                "message_delta",
+            )
+        )
+        frames.append(_sse({"type": "message_stop"}, "message_stop"))
+        return StreamingResponse(
+            paced(frames, first, rest), media_type="text/event-stream"
+        )
+
+    return app
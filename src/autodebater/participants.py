@@ -17,7 +17,10 @@ The difference between the participants is as follows:
 """
 
 import logging
+import threading
+import time
 from abc import ABC
+from contextlib import contextmanager
 
 from autodebater.defaults import (BULLSHIT_DETECTOR_PROMPT, DEBATER_PROMPT,
                                   DYNAMIC_EXPERT_JUDGE_PROMPT, EXPERT_JUDGE_PROMPT,
@@ -25,8 +28,14 @@ from autodebater.defaults import (BULLSHIT_DETECTOR_PROMPT, DEBATER_PROMPT,
                                   MODERATOR_CLOSING_PROMPT, MODERATOR_OPENING_PROMPT,
                                   MODERATOR_QUESTION_PROMPT, MODERATOR_SYSTEM_PROMPT,
                                   PANEL_PARTICIPANT_PROMPT)
-from autodebater.dialogue import DialogueConverter, DialogueHistory, DialogueMessage
+from autodebater.dialogue import (DialogueConverter, DialogueHistory, DialogueMessage,
+                                  TurnMetrics)
+from autodebater.hooks import (LLM_CALL_END, LLM_CALL_START, RESPOND_END,
+                               RESPOND_START, TOOL_CALL_END, TOOL_CALL_START,
+                               HookRegistry, global_hooks)
 from autodebater.llm import LLMWrapperFactory
+from autodebater.pricing import estimate_cost
+from autodebater.profile import context_message
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +47,18 @@ class Participant(ABC):
     message for each model.
 
     Pass tools=[...] to enable a ReAct search loop — any LangChain tool works.
+
+    coalesce_requests lets identical concurrent LLM requests from different
+    participants share one call; turn it off where independent samples matter.
+
+    After each turn, last_metrics holds its latency, token usage and cost.
+    LLM and tool calls are announced on self.hooks (see autodebater.hooks).
     """
 
+    coalesce_requests = True
+    last_metrics = None
+    _turn_metrics = None
+
     def __init__(
         self,
         name: str,
@@ -56,10 +75,12 @@ class Participant(ABC):
         self.llm_provider = llm_provider
         self.model_params = model_params
         self.tools = tools or []
+        self.cancel_token = None  # set by the Debate this participant joins
+        # re-parented by the Debate this participant joins
+        self.hooks = HookRegistry(parent=global_hooks)
 
-        if context:
-            system_prompt = system_prompt + f"\n\n## User Context\n{context}"
         self.system_prompt = system_prompt
+        self.context_message = context_message(context) if context else None
 
         self.llm = LLMWrapperFactory.create_llm_wrapper(
             llm_provider, **self.model_params
@@ -73,10 +94,90 @@ class Participant(ABC):
         self.message_converter = DialogueConverter()
         system_msg = ("system", self.system_prompt)
         self.chat_history = [system_msg]
+        if self.context_message is not None:
+            self.chat_history.append(self.context_message)
 
     def _update_chat_history(self, messages):
         self.chat_history.extend(messages)
 
+    @property
+    def model_name(self):
+        """The model actually used, including defaults filled in by the wrapper."""
+        wrapper_params = getattr(self.llm, "model_params", None)
+        if not isinstance(wrapper_params, dict):
+            wrapper_params = {}
+        return self.model_params.get("model") or wrapper_params.get("model")
+
+    @contextmanager
+    def _metered_turn(self):
+        """Collect the usage of every LLM call made in the block into last_metrics."""
+        metrics = self._turn_metrics = TurnMetrics()
+        start = time.perf_counter()
+        with self.hooks.timed(RESPOND_START, RESPOND_END, participant=self.name,
+                              role=self.role) as info:
+            try:
+                yield metrics
+            finally:
+                self._turn_metrics = None
+                metrics.latency_ms = round((time.perf_counter() - start) * 1000, 1)
+                metrics.cost_usd = estimate_cost(
+                    self.llm_provider, self.model_name, metrics.input_tokens,
+                    metrics.output_tokens, metrics.cached_tokens,
+                )
+                self.last_metrics = metrics
+                info["metrics"] = metrics
+
+    def _record_call(self, call) -> None:
+        if self._turn_metrics is not None and isinstance(call, dict):
+            self._turn_metrics.add_call(call)
+
+    def _hook_info(self) -> dict:
+        return {"participant": self.name, "role": self.role,
+                "provider": self.llm_provider, "model": self.model_name}
+
+    def _generate(self, messages) -> str:
+        with self.hooks.timed(LLM_CALL_START, LLM_CALL_END,
+                              **self._hook_info()) as info:
+            response = self.llm.generate_text_from_messages(
+                messages, coalesce=self.coalesce_requests
+            )
+            call = self.llm.last_call
+            if isinstance(call, dict):
+                info.update(call)
+        self._record_call(call)
+        return response
+
+    @property
+    def prepared(self) -> bool:
+        """False while prepare() still has LLM calls to make before the first reply."""
+        return True
+
+    def prepare(self) -> None:
+        """One-off set-up before the first reply; debates run it while warming up."""
+
+    def observe(self, most_recent_chats: list[DialogueMessage]):
+        """Take messages into the chat history without generating a reply."""
+        messages = self.message_converter.convert_messages(most_recent_chats)
+        self._update_chat_history(messages)
+
+    def state(self) -> dict:
+        """JSON-serialisable conversation state, for debate checkpoints."""
+        return {
+            "name": self.name,
+            "system_prompt": self.system_prompt,
+            "chat_history": [list(m) for m in self.chat_history],
+        }
+
+    def load_state(self, state: dict) -> None:
+        """Restore what state() captured; the LLM client is left as constructed."""
+        self.name = state["name"]
+        self.system_prompt = state["system_prompt"]
+        shared = self.context_message
+        self.chat_history = [
+            shared if shared is not None and tuple(m) == shared else tuple(m)
+            for m in state["chat_history"]
+        ]
+
     def _tool_respond(self) -> str:
         """ReAct loop: invoke LLM, execute any tool calls, repeat until final answer."""
         from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
@@ -92,7 +193,15 @@ class Participant(ABC):
 
         max_iterations = 5
         for _ in range(max_iterations):
-            ai_msg = self.llm.llm.invoke(lc_messages)
+            if self.cancel_token is not None:
+                self.cancel_token.check()
+            with self.hooks.timed(LLM_CALL_START, LLM_CALL_END,
+                                  **self._hook_info()) as info:
+                ai_msg = self.llm.invoke_messages(lc_messages, self.tools)
+                call = self.llm.last_call
+                if isinstance(call, dict):
+                    info.update(call)
+            self._record_call(call)
             lc_messages.append(ai_msg)
 
             if not getattr(ai_msg, "tool_calls", None):
@@ -100,13 +209,18 @@ class Participant(ABC):
                 self._update_chat_history([("assistant", final_text)])
                 return final_text
 
+            if self._turn_metrics is not None:
+                self._turn_metrics.tool_iterations += 1
             for tool_call in ai_msg.tool_calls:
                 tool_name = tool_call["name"]
                 tool_args = tool_call["args"]
                 matched = next((t for t in self.tools if t.name == tool_name), None)
                 if matched:
                     try:
-                        tool_result = matched.run(tool_args)
+                        with self.hooks.timed(TOOL_CALL_START, TOOL_CALL_END,
+                                              tool=tool_name, participant=self.name,
+                                              role=self.role):
+                            tool_result = matched.run(tool_args)
                     except Exception as exc:  # pragma: no cover
                         tool_result = f"Tool error: {exc}"
                 else:
@@ -124,12 +238,12 @@ class Participant(ABC):
         converted_chats = self.message_converter.convert_messages(most_recent_chats)
         self._update_chat_history(converted_chats)
 
-        if not self.tools:
-            response = self.llm.generate_text_from_messages(self.chat_history)
-            self._update_chat_history([("assistant", response)])
-            return response
-
-        return self._tool_respond()
+        with self._metered_turn():
+            if self.tools:
+                return self._tool_respond()
+            response = self._generate(self.chat_history)
+        self._update_chat_history([("assistant", response)])
+        return response
 
 
 class Debater(Participant):
@@ -153,6 +267,8 @@ class Debater(Participant):
         system_prompt = instruction_prompt.format(motion=motion, stance=stance)
         super().__init__(name, system_prompt, "debater", llm_provider,
                          tools=tools, context=context, **model_params)
+        # Debaters sampling at a nonzero temperature should argue independently
+        self.coalesce_requests = model_params.get("temperature") == 0
 
 
 class Judge(Participant):
@@ -177,7 +293,8 @@ class Judge(Participant):
         """
         prompt = ("user", JUDGE_SUMMARY)
         self._update_chat_history([prompt])
-        response = self.llm.generate_text_from_messages(self.chat_history)
+        with self._metered_turn():
+            response = self._generate(self.chat_history)
         self._update_chat_history([("assistant", response)])
         return response
 
@@ -210,7 +327,8 @@ class Moderator(Participant):
         template = self._opening_prompt or MODERATOR_OPENING_PROMPT
         prompt = template.format(motion=self.motion)
         self._update_chat_history([("user", prompt)])
-        response = self.llm.generate_text_from_messages(self.chat_history)
+        with self._metered_turn():
+            response = self._generate(self.chat_history)
         self._update_chat_history([("assistant", response)])
         return response
 
@@ -218,7 +336,8 @@ class Moderator(Participant):
         converted = self.message_converter.convert_messages(history.get_history())
         self._update_chat_history(converted)
         self._update_chat_history([("user", self._question_prompt or MODERATOR_QUESTION_PROMPT)])
-        response = self.llm.generate_text_from_messages(self.chat_history)
+        with self._metered_turn():
+            response = self._generate(self.chat_history)
         self._update_chat_history([("assistant", response)])
         return response
 
@@ -226,7 +345,8 @@ class Moderator(Participant):
         converted = self.message_converter.convert_messages(history.get_history())
         self._update_chat_history(converted)
         self._update_chat_history([("user", self._closing_prompt or MODERATOR_CLOSING_PROMPT)])
-        response = self.llm.generate_text_from_messages(self.chat_history)
+        with self._metered_turn():
+            response = self._generate(self.chat_history)
         self._update_chat_history([("assistant", response)])
         return response
 
@@ -235,6 +355,9 @@ class DynamicExpertJudge(Judge):
     """
     A Judge that lazily discovers its domain of expertise on the first respond() call.
     Construction never makes LLM calls — expertise is deferred until actually needed.
+
+    Pass an ExpertiseCache to reuse expertise discovered earlier for the same
+    motion, provider and model instead of asking the LLM again.
     """
 
     def __init__(
@@ -242,14 +365,32 @@ class DynamicExpertJudge(Judge):
         name: str,
         motion: str,
         llm_provider: str = LLM_PROVIDER,
+        expertise_cache=None,
         **model_params,
     ):
         self._expertise = None
         self._motion = motion
+        self._expertise_lock = threading.Lock()
+        self.expertise_cache = expertise_cache
         # Start with the base expert judge prompt; upgraded after expertise discovery.
         super().__init__(name, motion, llm_provider=llm_provider, **model_params)
 
     def _discover_expertise(self):
+        if self.expertise_cache is not None:
+            self._expertise = self.expertise_cache.get_or_discover(
+                self._motion, self.llm_provider, self.model_name,
+                self._ask_expertise,
+            )
+        else:
+            self._expertise = self._ask_expertise()
+        logger.info("DynamicExpertJudge '%s' expertise: %s", self.name, self._expertise)
+        new_system = DYNAMIC_EXPERT_JUDGE_PROMPT.format(
+            motion=self._motion, expertise=self._expertise
+        )
+        self.chat_history[0] = ("system", new_system)
+        self.system_prompt = new_system
+
+    def _ask_expertise(self) -> str:
         expertise_prompt = [
             ("system", "You are a domain expert."),
             (
@@ -258,21 +399,31 @@ class DynamicExpertJudge(Judge):
                 f"'{self._motion}'? Answer in one short phrase (e.g. 'machine learning and AI ethics').",
             ),
         ]
-        self._expertise = self.llm.generate_text_from_messages(expertise_prompt).strip()
-        logger.info("DynamicExpertJudge '%s' expertise: %s", self.name, self._expertise)
-        new_system = DYNAMIC_EXPERT_JUDGE_PROMPT.format(
-            motion=self._motion, expertise=self._expertise
-        )
-        self.chat_history[0] = ("system", new_system)
-        self.system_prompt = new_system
+        return self._generate(expertise_prompt).strip()
 
     @property
     def expertise(self):
         return self._expertise
 
+    @property
+    def prepared(self) -> bool:
+        return self._expertise is not None
+
+    def prepare(self) -> None:
+        """Discover expertise once; concurrent callers wait for the first to finish."""
+        with self._expertise_lock:
+            if self._expertise is None:
+                self._discover_expertise()
+
+    def state(self) -> dict:
+        return {**super().state(), "expertise": self._expertise}
+
+    def load_state(self, state: dict) -> None:
+        super().load_state(state)
+        self._expertise = state.get("expertise")
+
     def respond(self, most_recent_chats: list):
-        if self._expertise is None:
-            self._discover_expertise()
+        self.prepare()
         return super().respond(most_recent_chats)
 
 
@@ -1,90 +1,361 @@
 """
 Debate persistence: SQLite storage and file export.
+
+Connections are long-lived and reused per thread, the database runs in WAL
+mode, and the schema is versioned through ``PRAGMA user_version`` so
+migrations run once per database file per process rather than on every
+``DebateStore()`` construction.
 """
 
+import base64
+import functools
 import json
 import sqlite3
+import threading
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from autodebater.dialogue import DialogueHistory, DialogueMessage
+from autodebater.concurrency import run_io
+from autodebater.dialogue import DialogueHistory, DialogueMessage, TurnMetrics
+from autodebater.metrics import SQLITE_QUERY_SECONDS
+from autodebater.scoring import geometric_mean
 
 _DEFAULT_DB = "debates.db"
 
+def _final_score(judgements: list) -> Optional[float]:
+    """Running (geometric-mean) score over all judge messages, as shown live."""
+    return geometric_mean(judgements) if judgements else None
+
+
+def _add_debate_summary_columns(conn: sqlite3.Connection):
+    conn.execute("ALTER TABLE debates ADD COLUMN mode TEXT")
+    conn.execute(
+        "ALTER TABLE debates ADD COLUMN status TEXT NOT NULL DEFAULT 'completed'"
+    )
+    conn.execute(
+        "ALTER TABLE debates ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0"
+    )
+    conn.execute("ALTER TABLE debates ADD COLUMN final_score REAL")
+    conn.execute("DROP INDEX IF EXISTS idx_debates_created_at")
+    conn.execute(
+        "CREATE INDEX idx_debates_created_at ON debates (created_at, debate_id)"
+    )
+    conn.execute(
+        "CREATE INDEX idx_debates_mode ON debates (mode, created_at, debate_id)"
+    )
+    judgements: dict = {}
+    for debate_id, judgement in conn.execute(
+        "SELECT debate_id, judgement FROM messages ORDER BY debate_id, id"
+    ):
+        bucket = judgements.setdefault(debate_id, [])
+        if judgement is not None:
+            bucket.append(judgement)
+    conn.executemany(
+        "UPDATE debates SET message_count = "
+        "(SELECT COUNT(*) FROM messages WHERE messages.debate_id = debates.debate_id), "
+        "final_score = ? WHERE debate_id = ?",
+        [(_final_score(scores), debate_id) for debate_id, scores in judgements.items()],
+    )
+
+
+def _statements(script: str) -> list:
+    """Split a migration script into statements.
+
+    executescript would commit mid-transaction, so each statement runs on its own.
+    """
+    statements, buffer = [], ""
+    for piece in script.split(";"):
+        buffer += piece + ";"
+        if sqlite3.complete_statement(buffer):
+            if buffer.strip(" \n;"):
+                statements.append(buffer.strip())
+            buffer = ""
+    return statements
+
+
+# Applied in order; the 1-based position of each entry is its schema version.
+# Entries are either SQL scripts or callables taking the open connection.
+_MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS debates (
+        debate_id TEXT PRIMARY KEY,
+        motion TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        debate_id TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        stance TEXT,
+        judgement REAL,
+        message TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_messages_debate_id ON messages (debate_id, id);
+    CREATE INDEX IF NOT EXISTS idx_debates_created_at ON debates (created_at);
+    """,
+    _add_debate_summary_columns,
+    """
+    CREATE VIRTUAL TABLE messages_fts USING fts5(
+        message, content='messages', content_rowid='id', tokenize='porter unicode61'
+    );
+    CREATE TRIGGER messages_fts_insert AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts (rowid, message) VALUES (new.id, new.message);
+    END;
+    CREATE TRIGGER messages_fts_delete AFTER DELETE ON messages BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, message)
+        VALUES ('delete', old.id, old.message);
+    END;
+    CREATE TRIGGER messages_fts_update AFTER UPDATE OF message ON messages BEGIN
+        INSERT INTO messages_fts (messages_fts, rowid, message)
+        VALUES ('delete', old.id, old.message);
+        INSERT INTO messages_fts (rowid, message) VALUES (new.id, new.message);
+    END;
+    INSERT INTO messages_fts (messages_fts) VALUES ('rebuild');
+
+    CREATE VIRTUAL TABLE debates_fts USING fts5(
+        debate_id UNINDEXED, motion, tokenize='porter unicode61'
+    );
+    CREATE TRIGGER debates_fts_insert AFTER INSERT ON debates BEGIN
+        INSERT INTO debates_fts (debate_id, motion) VALUES (new.debate_id, new.motion);
+    END;
+    CREATE TRIGGER debates_fts_delete AFTER DELETE ON debates BEGIN
+        DELETE FROM debates_fts WHERE debate_id = old.debate_id;
+    END;
+    CREATE TRIGGER debates_fts_update AFTER UPDATE OF motion ON debates
+    WHEN old.motion IS NOT new.motion BEGIN
+        DELETE FROM debates_fts WHERE debate_id = old.debate_id;
+        INSERT INTO debates_fts (debate_id, motion) VALUES (new.debate_id, new.motion);
+    END;
+    INSERT INTO debates_fts (debate_id, motion) SELECT debate_id, motion FROM debates;
+    """,
+    """
+    ALTER TABLE messages ADD COLUMN seq INTEGER;
+    UPDATE messages SET seq = (
+        SELECT COUNT(*) FROM messages AS earlier
+        WHERE earlier.debate_id = messages.debate_id AND earlier.id < messages.id
+    );
+    """,
+    """
+    CREATE TABLE jobs (
+        job_id TEXT PRIMARY KEY,
+        request TEXT NOT NULL,
+        state TEXT NOT NULL DEFAULT 'queued',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 3,
+        lease_owner TEXT,
+        lease_expires_at REAL,
+        available_at REAL NOT NULL DEFAULT 0,
+        error TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX idx_jobs_state ON jobs (state, created_at, job_id);
+    """,
+    """
+    CREATE TABLE checkpoints (
+        debate_id TEXT PRIMARY KEY,
+        mode TEXT,
+        config TEXT,
+        turn INTEGER NOT NULL,
+        state BLOB NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    """,
+    """
+    CREATE TABLE expertise_cache (
+        motion_key TEXT NOT NULL,
+        provider TEXT NOT NULL,
+        model TEXT NOT NULL,
+        expertise TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        PRIMARY KEY (motion_key, provider, model)
+    );
+    """,
+    "ALTER TABLE messages ADD COLUMN metrics TEXT;",
+    """
+    ALTER TABLE jobs ADD COLUMN batch_id TEXT;
+    ALTER TABLE jobs ADD COLUMN batch_index INTEGER;
+    CREATE INDEX idx_jobs_batch ON jobs (batch_id, batch_index);
+    """,
+]
+
+_DEBATE_COLUMNS = (
+    "debate_id, motion, created_at, mode, status, message_count, final_score"
+)
+
+_JOB_COLUMNS = (
+    "job_id, request, state, attempts, max_attempts, lease_owner, lease_expires_at, "
+    "error, created_at, updated_at, batch_id, batch_index"
+)
+
+JOB_STATES = ("queued", "running", "completed", "failed", "cancelled")
+
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 134217728",
+)
+
+_BUSY_TIMEOUT = 5.0
+
+_migrated: set = set()
+_migrate_lock = threading.Lock()
+
+
+def _timed_query(method):
+    """Observe the method's latency in the SQLite query histogram of /metrics."""
+
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            SQLITE_QUERY_SECONDS.observe(elapsed, operation=method.__name__)
+
+    return timed
+
 
 class DebateStore:
     """SQLite-backed store for debates and their messages."""
 
     def __init__(self, db_path: str = _DEFAULT_DB):
         self.db_path = db_path
+        self._local = threading.local()
         self._init_db()
 
-    def _connect(self):
-        return sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening and tuning it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close the calling thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
 
     def _init_db(self):
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS debates (
-                    debate_id TEXT PRIMARY KEY,
-                    motion TEXT NOT NULL,
-                    created_at TEXT NOT NULL
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    debate_id TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    stance TEXT,
-                    judgement REAL,
-                    message TEXT NOT NULL
-                )
-                """
-            )
+        """
+        Bring the schema up to date. Other processes may open the same file at
+        the same moment (e.g. job workers), so the version is re-read and every
+        pending migration applied inside one BEGIN IMMEDIATE transaction, which
+        holds SQLite's write lock; a failed migration rolls back completely.
+        """
+        key = str(Path(self.db_path).resolve()) if self.db_path != ":memory:" else None
+        if key in _migrated:
+            return
+        with _migrate_lock:
+            if key in _migrated:
+                return
+            conn = self._connect()
+            if conn.execute("PRAGMA user_version").fetchone()[0] < len(_MIGRATIONS):
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    pending = _MIGRATIONS[version:]
+                    for target, step in enumerate(pending, start=version + 1):
+                        if callable(step):
+                            step(conn)
+                        else:
+                            for statement in _statements(step):
+                                conn.execute(statement)
+                        conn.execute(f"PRAGMA user_version = {target}")
+                except Exception:
+                    conn.rollback()
+                    raise
+                conn.commit()
+            if key is not None:
+                _migrated.add(key)
 
-    def save(self, history: DialogueHistory, motion: str):
-        """Upsert the debate row and insert all messages."""
+    @_timed_query
+    def save(
+        self,
+        history: DialogueHistory,
+        motion: str,
+        mode: Optional[str] = None,
+        status: str = "completed",
+    ):
+        """Upsert the debate row and insert all its messages.
+
+        A re-saved debate keeps its original created_at.
+        """
         if not history.messages:
             return
         debate_id = history.messages[0].debate_id
+        judgements = [m.judgement for m in history.messages if m.judgement is not None]
+        rows = [
+            (
+                msg.debate_id,
+                msg.seq if msg.seq is not None else position,
+                msg.timestamp.isoformat(),
+                msg.name,
+                msg.role,
+                msg.stance,
+                msg.judgement,
+                msg.message,
+                json.dumps(msg.metrics.to_dict()) if msg.metrics else None,
+            )
+            for position, msg in enumerate(history.messages)
+        ]
         with self._connect() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO debates (debate_id, motion, created_at) VALUES (?, ?, ?)",
-                (debate_id, motion, datetime.now().isoformat()),
+                f"INSERT INTO debates ({_DEBATE_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (debate_id) DO UPDATE SET motion = excluded.motion, "
+                "mode = COALESCE(excluded.mode, debates.mode), "
+                "status = excluded.status, "
+                "message_count = excluded.message_count, "
+                "final_score = excluded.final_score",
+                (
+                    debate_id,
+                    motion,
+                    datetime.now().isoformat(),
+                    mode,
+                    status,
+                    len(rows),
+                    _final_score(judgements),
+                ),
             )
             conn.execute("DELETE FROM messages WHERE debate_id = ?", (debate_id,))
-            for msg in history.messages:
-                conn.execute(
-                    "INSERT INTO messages (debate_id, timestamp, name, role, stance, judgement, message) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        msg.debate_id,
-                        msg.timestamp.isoformat(),
-                        msg.name,
-                        msg.role,
-                        msg.stance,
-                        msg.judgement,
-                        msg.message,
-                    ),
-                )
+            conn.executemany(
+                "INSERT INTO messages (debate_id, seq, timestamp, name, role, "
+                "stance, judgement, message, metrics) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
-    def load(self, debate_id: str) -> list:
-        """Load all messages for a debate."""
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT timestamp, name, role, stance, judgement, message, debate_id "
-                "FROM messages WHERE debate_id = ? ORDER BY id",
-                (debate_id,),
-            ).fetchall()
+    @_timed_query
+    def load(self, debate_id: str, after_seq: Optional[int] = None) -> list:
+        """Load a debate's messages, optionally only those with seq > *after_seq*."""
+        sql = (
+            "SELECT timestamp, name, role, stance, judgement, message, "
+            "debate_id, seq, metrics "
+            "FROM messages WHERE debate_id = ?"
+        )
+        params: list = [debate_id]
+        if after_seq is not None:
+            sql += " AND seq > ?"
+            params.append(after_seq)
+        rows = self._connect().execute(sql + " ORDER BY id", params).fetchall()
         messages = []
         for row in rows:
-            ts, name, role, stance, judgement, message, did = row
+            ts, name, role, stance, judgement, message, did, seq, metrics = row
             msg = DialogueMessage(
                 name=name,
                 role=role,
@@ -93,17 +364,491 @@ class DebateStore:
                 stance=stance or "neutral",
                 judgement=judgement,
                 timestamp=datetime.fromisoformat(ts),
+                seq=seq,
+                metrics=TurnMetrics.from_dict(json.loads(metrics)) if metrics else None,
             )
             messages.append(msg)
         return messages
 
-    def list_debates(self) -> list:
-        """Return a summary list of all stored debates."""
+    @_timed_query
+    def get_debate_meta(self, debate_id: str) -> Optional[dict]:
+        """Return the summary row for one debate by primary key, or None."""
+        row = self._connect().execute(
+            f"SELECT {_DEBATE_COLUMNS} FROM debates WHERE debate_id = ?", (debate_id,)
+        ).fetchone()
+        return _debate_row(row) if row else None
+
+    @_timed_query
+    def list_debates(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        mode: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        motion_prefix: Optional[str] = None,
+    ) -> list:
+        """Return debate summaries, newest first.
+
+        With no arguments, returns all of them.
+        """
+        where, params = [], []
+        if mode:
+            where.append("mode = ?")
+            params.append(mode)
+        if since:
+            where.append("created_at >= ?")
+            params.append(since)
+        if until:
+            where.append("created_at < ?")
+            params.append(until)
+        if motion_prefix:
+            escaped = (
+                motion_prefix.replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
+            )
+            where.append("motion LIKE ? ESCAPE '\\'")
+            params.append(escaped + "%")
+        if cursor:
+            where.append("(created_at, debate_id) < (?, ?)")
+            params.extend(_decode_cursor(cursor))
+        sql = f"SELECT {_DEBATE_COLUMNS} FROM debates"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_at DESC, debate_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self._connect().execute(sql, params).fetchall()
+        return [_debate_row(r) for r in rows]
+
+    @_timed_query
+    def page_debates(
+        self, limit: int = 50, cursor: Optional[str] = None, **filters
+    ) -> dict:
+        """Keyset-paginated listing: ``{"items": [...], "next_cursor": str | None}``."""
+        items = self.list_debates(limit=limit + 1, cursor=cursor, **filters)
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = _encode_cursor(
+                items[-1]["created_at"], items[-1]["debate_id"]
+            )
+        return {"items": items, "next_cursor": next_cursor}
+
+    @_timed_query
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        highlight: tuple = ("<mark>", "</mark>"),
+    ) -> list:
+        """
+        Full-text search over message bodies and motions, best match first.
+
+        Each hit is a dict with the debate summary fields plus ``kind``
+        ("message" or "motion"), the speaker ``name``/``role`` for message hits,
+        a ``snippet`` with matches wrapped in *highlight*, and its bm25 ``rank``.
+        """
+        match = _fts_query(query)
+        if not match:
+            return []
+        start, end = highlight
+        window = offset + limit
+        rows = self._connect().execute(
+            """
+            SELECT hits.kind, hits.name, hits.role, hits.snippet, hits.rank,
+                   d.debate_id, d.motion, d.created_at, d.mode
+            FROM (
+                SELECT * FROM (
+                    SELECT m.debate_id, 'message' AS kind, m.name, m.role,
+                           snippet(messages_fts, 0, ?, ?, '…', 16) AS snippet,
+                           messages_fts.rank AS rank
+                    FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid
+                    WHERE messages_fts MATCH ? ORDER BY messages_fts.rank LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT debate_id, 'motion' AS kind, NULL AS name, NULL AS role,
+                           snippet(debates_fts, 1, ?, ?, '…', 16) AS snippet,
+                           debates_fts.rank AS rank
+                    FROM debates_fts
+                    WHERE debates_fts MATCH ? ORDER BY debates_fts.rank LIMIT ?
+                )
+            ) AS hits JOIN debates d ON d.debate_id = hits.debate_id
+            ORDER BY hits.rank LIMIT ? OFFSET ?
+            """,
+            (start, end, match, window, start, end, match, window, limit, offset),
+        ).fetchall()
+        return [
+            {
+                "kind": kind,
+                "name": name,
+                "role": role,
+                "snippet": snippet,
+                "rank": rank,
+                "debate_id": debate_id,
+                "motion": motion,
+                "created_at": created_at,
+                "mode": mode,
+            }
+            for (
+                kind, name, role, snippet, rank, debate_id, motion, created_at, mode
+            ) in rows
+        ]
+
+    # ── Job queue ────────────────────────────────────────────────────────────
+    # Debate jobs use the debate id as their job id. A job is claimed under a
+    # lease that its worker keeps renewing; a job whose lease runs out (the
+    # worker died, e.g. in a restart) is claimable again until it has used up
+    # max_attempts.
+
+    @_timed_query
+    def enqueue_job(self, job_id: str, request: dict, max_attempts: int = 3) -> dict:
+        """Queue a job; *request* is stored as JSON and handed back to the worker."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs "
+                "(job_id, request, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(request), max_attempts, now, now),
+            )
+        return self.get_job(job_id)
+
+    @_timed_query
+    def enqueue_batch(self, batch_id: str, jobs: list, max_attempts: int = 3) -> None:
+        """Queue ``(job_id, request)`` pairs as one batch, in a single transaction."""
+        now = datetime.now().isoformat()
         with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT debate_id, motion, created_at FROM debates ORDER BY created_at DESC"
-            ).fetchall()
-        return [{"debate_id": r[0], "motion": r[1], "created_at": r[2]} for r in rows]
+            conn.executemany(
+                "INSERT INTO jobs (job_id, request, max_attempts, created_at, "
+                "updated_at, batch_id, batch_index) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (job_id, json.dumps(request), max_attempts, now, now, batch_id, i)
+                    for i, (job_id, request) in enumerate(jobs)
+                ],
+            )
+
+    @_timed_query
+    def claim_job(self, owner: str, lease_seconds: float) -> Optional[dict]:
+        """
+        Atomically claim the oldest runnable job for *owner*: a queued job, or a
+        running one whose lease has expired. Returns the claimed job or None.
+        """
+        now = time.time()
+        stamp = datetime.now().isoformat()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE jobs SET state = 'failed', lease_owner = NULL, updated_at = ?, "
+                "error = COALESCE(error, 'lease expired on the final attempt') "
+                "WHERE state = 'running' AND lease_expires_at < ? "
+                "AND attempts >= max_attempts",
+                (stamp, now),
+            )
+            row = conn.execute(
+                "SELECT job_id FROM jobs "
+                "WHERE (state = 'queued' AND available_at <= ?) "
+                "OR (state = 'running' AND lease_expires_at < ?) "
+                "ORDER BY created_at, job_id LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET state = 'running', attempts = attempts + 1, "
+                    "lease_owner = ?, lease_expires_at = ?, updated_at = ? "
+                    "WHERE job_id = ?",
+                    (owner, now + lease_seconds, stamp, row[0]),
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return self.get_job(row[0]) if row is not None else None
+
+    @_timed_query
+    def renew_lease(self, job_id: str, owner: str, lease_seconds: float) -> bool:
+        """Extend *owner*'s lease on a running job; False if the lease was lost."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? "
+                "WHERE job_id = ? AND lease_owner = ? AND state = 'running'",
+                (time.time() + lease_seconds, job_id, owner),
+            )
+        return cur.rowcount == 1
+
+    @_timed_query
+    def complete_job(self, job_id: str, owner: str, state: str = "completed",
+                     error: Optional[str] = None) -> bool:
+        """Record the final *state* of a job still leased by *owner*."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET state = ?, error = ?, lease_owner = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE job_id = ? AND lease_owner = ? AND state = 'running'",
+                (state, error, datetime.now().isoformat(), job_id, owner),
+            )
+        return cur.rowcount == 1
+
+    @_timed_query
+    def fail_job(
+        self, job_id: str, owner: str, error: str, retry_delay: float = 0.0
+    ) -> str:
+        """Requeue a failed attempt after *retry_delay* seconds, or fail it for good."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts < max_attempts "
+                "THEN 'queued' ELSE 'failed' END, "
+                "error = ?, available_at = ?, lease_owner = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE job_id = ? AND lease_owner = ? AND state = 'running'",
+                (error, time.time() + retry_delay, now, job_id, owner),
+            )
+        job = self.get_job(job_id)
+        return job["state"] if job else "failed"
+
+    @_timed_query
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel a job that has not been claimed yet."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET state = 'cancelled', updated_at = ? "
+                "WHERE job_id = ? AND state = 'queued'",
+                (datetime.now().isoformat(), job_id),
+            )
+        return cur.rowcount == 1
+
+    @_timed_query
+    def cancel_batch(self, batch_id: str) -> int:
+        """Cancel a batch's jobs that have not been claimed yet; returns how many."""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET state = 'cancelled', updated_at = ? "
+                "WHERE batch_id = ? AND state = 'queued'",
+                (datetime.now().isoformat(), batch_id),
+            )
+        return cur.rowcount
+
+    @_timed_query
+    def batch_jobs(self, batch_id: str) -> list:
+        """A batch's jobs in submission order, with their debates' ``final_score``."""
+        rows = self._connect().execute(
+            f"SELECT {_JOB_COLUMNS}, "
+            "(SELECT final_score FROM debates WHERE debates.debate_id = jobs.job_id) "
+            "FROM jobs WHERE batch_id = ? ORDER BY batch_index",
+            (batch_id,),
+        ).fetchall()
+        jobs = []
+        for row in rows:
+            job = _job_row(row[:-1])
+            job["final_score"] = row[-1]
+            jobs.append(job)
+        return jobs
+
+    @_timed_query
+    def get_job(self, job_id: str) -> Optional[dict]:
+        row = self._connect().execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return _job_row(row) if row else None
+
+    @_timed_query
+    def list_jobs(self, state: Optional[str] = None, limit: int = 50) -> list:
+        """Jobs, oldest first, optionally only those in *state*."""
+        sql = f"SELECT {_JOB_COLUMNS} FROM jobs"
+        params: list = []
+        if state:
+            sql += " WHERE state = ?"
+            params.append(state)
+        sql += " ORDER BY created_at, job_id LIMIT ?"
+        params.append(limit)
+        return [_job_row(r) for r in self._connect().execute(sql, params).fetchall()]
+
+    @_timed_query
+    def job_stats(self) -> dict:
+        """Job counts per state, plus the creation time of the oldest queued job."""
+        conn = self._connect()
+        counts = dict.fromkeys(JOB_STATES, 0)
+        rows = conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state")
+        counts.update(rows.fetchall())
+        oldest = conn.execute(
+            "SELECT MIN(created_at) FROM jobs WHERE state = 'queued'"
+        ).fetchone()[0]
+        return {"counts": counts, "oldest_queued_at": oldest}
+
+    # ── Checkpoints ──────────────────────────────────────────────────────────
+    # One row per debate, overwritten after every completed turn. The state is
+    # Debate.checkpoint() as zlib-compressed JSON; participants' chat histories
+    # repeat the transcript, so it compresses well.
+
+    @_timed_query
+    def save_checkpoint(self, debate_id: str, state: dict, mode: Optional[str] = None,
+                        config: Optional[dict] = None):
+        blob = zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO checkpoints "
+                "(debate_id, mode, config, turn, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (debate_id) DO UPDATE SET mode = excluded.mode, "
+                "config = excluded.config, turn = excluded.turn, "
+                "state = excluded.state, updated_at = excluded.updated_at",
+                (debate_id, mode, json.dumps(config) if config is not None else None,
+                 state.get("turn", 0), blob, datetime.now().isoformat()),
+            )
+
+    @_timed_query
+    def load_checkpoint(self, debate_id: str) -> Optional[dict]:
+        """The saved checkpoint, or None.
+
+        Keys: ``debate_id``, ``mode``, ``config``, ``turn``, ``state``, ``updated_at``.
+        """
+        row = self._connect().execute(
+            "SELECT debate_id, mode, config, turn, state, updated_at "
+            "FROM checkpoints WHERE debate_id = ?",
+            (debate_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        did, mode, config, turn, blob, updated_at = row
+        return {
+            "debate_id": did,
+            "mode": mode,
+            "config": json.loads(config) if config else None,
+            "turn": turn,
+            "state": json.loads(zlib.decompress(blob)),
+            "updated_at": updated_at,
+        }
+
+    @_timed_query
+    def delete_checkpoint(self, debate_id: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE debate_id = ?", (debate_id,))
+
+    # ── Judge expertise cache (see autodebater.expertise_cache) ──────────────
+
+    @_timed_query
+    def get_expertise(
+        self, motion_key: str, provider: str, model: str
+    ) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT expertise FROM expertise_cache "
+            "WHERE motion_key = ? AND provider = ? AND model = ?",
+            (motion_key, provider, model),
+        ).fetchone()
+        return row[0] if row else None
+
+    @_timed_query
+    def put_expertise(self, motion_key: str, provider: str, model: str, expertise: str):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO expertise_cache "
+                "(motion_key, provider, model, expertise, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (motion_key, provider, model, expertise, datetime.now().isoformat()),
+            )
+
+
+class AsyncDebateStore:
+    """
+    Awaitable facade over a DebateStore for use from async code.
+
+    Every public method of the wrapped store is exposed as a coroutine that runs
+    on the shared I/O executor, e.g. ``await AsyncDebateStore(store).load(id)``.
+    """
+
+    def __init__(self, store: DebateStore):
+        self.store = store
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.store, name)
+
+        async def call(*args, **kwargs):
+            return await run_io(method, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+
+def _fts_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 query: every term is quoted (so FTS syntax
+    characters are literal) and terms are ANDed; a trailing ``*`` keeps prefix search.
+    """
+    terms = []
+    for token in query.split():
+        prefix = token.endswith("*")
+        token = token.rstrip("*").replace('"', '""')
+        if token:
+            terms.append(f'"{token}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _debate_row(row) -> dict:
+    debate_id, motion, created_at, mode, status, message_count, final_score = row
+    return {
+        "debate_id": debate_id,
+        "motion": motion,
+        "created_at": created_at,
+        "mode": mode,
+        "status": status,
+        "message_count": message_count,
+        "final_score": final_score,
+    }
+
+
+def _job_row(row) -> dict:
+    (job_id, request, state, attempts, max_attempts, lease_owner, lease_expires_at,
+     error, created_at, updated_at, batch_id, batch_index) = row
+    return {
+        "job_id": job_id,
+        "request": json.loads(request),
+        "state": state,
+        "attempts": attempts,
+        "max_attempts": max_attempts,
+        "lease_owner": lease_owner,
+        "lease_expires_at": lease_expires_at,
+        "error": error,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "batch_id": batch_id,
+        "batch_index": batch_index,
+    }
+
+
+def _metrics_line(metrics: TurnMetrics) -> str:
+    parts = [f"{metrics.latency_ms:.0f} ms",
+             f"{metrics.input_tokens} in / {metrics.output_tokens} out tokens"]
+    if metrics.cached_tokens:
+        parts.append(f"{metrics.cached_tokens} cached")
+    if metrics.tool_iterations:
+        parts.append(f"{metrics.tool_iterations} tool calls")
+    if metrics.cost_usd is not None:
+        parts.append(f"${metrics.cost_usd:.4f}")
+    return " · ".join(parts)
+
+
+def _encode_cursor(created_at: str, debate_id: str) -> str:
+    raw = json.dumps([created_at, debate_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        created_at, debate_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    return created_at, debate_id
 
 
 class DebateExporter:
@@ -121,6 +866,8 @@ class DebateExporter:
             score_tag = f" [score: {msg.judgement}]" if msg.judgement is not None else ""
             lines.append(f"## {msg.name} — {msg.role}{stance_tag}{score_tag}\n")
             lines.append(f"{msg.message}\n")
+            if msg.metrics:
+                lines.append(f"_{_metrics_line(msg.metrics)}_\n")
         return "\n".join(lines)
 
     @staticmethod
@@ -0,0 +1,35 @@
+"""
+Cost estimates for LLM calls, from the per-model price table in defaults.yaml.
+"""
+
+from typing import Optional
+
+from autodebater.defaults import MODEL_PRICES
+
+
+def model_price(model: Optional[str]) -> Optional[tuple]:
+    """(input, output, cached input) USD per million tokens, by longest name prefix."""
+    if not model:
+        return None
+    matches = [name for name in MODEL_PRICES if model.startswith(name)]
+    if not matches:
+        return None
+    return tuple(MODEL_PRICES[max(matches, key=len)])
+
+
+def estimate_cost(provider: str, model: Optional[str], input_tokens: int,
+                  output_tokens: int, cached_tokens: int = 0) -> Optional[float]:
+    """Estimated USD for the given usage; None when the model has no known price."""
+    if provider == "stub":
+        return 0.0
+    price = model_price(model)
+    if price is None:
+        return None
+    input_price, output_price, cached_price = price
+    uncached = max(input_tokens - cached_tokens, 0)
+    cost = (
+        uncached * input_price
+        + cached_tokens * cached_price
+        + output_tokens * output_price
+    ) / 1e6
+    return round(cost, 6)
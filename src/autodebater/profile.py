@@ -2,16 +2,37 @@
 Persistent user profile / context store.
 
 The profile is a plain markdown file at ~/.autodebater/profile.md (or the path
-set by the AUTODEBATER_PROFILE env var).  Its contents are injected into every
-participant's system prompt so the LLMs can give context-aware responses to
-personal or domain-specific questions.
+set by the AUTODEBATER_PROFILE env var).  Its contents are given to every
+participant as a system message after its own system prompt, so the LLMs can
+give context-aware responses to personal or domain-specific questions.
+
+Loaded profiles are cached per process and revalidated with a single stat():
+the file is only re-read when its mtime or size changes.
 """
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+from autodebater.concurrency import run_io
+
 DEFAULT_PROFILE_PATH = Path.home() / ".autodebater" / "profile.md"
 
+# path -> (st_mtime_ns, st_size, content)
+_cache: dict = {}
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def context_message(context: str) -> tuple:
+    """
+    The "User Context" system message that follows each participant's own
+    system prompt. Memoised, so every participant given the same context
+    holds this one message instead of a private copy of the text.
+    """
+    return ("system", f"## User Context\n{context}")
+
 
 class ProfileStore:
     def __init__(self, path: str | None = None):
@@ -21,14 +42,37 @@ class ProfileStore:
 
     def load(self) -> str | None:
         """Return profile text, or None if the file is absent or empty."""
-        if self.path.exists():
-            content = self.path.read_text(encoding="utf-8").strip()
-            return content if content else None
-        return None
+        key = str(self.path)
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            with _cache_lock:
+                _cache.pop(key, None)
+            return None
+        cached = _cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        return self._read(key, stat)
+
+    def _read(self, key: str, stat) -> str | None:
+        content = self.path.read_text(encoding="utf-8").strip()
+        content = content or None
+        with _cache_lock:
+            _cache[key] = (stat.st_mtime_ns, stat.st_size, content)
+        return content
 
     def save(self, content: str) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(content, encoding="utf-8")
+        self._read(str(self.path), self.path.stat())
+
+    async def aload(self) -> str | None:
+        """Async-safe load(): the file read runs on the shared I/O executor."""
+        return await run_io(self.load)
+
+    async def asave(self, content: str) -> None:
+        """Async-safe save(): the file write runs on the shared I/O executor."""
+        await run_io(self.save, content)
 
     def exists(self) -> bool:
         return self.path.exists() and self.path.stat().st_size > 0
@@ -2,6 +2,9 @@
 CLI entry point for debates
 """
 
+import statistics
+from contextlib import contextmanager
+from functools import reduce
 from pathlib import Path
 from typing import List, Optional
 
@@ -9,13 +12,17 @@ import typer
 from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.table import Table
 
 from autodebater.debate_runners import (BasicJudgedDebateRunner, BasicSimpleDebateRunner,
-                                        ExpertPanelRunner, RunnerConfig)
-from autodebater.dialogue import DialogueMessage
+                                        ExpertPanelRunner, RunnerConfig, runner_for)
+from autodebater.dialogue import DialogueHistory, DialogueMessage
 from autodebater.persistence import DebateExporter
 from autodebater.profile import ProfileStore
+from autodebater.scoring import JudgingCadence
+from autodebater.stopping import from_spec
+from autodebater.tracing import Tracer
 
 app = typer.Typer()
 
@@ -35,6 +42,120 @@ def _load_context(context_file: Optional[str], no_profile: bool) -> Optional[str
     return None
 
 
+_JUDGING_HELP = "How often judges score: message, epoch, every:k or end"
+
+_STOP_HELP = ("Stop early when a policy fires, e.g. 'stability:window=3,tolerance=2', "
+              "'threshold:high=85', 'ci:max_width=10' (repeat for several)")
+
+
+def _stopping_specs(stop: Optional[List[str]]) -> Optional[List[dict]]:
+    try:
+        return [from_spec(s).spec() for s in stop] if stop else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--stop") from exc
+
+
+def _judging_cadence(judging: str) -> str:
+    try:
+        return JudgingCadence(judging).spec
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--judging") from exc
+
+
+_METRICS_HELP = (
+    "Print per-participant latency, token usage and estimated cost at the end"
+)
+
+
+def metrics_table(history: DialogueHistory) -> Table:
+    """Per-participant totals of the metrics recorded on each message."""
+    table = Table("name", "turns", "llm calls", "tokens in", "tokens out", "cached",
+                  "latency (s)", "mean ttft (ms)", "tool iters", "cost ($)")
+    totals = []
+    for name, turns in history.metrics_by_participant().items():
+        total = reduce(lambda a, b: a.merge(b), turns)
+        ttfts = [m.ttft_ms for m in turns if m.ttft_ms is not None]
+        totals.append(total)
+        table.add_row(
+            name,
+            str(len(turns)),
+            str(total.llm_calls),
+            str(total.input_tokens),
+            str(total.output_tokens),
+            str(total.cached_tokens),
+            f"{total.latency_ms / 1000:.2f}",
+            f"{statistics.mean(ttfts):.0f}" if ttfts else "-",
+            str(total.tool_iterations),
+            f"{total.cost_usd:.4f}" if total.cost_usd is not None else "-",
+        )
+    if totals:
+        total = reduce(lambda a, b: a.merge(b), totals)
+        table.add_row(
+            "total",
+            "",
+            str(total.llm_calls),
+            str(total.input_tokens),
+            str(total.output_tokens),
+            str(total.cached_tokens),
+            f"{total.latency_ms / 1000:.2f}",
+            "",
+            str(total.tool_iterations),
+            f"{total.cost_usd:.4f}" if total.cost_usd is not None else "-",
+        )
+    return table
+
+
+_TRACE_HELP = (
+    "Write a trace of the debate to this file "
+    "(.json: Chrome trace, .jsonl: one span per line)"
+)
+
+
+@contextmanager
+def _traced(runner, trace_file: Optional[str]):
+    """With --trace, record the debate's spans and write them out when it ends."""
+    if not trace_file:
+        yield
+        return
+    tracer = Tracer().attach(runner.debate.hooks)
+    try:
+        yield
+    finally:
+        tracer.detach()
+        tracer.export(runner.debate.debate_id, trace_file)
+        typer.echo(f"Trace written to {trace_file}")
+
+
+def _checkpoint_store(runner, save: bool):
+    """With --save, checkpoint the debate to the default store after every turn."""
+    if not save:
+        return None
+    from autodebater.persistence import DebateStore
+    store = DebateStore()
+    runner.checkpoint_to(store)
+    return store
+
+
+@contextmanager
+def _resume_hint(runner, store):
+    """Point at `resume` if a checkpointed debate dies part-way through."""
+    try:
+        yield
+    except Exception:
+        if store is not None:
+            typer.echo(
+                "Debate interrupted; continue it with: "
+                f"autodebater resume {runner.debate.debate_id}",
+                err=True,
+            )
+        raise
+
+
+def _finish_saved(store, runner, motion: str, mode: str):
+    store.save(runner.debate.dialogue_history, motion, mode=mode)
+    store.delete_checkpoint(runner.debate.debate_id)
+
+
 @app.command()
 def judged_debate(
     motion: str,
@@ -49,9 +170,23 @@ def judged_debate(
     use_tools: bool = typer.Option(False, "--use-tools/--no-use-tools", help="Enable LangChain tool use for debaters"),
     context_file: Optional[str] = typer.Option(None, "--context-file", help="Path to a text/markdown file injected as context"),
     no_profile: bool = typer.Option(False, "--no-profile", help="Skip auto-loading the persistent profile"),
+    stop: Optional[List[str]] = typer.Option(None, "--stop", help=_STOP_HELP),
+    judging: str = typer.Option("message", "--judging", help=_JUDGING_HELP),
+    metrics: bool = typer.Option(False, "--metrics/--no-metrics", help=_METRICS_HELP),
+    trace: Optional[str] = typer.Option(None, "--trace", help=_TRACE_HELP),
+    expertise_cache: bool = typer.Option(
+        True, "--expertise-cache/--no-expertise-cache",
+        help="Reuse the judge expertise discovered earlier for this motion and model",
+    ),
 ):
     """Start a new judged debate with the given motion and epochs."""
     runner_kwargs = {"context": _load_context(context_file, no_profile)}
+    if not expertise_cache:
+        runner_kwargs["expertise_cache"] = False
+    if judging != "message":
+        runner_kwargs["judging"] = _judging_cadence(judging)
+    if stop:
+        runner_kwargs["stopping"] = _stopping_specs(stop)
     if debater_prompt:
         runner_kwargs["debater_prompt"] = debater_prompt
     if judge_prompt:
@@ -64,11 +199,13 @@ def judged_debate(
         runner_kwargs["use_tools"] = True
 
     debate_runner = BasicJudgedDebateRunner(motion=motion, epochs=epochs, llm=llm, **runner_kwargs)
+    store = _checkpoint_store(debate_runner, save)
 
     typer.echo(f"Starting debate on: {motion}")
 
     table = Table("name", "role", "stance", "judgement", "message", show_lines=True)
-    with Live(table, auto_refresh=False, vertical_overflow="visible") as live:
+    with _resume_hint(debate_runner, store), _traced(debate_runner, trace), \
+            Live(table, auto_refresh=False, vertical_overflow="visible") as live:
         for msg in debate_runner.run_debate():
             table.add_row(
                 msg.name,
@@ -86,10 +223,10 @@ def judged_debate(
             live.update(table, refresh=True)
 
     history = debate_runner.debate.dialogue_history
+    if metrics:
+        Console().print(metrics_table(history))
     if save:
-        from autodebater.persistence import DebateStore
-        store = DebateStore()
-        store.save(history, motion)
+        _finish_saved(store, debate_runner, motion, "judged")
         typer.echo(f"Debate saved (id={debate_runner.debate.debate_id})")
 
     if output_file:
@@ -111,6 +248,8 @@ def simple_debate(
     use_tools: bool = typer.Option(False, "--use-tools/--no-use-tools", help="Enable LangChain tool use for debaters"),
     context_file: Optional[str] = typer.Option(None, "--context-file", help="Path to a text/markdown file injected as context"),
     no_profile: bool = typer.Option(False, "--no-profile", help="Skip auto-loading the persistent profile"),
+    metrics: bool = typer.Option(False, "--metrics/--no-metrics", help=_METRICS_HELP),
+    trace: Optional[str] = typer.Option(None, "--trace", help=_TRACE_HELP),
 ):
     """Start a new simple debate with the given motion and epochs."""
     runner_kwargs = {"context": _load_context(context_file, no_profile)}
@@ -124,19 +263,21 @@ def simple_debate(
         runner_kwargs["use_tools"] = True
 
     debate_runner = BasicSimpleDebateRunner(motion=motion, epochs=epochs, llm=llm, **runner_kwargs)
+    store = _checkpoint_store(debate_runner, save)
 
     typer.echo(f"Starting debate on: {motion}")
     console = Console()
 
-    for msg in debate_runner.run_debate():
-        table = msg2table(msg)
-        console.print(table)
+    with _resume_hint(debate_runner, store), _traced(debate_runner, trace):
+        for msg in debate_runner.run_debate():
+            table = msg2table(msg)
+            console.print(table)
 
     history = debate_runner.debate.dialogue_history
+    if metrics:
+        console.print(metrics_table(history))
     if save:
-        from autodebater.persistence import DebateStore
-        store = DebateStore()
-        store.save(history, motion)
+        _finish_saved(store, debate_runner, motion, "simple")
         typer.echo(f"Debate saved (id={debate_runner.debate.debate_id})")
 
     if output_file:
@@ -159,6 +300,10 @@ def panel_debate(
                                    help="Enable web search tools for participants (default: on)"),
     context_file: Optional[str] = typer.Option(None, "--context-file", help="Path to a text/markdown file injected as context"),
     no_profile: bool = typer.Option(False, "--no-profile", help="Skip auto-loading the persistent profile"),
+    stop: Optional[List[str]] = typer.Option(None, "--stop", help=_STOP_HELP),
+    judging: str = typer.Option("message", "--judging", help=_JUDGING_HELP),
+    metrics: bool = typer.Option(False, "--metrics/--no-metrics", help=_METRICS_HELP),
+    trace: Optional[str] = typer.Option(None, "--trace", help=_TRACE_HELP),
 ):
     """Start an expert panel discussion aimed at finding a nuanced answer."""
     config = RunnerConfig(
@@ -167,12 +312,16 @@ def panel_debate(
         domains=domains or None,
         use_tools=use_tools,
         context=_load_context(context_file, no_profile),
+        stopping=_stopping_specs(stop),
+        judging=_judging_cadence(judging),
     )
     runner = ExpertPanelRunner(config)
+    store = _checkpoint_store(runner, save)
     typer.echo(f"Starting expert panel on: {motion}")
 
     table = Table("name", "domain/role", "convergence", "message", show_lines=True)
-    with Live(table, auto_refresh=False, vertical_overflow="visible") as live:
+    with _resume_hint(runner, store), _traced(runner, trace), \
+            Live(table, auto_refresh=False, vertical_overflow="visible") as live:
         for msg in runner.run_debate():
             domain_or_role = getattr(
                 next((p for p in runner.debate.debaters if p.name == msg.name), None),
@@ -187,9 +336,10 @@ def panel_debate(
             live.update(table, refresh=True)
 
     history = runner.debate.dialogue_history
+    if metrics:
+        Console().print(metrics_table(history))
     if save:
-        from autodebater.persistence import DebateStore
-        DebateStore().save(history, motion)
+        _finish_saved(store, runner, motion, "panel")
         typer.echo(f"Panel saved (id={runner.debate.debate_id})")
     if output_file:
         fmt = "md" if output_file.endswith(".md") else "json"
@@ -197,5 +347,114 @@ def panel_debate(
         typer.echo(f"Panel exported to {output_file}")
 
 
+@app.command()
+def resume(
+    debate_id: str,
+    db: str = typer.Option(
+        "debates.db", "--db", help="Path to the SQLite debate store"
+    ),
+    output_file: Optional[str] = typer.Option(
+        None, "--output-file", help="Export debate to file (json or md)"
+    ),
+    metrics: bool = typer.Option(False, "--metrics/--no-metrics", help=_METRICS_HELP),
+    trace: Optional[str] = typer.Option(None, "--trace", help=_TRACE_HELP),
+):
+    """Continue a debate started with --save from its last completed turn."""
+    from autodebater.persistence import DebateStore
+
+    store = DebateStore(db_path=db)
+    checkpoint = store.load_checkpoint(debate_id)
+    if checkpoint is None:
+        typer.echo(f"No checkpoint for debate {debate_id}.", err=True)
+        raise typer.Exit(code=1)
+    config = RunnerConfig(**checkpoint["config"])
+    runner = runner_for(checkpoint["mode"], config).resume(checkpoint["state"])
+    runner.checkpoint_to(store)
+    typer.echo(f"Resuming debate on: {config.motion} (after turn {checkpoint['turn']})")
+
+    console = Console()
+    with _resume_hint(runner, store), _traced(runner, trace):
+        for msg in runner.run_debate():
+            console.print(msg2table(msg))
+
+    if metrics:
+        console.print(metrics_table(runner.debate.dialogue_history))
+    _finish_saved(store, runner, config.motion, checkpoint["mode"])
+    typer.echo(f"Debate saved (id={debate_id})")
+    if output_file:
+        fmt = "md" if output_file.endswith(".md") else "json"
+        DebateExporter.export_file(runner.debate.dialogue_history, output_file, fmt)
+        typer.echo(f"Debate exported to {output_file}")
+
+
+@app.command()
+def search(
+    query: str,
+    limit: int = typer.Option(20, "--limit", help="Maximum number of hits to show"),
+    offset: int = typer.Option(0, "--offset", help="Skip this many hits (for paging)"),
+    db: str = typer.Option(
+        "debates.db", "--db", help="Path to the SQLite debate store"
+    ),
+):
+    """Full-text search over saved debates (messages and motions)."""
+    from autodebater.persistence import DebateStore
+
+    marks = ("\x02", "\x03")
+    hits = DebateStore(db_path=db).search(
+        query, limit=limit, offset=offset, highlight=marks
+    )
+    if not hits:
+        typer.echo("No matches.")
+        return
+    table = Table("debate_id", "motion", "speaker", "snippet", show_lines=True)
+    for hit in hits:
+        snippet = (
+            escape(hit["snippet"])
+            .replace(marks[0], "[reverse]")
+            .replace(marks[1], "[/reverse]")
+        )
+        speaker = (
+            f"{hit['name']} ({hit['role']})" if hit["kind"] == "message" else "motion"
+        )
+        table.add_row(hit["debate_id"], escape(hit["motion"]), speaker, snippet)
+    Console().print(table)
+
+
+@app.command()
+def mock_server(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to listen on"),
+    port: int = typer.Option(8100, "--port", help="Port to listen on"),
+    latency_ms: Optional[float] = typer.Option(
+        None, "--latency-ms", help="Mean time to first token"
+    ),
+    tokens_per_second: Optional[float] = typer.Option(
+        None, "--tokens-per-second", help="Output rate (0 = instant)"
+    ),
+    jitter: Optional[float] = typer.Option(
+        None, "--jitter", help="Std-dev of the latency multiplier"
+    ),
+    error_rate: Optional[float] = typer.Option(
+        None, "--error-rate", help="Fraction of requests answered with HTTP 500"
+    ),
+    seed: Optional[int] = typer.Option(
+        None, "--seed", help="Seed for reproducible scores, errors and timing"
+    ),
+):
+    """Serve mock OpenAI and Anthropic APIs backed by the stub provider."""
+    import uvicorn
+
+    from autodebater.mock_server import create_app
+    from autodebater.stub_llm import StubConfig
+
+    overrides = {"latency_ms": latency_ms, "tokens_per_second": tokens_per_second,
+                 "jitter": jitter, "error_rate": error_rate, "seed": seed}
+    config = StubConfig.from_env(
+        **{k: v for k, v in overrides.items() if v is not None}
+    )
+    typer.echo(f"OpenAI:    AUTODEBATER_OPENAI_BASE_URL=http://{host}:{port}/v1")
+    typer.echo(f"Anthropic: AUTODEBATER_ANTHROPIC_BASE_URL=http://{host}:{port}")
+    uvicorn.run(create_app(config), host=host, port=port, log_level="warning")
+
+
 if __name__ == "__main__":
     app()
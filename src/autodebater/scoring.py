@@ -11,3 +11,47 @@ def geometric_mean(scores):
     for score in adjusted_scores:
         product *= score
     return product ** (1.0 / len(adjusted_scores))
+
+
+class JudgingCadence:
+    """
+    How often judges score a debate:
+
+    - ``message``: after every debater message (the default)
+    - ``epoch``: once every debater has spoken in the round
+    - ``every:k``: after every k-th turn
+    - ``end``: once, after the final turn
+
+    Between scoring points judges only observe the messages. The final turn is
+    always scored, so the last running score covers the whole debate.
+    """
+
+    def __init__(self, spec: str = "message"):
+        kind, _, arg = (spec or "message").strip().partition(":")
+        if kind == "every":
+            try:
+                self.every = int(arg)
+            except ValueError:
+                self.every = 0
+            if self.every < 1:
+                raise ValueError(
+                    "Judging cadence 'every:k' needs a positive integer k, "
+                    f"got {spec!r}"
+                )
+        elif kind not in ("message", "epoch", "end") or arg:
+            raise ValueError(
+                f"Unknown judging cadence {spec!r}; "
+                "expected message, epoch, every:k or end"
+            )
+        self.kind = kind
+        self.spec = spec
+
+    def due(self, turn: int, steps: int, debaters: int) -> bool:
+        """Whether judges score after *turn* (1-based) of *steps* turns."""
+        if turn >= steps or self.kind == "message":
+            return True
+        if self.kind == "epoch":
+            return turn % debaters == 0
+        if self.kind == "every":
+            return turn % self.every == 0
+        return False
@@ -0,0 +1,136 @@
+"""
+Early-termination policies for judged debates and expert panels.
+
+After every completed turn the debate asks each of its policies whether the
+outcome is already settled. The first one that answers with a reason ends the
+debate: the reason is recorded in the transcript and the moderator moves
+straight to its closing statement, saving the remaining turns' LLM calls.
+
+Policies see two series: the running score after each turn (``trace``) and
+every individual judge score so far (``scores``).
+"""
+
+import math
+import statistics
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class StoppingPolicy(ABC):
+    """Decides, after each turn, whether a debate can stop early."""
+
+    name: str
+
+    @abstractmethod
+    def check(self, trace: list, scores: list) -> Optional[str]:
+        """Return a human-readable reason to stop, or None to keep going."""
+
+    def spec(self) -> dict:
+        """JSON-serialisable form, accepted back by from_spec()."""
+        return {"policy": self.name, **vars(self)}
+
+
+class ScoreStability(StoppingPolicy):
+    """
+    Stop once the running score has moved less than *tolerance* over the last
+    *window* turns.
+    """
+
+    name = "stability"
+
+    def __init__(self, window: int = 3, tolerance: float = 2.0):
+        self.window = int(window)
+        self.tolerance = float(tolerance)
+
+    def check(self, trace, scores):
+        if len(trace) < self.window:
+            return None
+        recent = trace[-self.window:]
+        if max(recent) - min(recent) <= self.tolerance:
+            return (f"running score stable within {self.tolerance:g} points "
+                    f"over the last {self.window} turns")
+        return None
+
+
+class ScoreThreshold(StoppingPolicy):
+    """
+    Stop once the running score reaches *high* (or falls to *low*), e.g. a
+    panel's convergence threshold or a debate decided clearly for one side.
+    """
+
+    name = "threshold"
+
+    def __init__(self, high: Optional[float] = 80.0, low: Optional[float] = None):
+        self.high = float(high) if high is not None else None
+        self.low = float(low) if low is not None else None
+
+    def check(self, trace, scores):
+        if not trace:
+            return None
+        score = trace[-1]
+        if self.high is not None and score >= self.high:
+            return f"running score {score:.1f} reached {self.high:g}"
+        if self.low is not None and score <= self.low:
+            return f"running score {score:.1f} fell to {self.low:g}"
+        return None
+
+
+class ConfidenceInterval(StoppingPolicy):
+    """
+    Stop once the confidence interval of the mean judge score is narrower than
+    *max_width*.
+    """
+
+    name = "ci"
+
+    def __init__(
+        self, max_width: float = 10.0, confidence: float = 0.95, min_scores: int = 4
+    ):
+        self.max_width = float(max_width)
+        self.confidence = float(confidence)
+        self.min_scores = int(min_scores)
+
+    def check(self, trace, scores):
+        if len(scores) < max(self.min_scores, 2):
+            return None
+        z = statistics.NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        width = 2 * z * statistics.stdev(scores) / math.sqrt(len(scores))
+        if width <= self.max_width:
+            return (f"{self.confidence:.0%} confidence interval of the mean score is "
+                    f"{width:.1f} points wide (limit {self.max_width:g})")
+        return None
+
+
+POLICIES = {
+    cls.name: cls for cls in (ScoreStability, ScoreThreshold, ConfidenceInterval)
+}
+
+
+def from_spec(spec) -> StoppingPolicy:
+    """
+    Build a policy from a dict such as ``{"policy": "stability", "window": 3}``
+    or the CLI form ``"stability:window=3,tolerance=2"``.
+    """
+    if isinstance(spec, StoppingPolicy):
+        return spec
+    if isinstance(spec, str):
+        name, _, args = spec.partition(":")
+        params = {}
+        for pair in filter(None, (p.strip() for p in args.split(","))):
+            key, sep, value = pair.partition("=")
+            if not sep:
+                raise ValueError(
+                    f"Expected key=value in stopping policy {spec!r}, got {pair!r}"
+                )
+            params[key.strip()] = value.strip()
+        spec = {"policy": name.strip(), **params}
+    params = dict(spec)
+    name = params.pop("policy", None)
+    if name not in POLICIES:
+        raise ValueError(
+            f"Unknown stopping policy {name!r}; expected one of {sorted(POLICIES)}"
+        )
+    try:
+        return POLICIES[name](**params)
+    except TypeError as exc:
+        raise ValueError(f"Bad parameters for stopping policy {name!r}: {exc}") from exc
@@ -0,0 +1,218 @@
+"""
+Offline stand-in for an LLM provider, for load tests and demos.
+
+``StubChatModel`` behaves like a LangChain chat model (``invoke``, ``stream``
+and ``bind_tools``, with ``usage_metadata`` on its replies) but never touches
+the network: it recognises which participant is asking from the system prompt
+and answers with a role-appropriate template — arguments for debaters,
+``"<score> <justification>"`` for judges, framing and questions for
+moderators — and, once tools are bound, asks for a tool call before answering.
+
+Latency is simulated as a time-to-first-token plus output tokens divided by
+the token rate, with multiplicative jitter; a configurable fraction of calls
+fail with SimulatedLLMError. Settings come from ``AUTODEBATER_STUB_*``
+environment variables, overridable per instance:
+
+- ``AUTODEBATER_STUB_LATENCY_MS``: mean time to first token (default 0)
+- ``AUTODEBATER_STUB_TOKENS_PER_SECOND``: output rate, 0 for instant (default 0)
+- ``AUTODEBATER_STUB_JITTER``: standard deviation of the latency multiplier (default 0)
+- ``AUTODEBATER_STUB_ERROR_RATE``: probability a call fails (default 0)
+- ``AUTODEBATER_STUB_TOOL_CALL_RATE``: probability a tool-bound call asks for a
+  tool (default 1)
+- ``AUTODEBATER_STUB_SEED``: seed for reproducible scores, errors and latency
+"""
+
+import copy
+import itertools
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from autodebater.errors import SimulatedLLMError
+
+_ARGUMENT_LINES = [
+    "The strongest evidence points the other way once you look past the headlines.",
+    "Historical precedent shows that similar changes took decades, not years.",
+    "My opponent's last claim conflates correlation with causation.",
+    "Independent studies replicate this result across several countries.",
+    "The costs fall disproportionately on people with the least say in the decision.",
+    "Even granting that premise, the conclusion does not follow.",
+]
+
+_PANEL_LINES = [
+    "From my field's perspective the key variable is how incentives change over time.",
+    "I agree with the previous point, but the data only supports a narrower claim.",
+    "We should separate what is technically possible from what is socially likely.",
+    "One angle we haven't covered is how this plays out in low-income settings.",
+]
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """Simulated provider behaviour; see the module docstring for each setting."""
+
+    latency_ms: float = 0.0
+    tokens_per_second: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    tool_call_rate: float = 1.0
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_env(cls, **overrides) -> "StubConfig":
+        """Read AUTODEBATER_STUB_* settings; keyword overrides for known fields win."""
+        values = {}
+        for f in fields(cls):
+            raw = os.environ.get(f"AUTODEBATER_STUB_{f.name.upper()}")
+            if f.name in overrides:
+                values[f.name] = overrides[f.name]
+            elif raw not in (None, ""):
+                values[f.name] = int(raw) if f.name == "seed" else float(raw)
+        return cls(**values)
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count (about 4 tokens per 3 words), good enough for pacing."""
+    return len(text.split()) * 4 // 3
+
+
+def _role_and_text(message) -> tuple:
+    if isinstance(message, (tuple, list)):
+        return message[0], message[1]
+    role = {"human": "user", "ai": "assistant"}.get(message.type, message.type)
+    return role, message.content
+
+
+def _quoted(text: str, default: str = "the motion") -> str:
+    match = re.search(r'"([^"]+)"', text)
+    return match.group(1) if match else default
+
+
+def _usage(input_tokens: int, output_tokens: int) -> dict:
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens}
+
+
+class StubChatModel:
+    """Chat-model look-alike returning canned, role-aware AIMessages."""
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.tools: list = []
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+        self._call_ids = itertools.count(1)
+
+    def bind_tools(self, tools: list) -> "StubChatModel":
+        bound = copy.copy(self)  # shares the random stream and call ids
+        bound.tools = list(tools)
+        return bound
+
+    def _random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def _gauss(self, sigma: float) -> float:
+        with self._rng_lock:
+            return self._rng.gauss(1.0, sigma)
+
+    def invoke(self, messages) -> AIMessage:
+        reply = self.generate(messages)
+        time.sleep(sum(self.delays(count_tokens(reply.content))))
+        return reply
+
+    def stream(self, messages):
+        """
+        Yield the reply word by word, paced like invoke; usage rides on the
+        last chunk.
+        """
+        reply = self.generate(messages)
+        words = reply.content.split(" ") if reply.content else []
+        first, rest = self.delays(count_tokens(reply.content))
+        time.sleep(first)
+        if not words:
+            yield AIMessageChunk(content="", tool_calls=reply.tool_calls,
+                                 usage_metadata=reply.usage_metadata)
+            return
+        gap = rest / max(len(words) - 1, 1)
+        for i, word in enumerate(words):
+            if i and gap:
+                time.sleep(gap)
+            last = i == len(words) - 1
+            yield AIMessageChunk(content=word if last else word + " ",
+                                 usage_metadata=reply.usage_metadata if last else None)
+
+    def generate(self, messages) -> AIMessage:
+        """The reply to *messages*, without the simulated latency.
+
+        Raises SimulatedLLMError for the configured fraction of calls.
+        """
+        messages = [_role_and_text(m) for m in messages]
+        if self.config.error_rate and self._random() < self.config.error_rate:
+            raise SimulatedLLMError("stub provider: simulated upstream error")
+        input_tokens = sum(count_tokens(str(text)) for _, text in messages)
+        tool_call = self._tool_call(messages)
+        if tool_call:
+            return AIMessage(content="", tool_calls=[tool_call],
+                             usage_metadata=_usage(input_tokens, 16))
+        content = self.reply(messages)
+        return AIMessage(
+            content=content, usage_metadata=_usage(input_tokens, count_tokens(content))
+        )
+
+    def delays(self, output_tokens: int) -> tuple:
+        """(time to first token, time to emit *output_tokens*) in seconds."""
+        scale = max(0.0, self._gauss(self.config.jitter)) if self.config.jitter else 1.0
+        first = self.config.latency_ms / 1000 * scale
+        rest = 0.0
+        if self.config.tokens_per_second:
+            rest = output_tokens / self.config.tokens_per_second * scale
+        return first, rest
+
+    def _tool_call(self, messages) -> Optional[dict]:
+        if not self.tools or messages[-1][0] == "tool":
+            return None
+        if self._random() >= self.config.tool_call_rate:
+            return None
+        system = messages[0][1] if messages and messages[0][0] == "system" else ""
+        return {
+            "name": self.tools[0].name,
+            "args": {"query": _quoted(system)},
+            "id": f"stub_call_{next(self._call_ids)}",
+            "type": "tool_call",
+        }
+
+    def reply(self, messages) -> str:
+        """The canned response for this conversation, chosen by the asking role."""
+        system = messages[0][1] if messages and messages[0][0] == "system" else ""
+        last = messages[-1][1] if messages else ""
+        motion = _quoted(system)
+        turn = sum(1 for role, text in messages if role == "assistant" and text)
+
+        if system == "You are a domain expert.":
+            return "policy analysis and applied statistics"
+        if "<score>" in system or "<score>" in last:
+            score = int(20 + 60 * self._random())
+            return (f"{score} Both sides made relevant points about {motion}; "
+                    f"the evidence offered so far leans this way.")
+        if "moderator" in system or "facilitator" in system:
+            if "concluded" in last:
+                return (f"That concludes our discussion of \"{motion}\". "
+                        "Both sides raised substantive points worth weighing.")
+            if "opening" in last:
+                return (f"Welcome to today's discussion of \"{motion}\". "
+                        "Let us begin with the first speaker.")
+            return "What evidence would change your position on the central claim?"
+
+        if "roundtable" in system:
+            line = _PANEL_LINES[turn % len(_PANEL_LINES)]
+            return f"{line} On {motion}, that shifts the balance."
+        stance = "against" if "arguing against" in system else "for"
+        line = _ARGUMENT_LINES[turn % len(_ARGUMENT_LINES)]
+        return f"Point {turn + 1} {stance} \"{motion}\": {line}"
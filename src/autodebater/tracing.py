@@ -0,0 +1,266 @@
+"""
+Span-based tracing of debates, built on the lifecycle hooks.
+
+A Tracer subscribes to a HookRegistry (a single debate's, or ``global_hooks``
+for everything in the process) and turns start/end event pairs into nested
+spans: debate > turn > respond > llm_call > tool_call. Judge replies outside a
+turn nest directly under the debate, and so does work done on other threads
+(e.g. expertise discovery during warm-up). Judge retries and score updates are
+recorded as instant events, and each retry bumps ``retries`` on the span it
+happened under.
+
+The trace id of a debate's spans is its ``debate_id``. Traces can be written as
+JSONL (one span per line) or as a Chrome trace file, viewable offline in
+Perfetto (ui.perfetto.dev) or chrome://tracing:
+
+    tracer = Tracer().attach(runner.debate.hooks)
+    list(runner.run_debate())
+    tracer.export(runner.debate.debate_id, "debate.trace.json")
+
+With ``output_dir`` set, a debate's trace is written to
+``<output_dir>/<debate_id>.trace.json`` (or ``.jsonl``) when it ends and then
+dropped from memory.
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field, is_dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from autodebater.hooks import (DEBATE_END, DEBATE_START, JUDGE_RETRY, LLM_CALL_END,
+                               LLM_CALL_START, RESPOND_END, RESPOND_START, SCORE_UPDATE,
+                               TOOL_CALL_END, TOOL_CALL_START, TURN_END, TURN_START,
+                               HookEvent, HookRegistry)
+
+logger = logging.getLogger(__name__)
+
+# start event -> (span name, matching end event)
+_SPANS = {
+    DEBATE_START: ("debate", DEBATE_END),
+    TURN_START: ("turn", TURN_END),
+    RESPOND_START: ("respond", RESPOND_END),
+    LLM_CALL_START: ("llm_call", LLM_CALL_END),
+    TOOL_CALL_START: ("tool_call", TOOL_CALL_END),
+}
+_END_NAMES = {end: name for name, end in _SPANS.values()}
+_INSTANTS = (JUDGE_RETRY, SCORE_UPDATE)
+
+TRACE_FORMATS = ("chrome", "jsonl")
+
+
+def _plain(value):
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return str(value)
+
+
+@dataclass
+class Span:
+    """One timed operation; times are wall-clock seconds (time.time())."""
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    start: float
+    thread_id: int
+    end: Optional[float] = None
+    attributes: dict = field(default_factory=dict)
+    # instant events: {"name", "time", "attributes"}
+    events: list = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end is None else round((self.end - self.start) * 1000, 3)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "end": self.end,
+            "duration_ms": self.duration_ms,
+            "thread_id": self.thread_id,
+            "attributes": _plain(self.attributes),
+            "events": _plain(self.events),
+        }
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class Tracer:
+    """Collects spans from hook events; thread-safe."""
+
+    def __init__(self, output_dir: Optional[str] = None, fmt: str = "chrome"):
+        if fmt not in TRACE_FORMATS:
+            raise ValueError(
+                f"Unknown trace format {fmt!r}; use one of {TRACE_FORMATS}"
+            )
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self._lock = threading.Lock()
+        self._spans: Dict[str, List[Span]] = {}  # trace_id -> spans in start order
+        self._stacks: Dict[int, List[Span]] = {}  # thread -> open spans
+        self._roots: Dict[str, Span] = {}  # trace_id -> open debate span
+        self._registry: Optional[HookRegistry] = None
+
+    def attach(self, registry: HookRegistry) -> "Tracer":
+        """Start tracing everything emitted on *registry* and the ones below it."""
+        self.detach()
+        registry.subscribe(self.on_event)
+        self._registry = registry
+        return self
+
+    def detach(self) -> None:
+        if self._registry is not None:
+            self._registry.unsubscribe(self.on_event)
+            self._registry = None
+
+    def on_event(self, event: HookEvent) -> None:
+        finished = None
+        with self._lock:
+            if event.name in _SPANS:
+                self._open(event)
+            elif event.name in _END_NAMES:
+                finished = self._close(event)
+            elif event.name in _INSTANTS:
+                self._instant(event)
+        if finished is not None and self.output_dir:
+            self._write_finished(finished)
+
+    def _parent(self, event: HookEvent) -> Optional[Span]:
+        stack = self._stacks.get(event.thread_id)
+        if stack:
+            return stack[-1]
+        return self._roots.get(event.debate_id) if event.debate_id else None
+
+    def _open(self, event: HookEvent) -> None:
+        name = _SPANS[event.name][0]
+        parent = self._parent(event)
+        trace_id = event.debate_id or (parent.trace_id if parent else _new_id())
+        span = Span(trace_id, _new_id(), parent.span_id if parent else None, name,
+                    event.wall_time, event.thread_id, attributes=dict(event.data))
+        self._spans.setdefault(trace_id, []).append(span)
+        self._stacks.setdefault(event.thread_id, []).append(span)
+        if name == "debate":
+            self._roots[trace_id] = span
+
+    def _close(self, event: HookEvent) -> Optional[str]:
+        """
+        End the innermost open span of this kind; returns the trace id when a
+        debate ends.
+        """
+        name = _END_NAMES[event.name]
+        stack = self._stacks.get(event.thread_id, [])
+        for index in range(len(stack) - 1, -1, -1):
+            span = stack[index]
+            if span.name == name:
+                del stack[index]
+                break
+        else:
+            return None
+        if not stack:
+            self._stacks.pop(event.thread_id, None)
+        span.end = event.wall_time
+        span.attributes.update(event.data)
+        if name == "debate":
+            self._roots.pop(span.trace_id, None)
+            return span.trace_id
+        return None
+
+    def _instant(self, event: HookEvent) -> None:
+        parent = self._parent(event)
+        if parent is None:
+            return
+        parent.events.append({"name": event.name, "time": event.wall_time,
+                              "attributes": dict(event.data)})
+        if event.name == JUDGE_RETRY:
+            parent.attributes["retries"] = parent.attributes.get("retries", 0) + 1
+
+    def trace_ids(self) -> list:
+        with self._lock:
+            return list(self._spans)
+
+    def spans(self, trace_id: str) -> List[Span]:
+        with self._lock:
+            return list(self._spans.get(trace_id, []))
+
+    def forget(self, trace_id: str) -> None:
+        with self._lock:
+            self._spans.pop(trace_id, None)
+
+    def export(self, trace_id: str, path: str, fmt: Optional[str] = None) -> None:
+        """
+        Write one trace to *path*; the format defaults to jsonl for .jsonl
+        paths, else chrome.
+        """
+        fmt = fmt or ("jsonl" if str(path).endswith(".jsonl") else "chrome")
+        spans = self.spans(trace_id)
+        if fmt == "jsonl":
+            content = to_jsonl(spans)
+        else:
+            content = json.dumps(to_chrome_trace(spans))
+        Path(path).write_text(content, encoding="utf-8")
+
+    def _write_finished(self, trace_id: str) -> None:
+        suffix = "jsonl" if self.fmt == "jsonl" else "json"
+        path = os.path.join(self.output_dir, f"{trace_id}.trace.{suffix}")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self.export(trace_id, path, self.fmt)
+        except OSError:
+            logger.exception("Could not write trace %s", path)
+        self.forget(trace_id)
+
+
+def to_jsonl(spans: List[Span]) -> str:
+    return "".join(json.dumps(span.to_dict()) + "\n" for span in spans)
+
+
+def to_chrome_trace(spans: List[Span]) -> dict:
+    """
+    Chrome trace-event JSON: one complete ("X") event per span, instants as
+    "i" events.
+    """
+    if not spans:
+        return {"traceEvents": [], "displayTimeUnit": "ms"}
+    origin = min(span.start for span in spans)
+    threads = {}
+    events = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+               "args": {"name": f"debate {spans[0].trace_id}"}}]
+    for span in spans:
+        tid = threads.setdefault(span.thread_id, len(threads) + 1)
+        end = span.end if span.end is not None else span.start
+        args = {"span_id": span.span_id, "parent_id": span.parent_id,
+                **_plain(span.attributes)}
+        label = span.attributes.get("participant") or span.attributes.get("tool")
+        events.append({
+            "name": f"{span.name} {label}" if label else span.name,
+            "cat": span.name, "ph": "X", "pid": 1, "tid": tid,
+            "ts": round((span.start - origin) * 1e6, 1),
+            "dur": round((end - span.start) * 1e6, 1),
+            "args": args,
+        })
+        for instant in span.events:
+            events.append({
+                "name": instant["name"], "cat": "event", "ph": "i", "s": "t",
+                "pid": 1, "tid": tid,
+                "ts": round((instant["time"] - origin) * 1e6, 1),
+                "args": _plain(instant["attributes"]),
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms",
+            "otherData": {"trace_id": spans[0].trace_id}}
@@ -0,0 +1,147 @@
+"""
+Pre-serialised, compressed payload cache for completed debate transcripts.
+
+Completed debates never change, so the JSON body served by
+``GET /api/debates/{id}`` and the SSE frames of a replay are rendered and
+compressed once, kept in a size-bounded in-memory LRU, and served with a
+strong ETag on every later request.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+try:  # optional: brotli is preferred over gzip when installed
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_DEFAULT_MAX_BYTES = int(
+    float(os.environ.get("AUTODEBATER_TRANSCRIPT_CACHE_MB", "64")) * 1024 * 1024
+)
+
+
+@dataclass
+class CachedTranscript:
+    """One completed debate, rendered in every representation we serve."""
+
+    etag: str
+    bodies: dict  # content-coding ("identity", "gzip", "br") -> bytes
+    events: list  # SSE frames, one per message
+    seqs: list  # sequence number of each frame, for Last-Event-ID slicing
+    # full SSE replay per content-coding
+    stream_bodies: dict = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return sum(len(b) for b in self.bodies.values()) + sum(
+            len(b) for b in self.stream_bodies.values()
+        ) + sum(len(e) for e in self.events)
+
+    def etag_for(self, encoding: str) -> str:
+        """Strong ETag of one representation (content-codings get distinct tags)."""
+        return self.etag if encoding == "identity" else f'{self.etag[:-1]}-{encoding}"'
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """True if an If-None-Match header names any representation of this entry."""
+        if not if_none_match:
+            return False
+        tags = {t.strip() for t in if_none_match.split(",")}
+        if "*" in tags:
+            return True
+        ours = {self.etag_for(enc) for enc in self.bodies}
+        return bool(ours & {t[2:] if t.startswith("W/") else t for t in tags})
+
+
+def _compress(raw: bytes) -> dict:
+    bodies = {"identity": raw, "gzip": gzip.compress(raw, compresslevel=6, mtime=0)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(raw)
+    return bodies
+
+
+def render_transcript(meta: dict, messages: list, sse_event) -> CachedTranscript:
+    """Serialise and compress a completed debate.
+
+    *sse_event* renders one message dict as an SSE frame.
+    """
+    payloads = [m.to_dict() for m in messages]
+    raw = json.dumps(
+        {"meta": meta, "messages": payloads}, separators=(",", ":")
+    ).encode("utf-8")
+    events = [sse_event(p) for p in payloads]
+    stream = ("".join(events) + "data: [DONE]\n\n").encode("utf-8")
+    return CachedTranscript(
+        etag=f'"{hashlib.sha256(raw).hexdigest()[:32]}"',
+        bodies=_compress(raw),
+        events=events,
+        seqs=[p["seq"] for p in payloads],
+        stream_bodies=_compress(stream),
+    )
+
+
+def choose_encoding(accept_encoding: str | None, available) -> str:
+    """Pick the best content-coding the client accepts: br, then gzip, then identity."""
+    if not accept_encoding:
+        return "identity"
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding in ("br", "gzip"):
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and q > 0:
+            return encoding
+    return "identity"
+
+
+class TranscriptCache:
+    """Thread-safe LRU of CachedTranscript objects, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, debate_id: str) -> CachedTranscript | None:
+        with self._lock:
+            entry = self._entries.get(debate_id)
+            if entry is not None:
+                self._entries.move_to_end(debate_id)
+            return entry
+
+    def put(self, debate_id: str, entry: CachedTranscript) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(debate_id, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[debate_id] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def invalidate(self, debate_id: str) -> None:
+        with self._lock:
+            old = self._entries.pop(debate_id, None)
+            if old is not None:
+                self._bytes -= old.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
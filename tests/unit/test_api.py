@@ -0,0 +1,579 @@
+"""Unit tests for the FastAPI backend, with a temporary store."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import create_autospec
+
+import pytest
+from fastapi.testclient import TestClient
+
+from autodebater import api, metrics
+from autodebater.debate import SimpleDebate
+from autodebater.debate_runners import DebateRunner, RunnerConfig
+from autodebater.dialogue import DialogueHistory, DialogueMessage
+from autodebater.participants import Debater
+from autodebater.persistence import DebateStore
+from autodebater.transcript_cache import TranscriptCache
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    db = DebateStore(db_path=str(tmp_path / "api.db"))
+    monkeypatch.setattr(api, "_store", db)
+    monkeypatch.setattr(api, "_debates", {})
+    monkeypatch.setattr(api, "_transcripts", TranscriptCache())
+    monkeypatch.setattr(api, "_job_worker", None)
+    yield db
+    if api._job_worker is not None:  # pylint: disable=protected-access
+        api._job_worker.stop(timeout=1)  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def client(store, monkeypatch):  # pylint: disable=unused-argument,redefined-outer-name
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return TestClient(api.app)
+
+
+def _live_record(runner=None):
+    return api._new_record("m", "judged", runner)  # pylint: disable=protected-access
+
+
+def _event_ids(body: str) -> list:
+    return [int(line[4:]) for line in body.splitlines() if line.startswith("id: ")]
+
+
+def _save(
+    store, debate_id, motion, mode="judged"
+):  # pylint: disable=redefined-outer-name
+    h = DialogueHistory()
+    h.add_message(
+        DialogueMessage(
+            name="mod", role="moderator", message="Please begin", debate_id=debate_id
+        )
+    )
+    h.add_message(
+        DialogueMessage(
+            name="J", role="judge", message="70 ok", debate_id=debate_id, judgement=70.0
+        )
+    )
+    store.save(h, motion, mode=mode)
+
+
+def test_list_debates_paginates(client, store):  # pylint: disable=redefined-outer-name
+    for n in range(3):
+        _save(store, f"d{n}", f"Motion {n}")
+    first = client.get("/api/debates", params={"limit": 2}).json()
+    assert len(first["items"]) == 2
+    second = client.get(
+        "/api/debates", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+
+
+def test_list_debates_bad_cursor(client):  # pylint: disable=redefined-outer-name
+    assert client.get("/api/debates", params={"cursor": "junk"}).status_code == 400
+
+
+def test_get_debate_meta(client, store):  # pylint: disable=redefined-outer-name
+    _save(store, "abc", "Some motion", mode="panel")
+    body = client.get("/api/debates/abc").json()
+    assert body["meta"]["mode"] == "panel"
+    assert body["meta"]["final_score"] == 70.0
+    assert len(body["messages"]) == 2
+
+
+def test_get_debate_not_found(client):  # pylint: disable=redefined-outer-name
+    assert client.get("/api/debates/nope").status_code == 404
+
+
+def test_search_escapes_and_highlights(
+    client, store
+):  # pylint: disable=redefined-outer-name
+    h = DialogueHistory()
+    h.add_message(
+        DialogueMessage(
+            name="A", role="debater", message="<b>nuclear</b> wins", debate_id="s1"
+        )
+    )
+    store.save(h, "Energy policy")
+    body = client.get("/api/search", params={"q": "nuclear"}).json()
+    assert body["items"][0]["snippet"] == "&lt;b&gt;<mark>nuclear</mark>&lt;/b&gt; wins"
+    assert body["next_offset"] is None
+
+
+def test_sse_delivery_smooth_during_slow_history_queries(
+    store, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    """A slow SQLite query must not stall live SSE streams on the same event loop."""
+    real_page = store.page_debates
+    started, release, order = threading.Event(), threading.Event(), []
+
+    def slow_page(*args, **kwargs):
+        started.set()
+        # held until the whole stream got through (the timeout is only a safety net)
+        release.wait(10)
+        order.append("query")
+        return real_page(*args, **kwargs)
+
+    monkeypatch.setattr(store, "page_debates", slow_page)
+
+    record = _live_record()
+    api._debates["live"] = record  # pylint: disable=protected-access
+
+    def produce():
+        for n in range(12):
+            message = DialogueMessage(
+                name="A", role="debater", message=f"m{n}", debate_id="live", seq=n
+            )
+            api._publish(record, message)  # pylint: disable=protected-access
+        record["done"] = True
+
+    async def scenario():
+        response = await api.stream_debate("live", last_event_id=None)
+        queries = [
+            asyncio.create_task(
+                api.list_debates(limit=50, cursor=None, mode=None, since=None,
+                                 until=None, motion_prefix=None)
+            )
+            for _ in range(4)
+        ]
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        threading.Thread(target=produce, daemon=True).start()
+        chunks = [chunk async for chunk in response.body_iterator]
+        order.append("stream")
+        release.set()
+        await asyncio.gather(*queries)
+        return chunks
+
+    chunks = asyncio.run(scenario())
+    assert len(chunks) >= 13
+    # The stream finished while the queries still held the I/O executor
+    assert order[0] == "stream" and order.count("query") == 4
+
+
+def test_profile_roundtrip(
+    client, tmp_path, monkeypatch
+):  # pylint: disable=redefined-outer-name
+    monkeypatch.setenv("AUTODEBATER_PROFILE", str(tmp_path / "profile.md"))
+    response = client.put("/api/profile", json={"content": "I am a chemist."})
+    assert response.status_code == 200
+    assert client.get("/api/profile").json() == {"content": "I am a chemist."}
+
+
+def test_stream_live_resumes_after_last_event_id(
+    client,
+):  # pylint: disable=redefined-outer-name
+    record = _live_record()
+    for n in range(5):
+        api._publish(  # pylint: disable=protected-access
+            record,
+            DialogueMessage(
+                name="A", role="debater", message=f"m{n}", debate_id="r", seq=n
+            ),
+        )
+    record["done"] = True
+    api._debates["r"] = record  # pylint: disable=protected-access
+
+    assert _event_ids(client.get("/api/debates/r/stream").text) == [0, 1, 2, 3, 4]
+    resumed = client.get("/api/debates/r/stream", headers={"Last-Event-ID": "2"}).text
+    assert _event_ids(resumed) == [3, 4]
+    assert resumed.endswith("data: [DONE]\n\n")
+
+
+def test_stream_replay_resumes_after_last_event_id(
+    client, store
+):  # pylint: disable=redefined-outer-name
+    _save(store, "p", "Persisted")
+    assert _event_ids(client.get("/api/debates/p/stream").text) == [0, 1]
+    resumed = client.get("/api/debates/p/stream", headers={"Last-Event-ID": "1"})
+    assert resumed.status_code == 200
+    assert _event_ids(resumed.text) == []
+    missing = client.get("/api/debates/missing/stream", headers={"Last-Event-ID": "1"})
+    assert missing.status_code == 404
+
+
+def test_completed_transcript_etag_and_304(
+    client, store
+):  # pylint: disable=redefined-outer-name
+    _save(store, "done", "Finished")
+    first = client.get("/api/debates/done", headers={"Accept-Encoding": "identity"})
+    assert first.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    again = client.get("/api/debates/done", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_completed_transcript_gzip(
+    client, store, mocker
+):  # pylint: disable=redefined-outer-name
+    _save(store, "gz", "Compressed")
+    response = client.get("/api/debates/gz", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.json()["meta"]["debate_id"] == "gz"
+
+    # Served from the payload cache: SQLite is not queried again
+    spy = mocker.spy(store, "load")
+    assert client.get("/api/debates/gz").status_code == 200
+    spy.assert_not_called()
+
+
+def test_running_debate_is_not_cached(client):  # pylint: disable=redefined-outer-name
+    api._debates["running"] = _live_record()  # pylint: disable=protected-access
+    response = client.get("/api/debates/running")
+    assert "ETag" not in response.headers
+    assert response.json()["meta"]["status"] == "running"
+
+
+def test_completed_replay_uses_cached_frames(
+    client, store
+):  # pylint: disable=redefined-outer-name
+    _save(store, "rp", "Replay")
+    full = client.get("/api/debates/rp/stream", headers={"Accept-Encoding": "gzip"})
+    assert full.headers["Content-Encoding"] == "gzip"
+    assert _event_ids(full.text) == [0, 1]
+    resumed = client.get("/api/debates/rp/stream", headers={"Last-Event-ID": "0"})
+    assert _event_ids(resumed.text) == [1]
+
+
+class _Runner(DebateRunner):
+    """Minimal runner around a real SimpleDebate with scripted debaters."""
+
+    mode = "simple"
+
+    def __init__(self, debate):
+        self.debate = debate
+        self.config = RunnerConfig(motion=debate.motion, epochs=debate.epochs)
+
+    def run_debate(self):
+        yield from self.debate.debate()
+
+
+def _debate_cancelled_after_first_turn():
+    debate = SimpleDebate(motion="m", epochs=3)
+    for name in ("A", "B"):
+        debater = create_autospec(Debater, instance=True)
+        debater.name, debater.role, debater.stance = name, "debater", "for"
+        debater.respond.return_value = f"from {name}"
+        debate.add_debaters(debater)
+    first = debate.debaters[0]
+    first.respond.side_effect = lambda _m: debate.cancel("test") or "only turn"
+    return debate
+
+
+def test_cancelled_debate_saves_partial_transcript(store):  # pylint: disable=redefined-outer-name
+    debate = _debate_cancelled_after_first_turn()
+    record = api._debates[debate.debate_id] = _live_record(_Runner(debate))  # pylint: disable=protected-access
+    api._run_in_thread(debate.debate_id, record["runner"])  # pylint: disable=protected-access
+
+    assert record["cancelled"] == "test"
+    meta = store.get_debate_meta(debate.debate_id)
+    assert meta["status"] == "cancelled"
+    assert meta["message_count"] == 2
+
+
+def test_delete_cancels_running_debate(client):  # pylint: disable=redefined-outer-name
+    debate = _debate_cancelled_after_first_turn()
+    api._debates["run"] = _live_record(_Runner(debate))  # pylint: disable=protected-access
+    response = client.delete("/api/debates/run")
+    assert response.status_code == 202
+    assert response.json()["status"] == "cancelling"
+    assert debate.cancel_token.cancelled
+
+
+def test_delete_unknown_and_finished(client, store):  # pylint: disable=redefined-outer-name
+    assert client.delete("/api/debates/nope").status_code == 404
+    _save(store, "old", "Finished")
+    assert client.delete("/api/debates/old").status_code == 409
+
+
+def test_delete_finished_debate_is_conflict_on_both_paths(client, store):  # pylint: disable=redefined-outer-name
+    debate = _debate_cancelled_after_first_turn()
+    record = api._debates["live"] = _live_record(_Runner(debate))  # pylint: disable=protected-access
+    record["done"] = True
+    assert client.delete("/api/debates/live").status_code == 409
+
+    store.enqueue_job("job", {"motion": "m"})
+    job = store.claim_job("w", 60)
+    store.complete_job(job["job_id"], "w")
+    assert client.delete("/api/debates/job").status_code == 409
+
+
+def test_delete_claimed_job_before_it_starts(client, store):  # pylint: disable=redefined-outer-name
+    store.enqueue_job("job", {"motion": "m", "mode": "simple"})
+    store.claim_job("w", 60)
+    assert client.delete("/api/debates/job").json()["status"] == "cancelling"
+    assert api._debates["job"]["cancelled"] == "cancelled by client"  # pylint: disable=protected-access
+
+
+def test_idle_watchdog():
+    record = _live_record()
+    check = api._idle_watchdog(record, 5)  # pylint: disable=protected-access
+    assert check() is None
+    record["last_seen"] -= 10
+    assert "no viewers" in check()
+    record["subscribers"] = 1
+    assert check() is None
+
+
+def _scripted_debate(motion="m", epochs=1, debate_id=None):
+    debate = SimpleDebate(motion=motion, epochs=epochs, debate_id=debate_id)
+    for name in ("A", "B"):
+        debater = create_autospec(Debater, instance=True)
+        debater.name, debater.role, debater.stance = name, "debater", "for"
+        debater.respond.return_value = f"{name} on {motion}"
+        debater.state.return_value = {
+            "name": name,
+            "system_prompt": "",
+            "chat_history": [],
+        }
+        debate.add_debaters(debater)
+    return debate
+
+
+def _wait_for_batch(client, batch_id, timeout=10):  # pylint: disable=redefined-outer-name
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        progress = client.get(f"/api/batches/{batch_id}").json()
+        if progress["done"]:
+            return progress
+        time.sleep(0.02)
+    raise AssertionError("batch did not finish")
+
+
+def test_batch_runs_every_motion(client, monkeypatch):  # pylint: disable=redefined-outer-name
+    built = []
+
+    def build(req, debate_id=None):
+        assert req.mode == "simple" and req.epochs == 1
+        built.append(req.motion)
+        return _Runner(_scripted_debate(req.motion, debate_id=debate_id))
+
+    monkeypatch.setattr(api, "_build_runner", build)
+    response = client.post(
+        "/api/batches",
+        json={
+            "motions": ["one", "two", "three"],
+            "template": {"mode": "simple", "epochs": 1},
+        },
+    )
+    assert response.status_code == 202
+    batch_id = response.json()["batch_id"]
+
+    progress = _wait_for_batch(client, batch_id)
+    assert progress["counts"]["completed"] == 3
+    assert sorted(built) == ["one", "three", "two"]
+
+    lines = client.get(f"/api/batches/{batch_id}/results").text.splitlines()
+    motions = sorted(json.loads(line)["motion"] for line in lines)
+    assert motions == ["one", "three", "two"]
+
+    export = client.get(f"/api/batches/{batch_id}/export").json()
+    assert [d["motion"] for d in export["debates"]] == ["one", "two", "three"]
+    assert all(d["meta"]["status"] == "completed" for d in export["debates"])
+    assert any("one" in m["message"] for m in export["debates"][0]["messages"])
+    assert client.get("/api/jobs").json()["counts"]["completed"] == 3
+
+
+def test_batch_build_failure_marks_item_failed(client, monkeypatch):  # pylint: disable=redefined-outer-name
+    def build(req, debate_id=None):
+        if req.motion == "bad":
+            raise RuntimeError("no provider")
+        return _Runner(_scripted_debate(req.motion, debate_id=debate_id))
+
+    monkeypatch.setattr(api, "_build_runner", build)
+    monkeypatch.setattr(api, "JOB_MAX_ATTEMPTS", 1)
+    response = client.post("/api/batches", json={"motions": ["good", "bad"]})
+    batch_id = response.json()["batch_id"]
+    progress = _wait_for_batch(client, batch_id)
+    counts = {"queued": 0, "running": 0, "completed": 1, "failed": 1, "cancelled": 0}
+    assert progress["counts"] == counts
+    assert progress["items"][1]["error"] == "no provider"
+
+
+def test_batch_export_requires_finished_batch(client, store):  # pylint: disable=redefined-outer-name
+    store.enqueue_batch("b1", [("x1", {"motion": "x"})])
+    assert client.get("/api/batches/b1/export").status_code == 409
+    assert client.get("/api/batches/nope").status_code == 404
+    assert client.post("/api/batches", json={"motions": []}).status_code == 422
+
+
+def test_cancel_batch_drops_queued_jobs(client, store):  # pylint: disable=redefined-outer-name
+    """Batch state lives in the job rows, so a batch survives a server restart."""
+    store.enqueue_batch("b1", [("x1", {"motion": "x"}), ("y1", {"motion": "y"})])
+    assert client.get("/api/batches/b1").json()["counts"]["queued"] == 2
+    assert client.delete("/api/batches/b1").status_code == 202
+    progress = client.get("/api/batches/b1").json()
+    assert progress["done"] and progress["counts"]["cancelled"] == 2
+    assert [item["motion"] for item in progress["items"]] == ["x", "y"]
+    assert len(client.get("/api/batches/b1/results").text.splitlines()) == 2
+    assert client.delete("/api/batches/nope").status_code == 404
+
+
+def test_create_debate_runs_as_durable_job(client, store, monkeypatch):  # pylint: disable=redefined-outer-name
+    def build(req, debate_id=None):
+        return _Runner(_scripted_debate(req.motion, debate_id=debate_id))
+
+    monkeypatch.setattr(api, "_build_runner", build)
+    response = client.post("/api/debates", json={"motion": "Queued", "mode": "simple"})
+    debate_id = response.json()["debate_id"]
+    body = client.get(f"/api/debates/{debate_id}/stream").text
+    assert body.endswith("data: [DONE]\n\n")
+    assert "A on Queued" in body
+
+    deadline = time.monotonic() + 5
+    while store.get_job(debate_id)["state"] != "completed":
+        if time.monotonic() > deadline:
+            break
+        time.sleep(0.01)
+    assert store.get_job(debate_id)["state"] == "completed"
+    assert store.get_debate_meta(debate_id)["status"] == "completed"
+    jobs = client.get("/api/jobs").json()
+    assert jobs["depth"] == 0 and jobs["counts"]["completed"] == 1
+    assert client.get(f"/api/jobs/{debate_id}").json()["attempts"] == 1
+
+
+def test_queued_job_survives_restart(client, store):  # pylint: disable=redefined-outer-name
+    """A job queued before a restart has no live record yet.
+
+    Viewers can still attach to it and cancel it.
+    """
+    store.enqueue_job("queued", {"motion": "Later", "mode": "simple"})
+    assert client.get("/api/jobs").json()["depth"] == 1
+    assert "queued" not in api._debates  # pylint: disable=protected-access
+
+    assert client.delete("/api/debates/queued").json()["status"] == "cancelled"
+    assert store.get_job("queued")["state"] == "cancelled"
+    assert client.get("/api/jobs/nope").status_code == 404
+
+
+def test_failed_job_attempt_raises_for_retry(store, monkeypatch):  # pylint: disable=redefined-outer-name
+    debate = _scripted_debate(debate_id="j1")
+    debate.debaters[0].respond.side_effect = RuntimeError("provider down")
+    monkeypatch.setattr(
+        api, "_build_runner", lambda req, debate_id=None: _Runner(debate)
+    )
+    with pytest.raises(RuntimeError, match="provider down"):
+        api._execute_job({"job_id": "j1", "request": {"motion": "m"}})  # pylint: disable=protected-access
+    assert store.get_debate_meta("j1")["status"] == "failed"
+
+
+def test_job_retry_resumes_from_checkpoint(store, monkeypatch):  # pylint: disable=redefined-outer-name
+    attempts = []
+
+    def build(req, debate_id=None):
+        debate = _scripted_debate(req.motion, epochs=2, debate_id=debate_id)
+        if not attempts:
+            debate.debaters[1].respond.side_effect = RuntimeError("provider down")
+        attempts.append(debate)
+        return _Runner(debate)
+
+    monkeypatch.setattr(api, "_build_runner", build)
+    job = {"job_id": "j1", "request": {"motion": "m", "mode": "simple"}}
+    with pytest.raises(RuntimeError):
+        api._execute_job(job)  # pylint: disable=protected-access
+    assert store.load_checkpoint("j1")["turn"] == 1
+
+    assert api._execute_job(job) == "completed"  # pylint: disable=protected-access
+    assert len(attempts) == 2
+    assert attempts[0].debaters[0].respond.call_count == 1
+    assert attempts[1].debaters[0].respond.call_count == 1  # turn 1 was not repeated
+    assert [m.seq for m in store.load("j1")] == [0, 1, 2, 3, 4]
+    assert [m["seq"] for m in api._debates["j1"]["messages"]] == [0, 1, 2, 3, 4]  # pylint: disable=protected-access
+    assert store.load_checkpoint("j1") is None
+
+
+def test_cancelled_job_drops_its_checkpoint(store, monkeypatch):  # pylint: disable=redefined-outer-name
+    debate = _scripted_debate(epochs=2, debate_id="j1")
+    second = debate.debaters[1]
+    second.respond.side_effect = lambda _m: debate.cancel("test") or "B on m"
+    monkeypatch.setattr(
+        api, "_build_runner", lambda req, debate_id=None: _Runner(debate)
+    )
+    saved, save = [], store.save_checkpoint
+
+    def spy(*args, **kwargs):
+        saved.append(args[0])
+        return save(*args, **kwargs)
+
+    monkeypatch.setattr(store, "save_checkpoint", spy)
+    request = {"motion": "m", "mode": "simple"}
+    job = {"job_id": "j1", "request": request, "attempts": 1, "max_attempts": 3}
+    assert api._execute_job(job) == "cancelled"  # pylint: disable=protected-access
+    assert saved and store.get_debate_meta("j1")["status"] == "cancelled"
+    assert store.load_checkpoint("j1") is None
+
+
+def test_final_failed_attempt_drops_its_checkpoint(store, monkeypatch):  # pylint: disable=redefined-outer-name
+    def build(req, debate_id=None):
+        debate = _scripted_debate(req.motion, epochs=2, debate_id=debate_id)
+        debate.debaters[1].respond.side_effect = RuntimeError("provider down")
+        return _Runner(debate)
+
+    monkeypatch.setattr(api, "_build_runner", build)
+    request = {"motion": "m", "mode": "simple"}
+    job = {"job_id": "j1", "request": request, "attempts": 1, "max_attempts": 2}
+    with pytest.raises(RuntimeError):
+        api._execute_job(job)  # pylint: disable=protected-access
+    assert store.load_checkpoint("j1") is not None
+    with pytest.raises(RuntimeError):
+        api._execute_job({**job, "attempts": 2})  # pylint: disable=protected-access
+    assert store.load_checkpoint("j1") is None
+
+
+def test_create_debate_validates_stopping_policies(client):  # pylint: disable=redefined-outer-name
+    request = {"motion": "m", "stopping": [{"policy": "nope"}]}
+    response = client.post("/api/debates", json=request)
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "settings", [{"mode": "debate"}, {"llm": "gemini"}, {"llm": "anthropic"}]
+)
+def test_create_debate_rejects_bad_runner_config(client, monkeypatch, settings):  # pylint: disable=redefined-outer-name
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    debate = client.post("/api/debates", json={"motion": "m", **settings})
+    assert debate.status_code == 422
+    batch = client.post("/api/batches", json={"motions": ["m"], "template": settings})
+    assert batch.status_code == 422
+    assert client.get("/api/jobs").json()["counts"] == dict.fromkeys(
+        ("queued", "running", "completed", "failed", "cancelled"), 0)
+
+
+def test_metrics_endpoint_after_stub_debate(client, store, monkeypatch):  # pylint: disable=redefined-outer-name
+    for name in ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE", "SEED"):
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+    metrics.install()
+    labels = {"provider": "stub", "model": "", "role": "debater"}
+    calls_before = metrics.LLM_CALL_SECONDS.count(**labels)
+    request = {"motion": "Scraped", "mode": "judged", "llm": "stub", "epochs": 1,
+               "expertise_cache": False}
+    debate_id = client.post("/api/debates", json=request).json()["debate_id"]
+    stream = client.get(f"/api/debates/{debate_id}/stream")
+    assert stream.text.endswith("data: [DONE]\n\n")
+    deadline = time.monotonic() + 5
+    while (store.get_job(debate_id)["state"] != "completed"
+           and time.monotonic() < deadline):
+        time.sleep(0.01)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert metrics.LLM_CALL_SECONDS.count(**labels) == calls_before + 2
+    assert ("autodebater_llm_call_duration_seconds_bucket"
+            '{provider="stub",model="",role="judge",le="+Inf"}') in body
+    assert ("autodebater_llm_tokens_total"
+            '{provider="stub",model="",role="debater",kind="output"}') in body
+    assert 'autodebater_jobs{state="completed"} 1' in body
+    assert "autodebater_debates_active 0" in body
+    assert "autodebater_debates_queued 0" in body
+    assert "autodebater_sse_subscribers 0" in body
+    assert 'autodebater_sqlite_query_duration_seconds_count{operation="save"}' in body
+    assert "# TYPE autodebater_judge_parse_retries_total counter" in body
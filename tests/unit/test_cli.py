@@ -1,11 +1,14 @@
 """ Test the CLI """
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
-from autodebater.dialogue import DialogueMessage
+from autodebater.debate_runners import BasicSimpleDebateRunner
+from autodebater.dialogue import DialogueHistory, DialogueMessage
+from autodebater.persistence import DebateStore
 from autodebater.run_debates import app
 
 runner = CliRunner()
@@ -105,3 +108,71 @@ class TestRunDebatesCLI(unittest.TestCase):
             "This house believes AI will surpass human intelligence",
             result.output,
         )
+
+
+def test_search_command(tmp_path):
+    db = str(tmp_path / "cli.db")
+    history = DialogueHistory()
+    history.add_message(
+        DialogueMessage(
+            name="Alice", role="debater", message="Fusion is near", debate_id="f1"
+        )
+    )
+    DebateStore(db_path=db).save(history, "Fusion energy")
+
+    result = runner.invoke(app, ["search", "fusion", "--db", db])
+    assert result.exit_code == 0
+    assert "f1" in result.output
+
+    result = runner.invoke(app, ["search", "nothingmatches", "--db", db])
+    assert "No matches." in result.output
+
+
+def test_resume_command(tmp_path, mocker):
+    llm = MagicMock()
+    llm.generate_text_from_messages.return_value = "A point."
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=llm,
+    )
+    db = str(tmp_path / "cli.db")
+    store = DebateStore(db_path=db)
+
+    interrupted = BasicSimpleDebateRunner(motion="Tea beats coffee", epochs=2)
+    interrupted.checkpoint_to(store)
+    stream = interrupted.run_debate()
+    for _ in range(3):  # opening and two turns, then the process "dies"
+        next(stream)
+    debate_id = interrupted.debate.debate_id
+    llm.generate_text_from_messages.reset_mock()
+
+    result = runner.invoke(app, ["resume", debate_id, "--db", db])
+    assert result.exit_code == 0, result.output
+    assert "after turn 2" in result.output
+    assert llm.generate_text_from_messages.call_count == 2
+    assert [m.seq for m in store.load(debate_id)] == [0, 1, 2, 3, 4]
+    assert store.load_checkpoint(debate_id) is None
+
+    assert runner.invoke(app, ["resume", debate_id, "--db", db]).exit_code == 1
+
+
+def test_metrics_breakdown(monkeypatch):
+    for name in ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE", "SEED"):
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+    monkeypatch.setenv("COLUMNS", "200")
+    args = ["simple-debate", "Tea beats coffee", "--epochs", "1", "--llm", "stub"]
+    result = runner.invoke(app, args + ["--no-profile", "--metrics"])
+    assert result.exit_code == 0, result.output
+    assert "tokens in" in result.output and "total" in result.output
+
+
+def test_trace_option_writes_chrome_trace(tmp_path, monkeypatch):
+    for name in ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE", "SEED"):
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+    trace = tmp_path / "debate.json"
+    args = ["simple-debate", "Tea beats coffee", "--epochs", "1", "--llm", "stub"]
+    result = runner.invoke(app, args + ["--no-profile", "--trace", str(trace)])
+    assert result.exit_code == 0, result.output
+    events = json.loads(trace.read_text())["traceEvents"]
+    categories = {e["cat"] for e in events if e["ph"] == "X"}
+    assert categories >= {"debate", "turn", "respond", "llm_call"}
@@ -80,5 +80,17 @@ class TestDebate(unittest.TestCase):
             next(debate_generator)
 
 
+def test_messages_are_stamped_with_sequence_numbers():
+    debate = SimpleDebate(motion="m", epochs=1)
+    for name in ("A", "B"):
+        debater = create_autospec(Debater, instance=True)
+        debater.name, debater.role, debater.stance = name, "debater", "for"
+        debater.respond.return_value = f"from {name}"
+        debate.add_debaters(debater)
+    msgs = list(debate.debate())
+    assert [m.seq for m in msgs] == [0, 1, 2]
+    assert [m.seq for m in debate.dialogue_history.messages] == [0, 1, 2]
+
+
 if __name__ == "__main__":
     unittest.main()
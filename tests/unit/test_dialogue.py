@@ -2,7 +2,7 @@
 Unit test the dialogue conversions
 """
 
-from autodebater.dialogue import DialogueConverter, DialogueMessage
+from autodebater.dialogue import DialogueConverter, DialogueMessage, TurnMetrics
 
 
 def test_debate_convert_small():
@@ -22,3 +22,20 @@ def test_debate_convert_small():
     converted = ddc.convert_message(msg)
 
     assert expected == converted
+
+
+def test_turn_metrics_roundtrip_and_merge():
+    first = TurnMetrics(
+        latency_ms=100.0, input_tokens=50, output_tokens=10, llm_calls=1, cost_usd=0.01
+    )
+    retry = TurnMetrics(
+        latency_ms=80.0, ttft_ms=20.0, input_tokens=60, output_tokens=12, llm_calls=1
+    )
+    merged = first.merge(retry)
+    assert (merged.latency_ms, merged.input_tokens, merged.llm_calls) == (180.0, 110, 2)
+    assert merged.ttft_ms == 20.0 and merged.cost_usd == 0.01
+
+    msg = DialogueMessage("A", "debater", "hi", "d1", metrics=merged)
+    assert DialogueMessage.from_dict(msg.to_dict()).metrics == merged
+    bare = DialogueMessage("A", "debater", "hi", "d1")
+    assert DialogueMessage.from_dict(bare.to_dict()).metrics is None
@@ -0,0 +1,132 @@
+"""Unit tests for the judge expertise cache."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from autodebater.concurrency import SingleFlight
+from autodebater.debate_runners import BasicJudgedDebateRunner
+from autodebater.expertise_cache import ExpertiseCache, normalise_motion
+from autodebater.participants import DynamicExpertJudge
+from autodebater.persistence import DebateStore
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExpertiseCache(DebateStore(db_path=str(tmp_path / "test_debates.db")))
+
+
+@pytest.fixture
+def mock_llm(mocker):
+    llm = MagicMock()
+    llm.generate_text_from_messages.return_value = "machine learning"
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=llm,
+    )
+    return llm
+
+
+def _prepared_judge(name, cache, llm_provider="openai", **kwargs):
+    judge = DynamicExpertJudge(
+        name, "motion", llm_provider=llm_provider, expertise_cache=cache, **kwargs
+    )
+    judge.prepare()
+    return judge
+
+
+def test_normalise_motion():
+    assert normalise_motion("  AI will   surpass\nhumans. ") == "ai will surpass humans"
+    assert normalise_motion('"AI will surpass humans?"') == "ai will surpass humans"
+
+
+def test_judges_share_cached_expertise(cache, mock_llm):
+    first = DynamicExpertJudge("J1", "AI will surpass humans", llm_provider="openai",
+                               expertise_cache=cache)
+    first.prepare()
+    second = DynamicExpertJudge("J2", "ai will surpass  humans.", llm_provider="openai",
+                                expertise_cache=cache)
+    second.prepare()
+    assert second.expertise == "machine learning"
+    assert "machine learning" in second.system_prompt
+    assert mock_llm.generate_text_from_messages.call_count == 1
+
+
+def test_cache_is_keyed_by_model(cache, mock_llm):
+    _prepared_judge("J1", cache)
+    _prepared_judge("J2", cache, model="gpt-4o")
+    _prepared_judge("J3", cache, llm_provider="anthropic")
+    assert mock_llm.generate_text_from_messages.call_count == 3
+
+
+def test_cache_is_keyed_by_resolved_model(cache, mock_llm):
+    """A judge on the provider's default model shares entries with one naming it."""
+    mock_llm.model_params = {"model": "gpt-4o"}
+    _prepared_judge("J1", cache)
+    _prepared_judge("J2", cache, model="gpt-4o")
+    assert mock_llm.generate_text_from_messages.call_count == 1
+    mock_llm.model_params = {"model": "gpt-4o-mini"}
+    _prepared_judge("J3", cache)
+    assert mock_llm.generate_text_from_messages.call_count == 2
+
+
+def test_cache_persists_across_instances(tmp_path):
+    db = str(tmp_path / "test_debates.db")
+    first = ExpertiseCache(DebateStore(db_path=db))
+    first.get_or_discover("m", "openai", None, lambda: "ethics")
+    discover = MagicMock()
+    second = ExpertiseCache(DebateStore(db_path=db))
+    assert second.get_or_discover("m", "openai", None, discover) == "ethics"
+    discover.assert_not_called()
+
+
+def test_concurrent_lookups_are_coalesced(cache):
+    calls = []
+
+    def discover():
+        calls.append(1)
+        time.sleep(0.1)
+        return "economics"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(
+            cache.get_or_discover("motion", "openai", None, discover)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["economics"] * 5
+    assert len(calls) == 1
+
+
+def test_judge_without_cache_always_discovers(mock_llm):
+    DynamicExpertJudge("J1", "motion", llm_provider="openai").prepare()
+    DynamicExpertJudge("J2", "motion", llm_provider="openai").prepare()
+    assert mock_llm.generate_text_from_messages.call_count == 2
+
+
+def test_single_flight_shares_errors_and_forgets_finished_calls():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert flight.in_flight() == 0
+    assert flight.do("k", lambda: 42) == 42
+
+
+def test_runner_opt_out(mocker):
+    judge_cls = mocker.patch("autodebater.debate_runners.DynamicExpertJudge")
+    mocker.patch("autodebater.debate_runners.BullshitDetector")
+    mocker.patch("autodebater.debate_runners.Debater")
+    BasicJudgedDebateRunner("motion", expertise_cache=False)
+    assert "expertise_cache" not in judge_cls.call_args.kwargs
+    BasicJudgedDebateRunner("motion")
+    assert isinstance(judge_cls.call_args.kwargs["expertise_cache"], ExpertiseCache)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,104 @@
+"""Unit tests for debate lifecycle hooks."""
+
+import pytest
+from langchain_core.tools import tool
+
+from autodebater.debate import JudgedDebate
+from autodebater.debate_runners import BasicJudgedDebateRunner
+from autodebater.hooks import HookRegistry, global_hooks
+from autodebater.participants import Debater, Judge
+
+
+@pytest.fixture(autouse=True)
+def no_stub_env(monkeypatch):
+    settings = ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE",
+                "TOOL_CALL_RATE", "SEED")
+    for name in settings:
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+
+
+def test_stub_debate_emits_timed_events():
+    runner = BasicJudgedDebateRunner("Cities should ban cars", epochs=1, llm="stub",
+                                     expertise_cache=False)
+    events = []
+    runner.debate.hooks.subscribe(events.append)
+    list(runner.run_debate())
+
+    names = [e.name for e in events]
+    assert names[0] == "debate_start" and names[-1] == "debate_end"
+    assert names.count("turn_start") == names.count("turn_end") == 2
+    assert names.count("llm_call_start") == names.count("llm_call_end") > 0
+    assert names.count("score_update") == 4  # two judges, two turns
+    assert all(e.debate_id == runner.debate.debate_id for e in events)
+
+    turn_end = next(e for e in events if e.name == "turn_end")
+    assert turn_end.data["duration_ms"] >= 0 and turn_end.data["role"] == "debater"
+    assert turn_end.data["metrics"].llm_calls == 1
+    llm_end = next(e for e in events if e.name == "llm_call_end")
+    assert llm_end.data["provider"] == "stub" and llm_end.data["output_tokens"] > 0
+    assert events[-1].data["turns"] == 2
+    assert all(a.perf_time <= b.perf_time for a, b in zip(events, events[1:]))
+
+
+def test_tool_calls_are_announced():
+    @tool
+    def search(query: str) -> str:
+        """Look something up."""
+        return f"a fact about {query}"
+
+    debater = Debater("D", "Cities should ban cars", "for", llm_provider="stub",
+                      tools=[search])
+    events = []
+    debater.hooks.subscribe(events.append, "tool_call_start", "tool_call_end",
+                            "llm_call_end")
+    debater.respond([])
+    assert [e.name for e in events] == ["llm_call_end", "tool_call_start",
+                                        "tool_call_end", "llm_call_end"]
+    assert events[2].data["tool"] == "search" and events[2].data["duration_ms"] >= 0
+
+
+def test_judge_retry_is_announced():
+    debate = JudgedDebate("Cities should ban cars", epochs=1)
+    for name, stance in (("A", "for"), ("B", "against")):
+        debate.add_debaters(Debater(name, "Cities should ban cars", stance,
+                                    llm_provider="stub"))
+    judge = Judge("J", "Cities should ban cars", llm_provider="stub")
+    replies = iter(["not a score", "60 fine"])
+    judge.respond = lambda _msgs: next(replies, "55 fine")
+    debate.add_judge(judge)
+    retries = []
+    debate.hooks.subscribe(retries.append, "judge_retry")
+    list(debate.run())
+    assert [e.data["participant"] for e in retries] == ["J"]
+
+
+def test_subscribers_see_global_events_and_failures_are_contained():
+    seen = []
+
+    def broken(*_):
+        raise RuntimeError("boom")
+
+    global_hooks.subscribe(broken)
+    global_hooks.subscribe(seen.append, "llm_call_end")
+    try:
+        judge = Judge("J", "motion", llm_provider="stub")
+        judge.respond([])
+    finally:
+        global_hooks.unsubscribe(broken)
+        global_hooks.unsubscribe(seen.append)
+    assert len(seen) == 1
+    subscribed = [callback for callback, _ in global_hooks._subscribers]  # pylint: disable=protected-access
+    assert broken not in subscribed and seen.append not in subscribed
+
+
+def test_registry_without_subscribers_is_inert():
+    registry = HookRegistry(parent=HookRegistry())
+    assert not registry
+    with registry.timed("turn_start", "turn_end", turn=1) as info:
+        info["extra"] = True
+    with pytest.raises(ValueError):
+        registry.subscribe(print, "not_an_event")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,78 @@
+"""Unit tests for the lease-based job worker."""
+
+import threading
+
+import pytest
+
+from autodebater.jobs import JobWorker
+from autodebater.persistence import DebateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DebateStore(db_path=str(tmp_path / "jobs.db"))
+
+
+def test_run_one_completes_job(store):  # pylint: disable=redefined-outer-name
+    seen = []
+    worker = JobWorker(store, lambda job: seen.append(job["request"]) or "completed")
+    store.enqueue_job("j1", {"motion": "M"})
+    assert worker.run_one()
+    assert not worker.run_one()
+    assert seen == [{"motion": "M"}]
+    assert store.get_job("j1")["state"] == "completed"
+
+
+def test_handler_state_is_recorded(store):  # pylint: disable=redefined-outer-name
+    worker = JobWorker(store, lambda job: "cancelled")
+    store.enqueue_job("j1", {})
+    worker.run_one()
+    assert store.get_job("j1")["state"] == "cancelled"
+
+
+def test_failed_attempt_is_retried(store):  # pylint: disable=redefined-outer-name
+    attempts = []
+
+    def flaky(job):
+        attempts.append(job["attempts"])
+        if len(attempts) == 1:
+            raise RuntimeError("provider error")
+        return "completed"
+
+    worker = JobWorker(store, flaky, retry_delay=0)
+    store.enqueue_job("j1", {})
+    worker.run_one()
+    assert store.get_job("j1")["state"] == "queued"
+    worker.run_one()
+    assert attempts == [1, 2]
+    assert store.get_job("j1")["state"] == "completed"
+
+
+def test_interrupted_job_is_resumed_after_restart(store):  # pylint: disable=redefined-outer-name
+    store.enqueue_job("j1", {})
+    store.claim_job("old-process", lease_seconds=-1)  # claimed, then the process died
+
+    ran = []
+    JobWorker(store, lambda job: ran.append(job["job_id"])).run_one()
+    assert ran == ["j1"]
+    assert store.get_job("j1")["attempts"] == 2
+
+
+def test_worker_threads_drain_queue(store):  # pylint: disable=redefined-outer-name
+    done = threading.Event()
+    ran = []
+
+    def handler(job):
+        ran.append(job["job_id"])
+        if len(ran) == 3:
+            done.set()
+
+    worker = JobWorker(store, handler, concurrency=2, poll_interval=0.01)
+    for n in range(3):
+        store.enqueue_job(f"j{n}", {})
+    worker.start()
+    try:
+        assert done.wait(5)
+    finally:
+        worker.stop(timeout=1)
+    assert sorted(ran) == ["j0", "j1", "j2"]
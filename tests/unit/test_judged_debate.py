@@ -2,13 +2,15 @@
 This is a test module to cycle through the judged debate with mocks
 """
 
+import json
+import time
 from unittest.mock import create_autospec
 
 import pytest
 
-from autodebater.debate import JudgedDebate
-from autodebater.errors import JudgementParseError
-from autodebater.participants import Moderator
+from autodebater.debate import JudgedDebate, SimpleDebate
+from autodebater.errors import CheckpointError, DebateCancelled, JudgementParseError
+from autodebater.participants import Debater, DynamicExpertJudge, Judge, Moderator
 
 
 def test_judged_debate_initialization():
@@ -123,9 +125,6 @@ def test_debate_flow_with_error(
 
 def test_debate_retry_on_bad_judge_output(mock_debater1):
     """Judge fails on first response but succeeds on retry — debate continues."""
-    from unittest.mock import create_autospec
-    from autodebater.participants import Judge
-
     debate = JudgedDebate(motion="AI will surpass human intelligence", epochs=1)
     debate.add_debaters(mock_debater1)
 
@@ -148,9 +147,6 @@ def test_debate_retry_on_bad_judge_output(mock_debater1):
 
 def test_debate_retry_exhausted_raises(mock_debater1):
     """Judge fails on both attempts — JudgementParseError is raised from debate()."""
-    from unittest.mock import create_autospec
-    from autodebater.participants import Judge
-
     debate = JudgedDebate(motion="AI will surpass human intelligence", epochs=1)
     debate.add_debaters(mock_debater1)
 
@@ -196,5 +192,163 @@ def test_judged_debate_with_moderator(mock_debater1, mock_judge1):
     mock_mod.closing_statement.assert_called_once()
 
 
+def test_cancel_stops_at_next_turn(mock_debater1, mock_debater2, mock_judge1):
+    debate = JudgedDebate(motion="AI will surpass human intelligence", epochs=1)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(mock_judge1)
+    assert mock_judge1.cancel_token is debate.cancel_token
+
+    gen = debate.debate()
+    next(gen)  # opening
+    next(gen)  # first debater
+    debate.cancel("stop")
+    with pytest.raises(DebateCancelled, match="stop"):
+        list(gen)
+    mock_debater2.respond.assert_not_called()
+
+
+def test_deadline_cancels_debate(mock_debater1):
+    debate = JudgedDebate(motion="AI will surpass human intelligence", epochs=2)
+    debate.add_debaters(mock_debater1)
+    debate.cancel_token.set_deadline(0.001)
+    time.sleep(0.01)
+    with pytest.raises(DebateCancelled, match="deadline"):
+        list(debate.debate())
+    mock_debater1.respond.assert_not_called()
+
+
+def _scripted_judged_debate(mocker):
+    """A judged debate with real participants over one shared, scripted LLM mock."""
+    llm = mocker.MagicMock()
+    llm.generate_text_from_messages.return_value = "55 A reasoned point."
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=llm,
+    )
+    debate = JudgedDebate(motion="m", epochs=2)
+    debate.add_debaters(Debater(name="Pro", motion="m", stance="for"))
+    debate.add_debaters(Debater(name="Con", motion="m", stance="against"))
+    debate.add_judge(DynamicExpertJudge(name="Judge", motion="m"))
+    debate.add_moderator(Moderator(name="Mod", motion="m"))
+    return debate, llm.generate_text_from_messages
+
+
+def test_resume_from_checkpoint_skips_completed_calls(mocker):
+    debate, calls = _scripted_judged_debate(mocker)
+    checkpoints = []
+
+    def on_checkpoint(checkpoint):
+        checkpoints.append((json.dumps(checkpoint), calls.call_count))
+
+    debate.on_checkpoint = on_checkpoint
+    full = [(m.seq, m.name, m.message) for m in debate.debate()]
+    total_calls = calls.call_count
+    assert [json.loads(cp)["turn"] for cp, _ in checkpoints] == [0, 1, 2, 3, 4]
+
+    # after the first epoch and the moderator's question
+    saved, calls_before = checkpoints[2]
+    resumed, calls = _scripted_judged_debate(mocker)
+    resumed.resume(json.loads(saved))
+    rest = [(m.seq, m.name, m.message) for m in resumed.debate()]
+
+    assert calls.call_count == total_calls - calls_before
+    assert rest == [m for m in full if m[0] >= json.loads(saved)["next_seq"]]
+    seqs = [m.seq for m in debate.dialogue_history.messages]
+    assert [m.seq for m in resumed.dialogue_history.messages] == seqs
+    assert resumed.scores == debate.scores
+    assert resumed.judges[0].expertise == debate.judges[0].expertise
+    assert resumed.debaters[0].chat_history == debate.debaters[0].chat_history
+
+
+def test_resume_rejects_mismatched_checkpoint(mock_debater1):
+    simple = SimpleDebate(motion="m", epochs=1)
+    simple.add_debaters(mock_debater1)
+    with pytest.raises(CheckpointError):
+        JudgedDebate(motion="m").resume(simple.checkpoint())
+
+
+def _constant_judge(reply="70 Solid."):
+    judge = create_autospec(Judge, instance=True)
+    judge.name, judge.role = "Judge", "judge"
+    judge.respond.return_value = reply
+    return judge
+
+
+@pytest.mark.parametrize(
+    "cadence,judged_turns", [("message", 4), ("epoch", 2), ("every:3", 2), ("end", 1)]
+)
+def test_judging_cadence(mock_debater1, mock_debater2, cadence, judged_turns):
+    judge = _constant_judge()
+    debate = JudgedDebate(motion="m", epochs=2, judging=cadence)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(judge)
+
+    msgs = list(debate.debate())
+
+    assert judge.respond.call_count == judged_turns
+    assert judge.observe.call_count == 4 - judged_turns
+    assert len(debate.scores) == judged_turns
+    score_updates = [m for m in msgs if m.message.startswith("Current Score")]
+    assert len(score_updates) == judged_turns
+    # the final turn is always scored
+    assert msgs[-1].message == "Current Score is 70.0"
+
+
+def test_judging_cadence_end_keeps_initial_running_score(mock_debater1, mock_debater2):
+    debate = JudgedDebate(motion="m", epochs=2, judging="end")
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(_constant_judge("80 Clear."))
+    stream = debate.debate()
+    for _ in range(4):  # opening and the first three (unscored) turns
+        next(stream)
+    assert debate.running_score == 50
+    list(stream)
+    assert debate.running_score == 80.0
+
+
+def test_warm_up_overlaps_expertise_discovery_with_opening(
+    mocker, mock_debater1, mock_debater2
+):
+    """Judge expertise discovery runs during the opening, not on the first judgement."""
+    delay = 0.2
+
+    def generate(messages, **kwargs):  # pylint: disable=unused-argument
+        time.sleep(delay)  # every LLM call: opening, expertise discovery, judgement
+        if messages[0][1] == "You are a domain expert.":
+            return "economics"
+        return "60 Fair."
+
+    llm = mocker.MagicMock()
+    llm.generate_text_from_messages.side_effect = generate
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=llm,
+    )
+
+    debate = JudgedDebate(motion="m", epochs=1)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    judges = [DynamicExpertJudge(name=f"J{n}", motion="m") for n in range(2)]
+    for judge in judges:
+        debate.add_judge(judge)
+    debate.add_moderator(Moderator(name="Mod", motion="m"))
+
+    start = time.monotonic()
+    stream = debate.debate()
+    next(stream)  # opening
+    next(stream)  # first debater
+    next(stream)  # first judgement
+    elapsed = time.monotonic() - start
+
+    # serial: opening + two discoveries + judgement = 4 delays;
+    # warmed up: opening + judgement
+    assert elapsed < 3 * delay
+    assert [j.expertise for j in judges] == ["economics", "economics"]
+    assert llm.generate_text_from_messages.call_count == 4
+
+
 if __name__ == "__main__":
     pytest.main()
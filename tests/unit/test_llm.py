@@ -3,6 +3,8 @@ pytest for the llm module
 """
 
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +15,7 @@ from autodebater.llm import (
     LLMWrapperFactory,
     OpenAILLMWrapper,
 )
+from autodebater.participants import Debater, Judge
 
 
 def test_openai_llm_wrapper():
@@ -59,3 +62,65 @@ def test_anthropic_llm_wrapper_generate(monkeypatch):
         wrapper = AnthropicLLMWrapper(model="claude-opus-4-6")
         result = wrapper.generate_text_from_messages([("user", "Hello")])
         assert result == "Mocked Anthropic response"
+
+
+def _slow_chat(mock_chat):
+    def invoke(messages):  # pylint: disable=unused-argument
+        time.sleep(0.1)
+        return MagicMock(content="shared")
+
+    instance = MagicMock()
+    instance.invoke.side_effect = invoke
+    mock_chat.return_value = instance
+    return instance
+
+
+def _concurrently(func, n=4):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(func())) for _ in range(n)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_identical_concurrent_requests_are_coalesced():
+    with patch("autodebater.llm.ChatOpenAI") as mock_chat:
+        chat = _slow_chat(mock_chat)
+        wrappers = [OpenAILLMWrapper(model="gpt-4o") for _ in range(4)]
+        calls = iter(wrappers)
+        results = _concurrently(
+            lambda: next(calls).generate_text_from_messages([("user", "Hi")])
+        )
+        assert results == ["shared"] * 4
+        assert chat.invoke.call_count == 1
+
+
+def test_coalescing_opt_out_and_distinct_requests():
+    with patch("autodebater.llm.ChatOpenAI") as mock_chat:
+        chat = _slow_chat(mock_chat)
+        wrapper = OpenAILLMWrapper(model="gpt-4o")
+        messages = [("user", "Hi")]
+        _concurrently(
+            lambda: wrapper.generate_text_from_messages(messages, coalesce=False)
+        )
+        assert chat.invoke.call_count == 4
+        prompts = iter(["a", "b", "c", "d"])
+        _concurrently(
+            lambda: wrapper.generate_text_from_messages([("user", next(prompts))])
+        )
+        assert chat.invoke.call_count == 8
+
+
+def test_debaters_opt_out_of_coalescing_when_sampling():
+    def debater(**params):
+        return Debater("D", "m", "for", llm_provider="openai", **params)
+
+    with patch("autodebater.llm.ChatOpenAI"):
+        assert not debater().coalesce_requests
+        assert not debater(temperature=0.7).coalesce_requests
+        assert debater(temperature=0).coalesce_requests
+        assert Judge("J", "m", llm_provider="openai").coalesce_requests
@@ -0,0 +1,172 @@
+"""Unit tests for the LLM response cache."""
+
+import itertools
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.tools import tool
+
+from autodebater.debate_runners import BasicSimpleDebateRunner
+from autodebater.errors import LLMCacheMiss
+from autodebater.llm import CachingLLMWrapper, LLMWrapperFactory, OpenAILLMWrapper
+from autodebater.llm_cache import LLMResponseCache, cache_key, cache_mode
+from autodebater.stub_llm import StubChatModel
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"))
+
+
+@pytest.fixture
+def chat_openai():
+    with patch("autodebater.llm.ChatOpenAI") as mock_chat:
+        instance = MagicMock()
+        instance.invoke.return_value = MagicMock(content="a response")
+        mock_chat.return_value = instance
+        yield instance
+
+
+def test_cache_key_is_canonical():
+    messages = [("system", "Be brief."), ("user", "Hello")]
+    assert cache_key("openai", {"model": "m", "temperature": 0}, messages) == cache_key(
+        "openai", {"temperature": 0, "model": "m"}, [list(m) for m in messages]
+    )
+    key = cache_key("openai", {"model": "m"}, messages)
+    assert key != cache_key("anthropic", {"model": "m"}, messages)
+    assert key != cache_key("openai", {"model": "n"}, messages)
+
+
+def test_factory_wraps_only_when_enabled(monkeypatch, tmp_path, chat_openai):  # pylint: disable=unused-argument
+    monkeypatch.delenv("AUTODEBATER_LLM_CACHE", raising=False)
+    assert isinstance(LLMWrapperFactory.create_llm_wrapper("openai"), OpenAILLMWrapper)
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE", "on")
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE_DB", str(tmp_path / "llm_cache.db"))
+    wrapper = LLMWrapperFactory.create_llm_wrapper("openai")
+    assert isinstance(wrapper, CachingLLMWrapper) and wrapper.mode == "on"
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE", "sometimes")
+    with pytest.raises(ValueError):
+        cache_mode()
+
+
+def test_repeated_calls_are_served_from_cache(cache, chat_openai):
+    wrapper = CachingLLMWrapper(OpenAILLMWrapper(model="gpt-4o"), "openai", cache)
+    messages = [("user", "Hello")]
+    assert wrapper.generate_text_from_messages(messages) == "a response"
+    assert wrapper.generate_text_from_messages(messages) == "a response"
+    assert chat_openai.invoke.call_count == 1
+    wrapper.generate_text_from_messages([("user", "Goodbye")])
+    assert chat_openai.invoke.call_count == 2
+
+
+def test_replay_mode_raises_on_miss(cache, chat_openai):
+    recorder = CachingLLMWrapper(OpenAILLMWrapper(model="gpt-4o"), "openai", cache)
+    recorder.generate_text_from_messages([("user", "Hello")])
+    replay = CachingLLMWrapper(
+        OpenAILLMWrapper(model="gpt-4o"), "openai", cache, mode="replay"
+    )
+    assert replay.generate_text_from_messages([("user", "Hello")]) == "a response"
+    with pytest.raises(LLMCacheMiss):
+        replay.generate_text_from_messages([("user", "Something new")])
+    assert chat_openai.invoke.call_count == 1
+
+
+@tool
+def lookup(query: str) -> str:
+    """Look something up."""
+    return f"a fact about {query}"
+
+
+def _tool_debate(monkeypatch):
+    names = itertools.count()
+    monkeypatch.setattr("autodebater.debate_runners.generate_name",
+                        lambda _used: f"Speaker{next(names)}")
+    monkeypatch.setattr("autodebater.tools.get_default_tools", lambda: [lookup])
+    runner = BasicSimpleDebateRunner("Cities should ban cars", epochs=1, llm="stub",
+                                     use_tools=True)
+    return [m.message for m in runner.run_debate()]
+
+
+def test_replay_serves_tool_loop_without_the_provider(monkeypatch, tmp_path):
+    for name in (
+        "LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE", "TOOL_CALL_RATE"
+    ):
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+    monkeypatch.setenv("AUTODEBATER_STUB_SEED", "7")
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE_DB", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE", "on")
+    calls = []
+    generate = StubChatModel.generate
+
+    def recording(self, messages):
+        calls.append(bool(self.tools))
+        return generate(self, messages)
+
+    monkeypatch.setattr(StubChatModel, "generate", recording)
+    recorded = _tool_debate(monkeypatch)
+    assert any(calls)  # the debaters went through the tool loop
+
+    def unreachable(*_):
+        raise AssertionError("provider called during replay")
+
+    monkeypatch.setattr(StubChatModel, "generate", unreachable)
+    monkeypatch.setenv("AUTODEBATER_LLM_CACHE", "replay")
+    assert _tool_debate(monkeypatch) == recorded
+
+    monkeypatch.setattr("autodebater.tools.get_default_tools", lambda: [])
+    runner = BasicSimpleDebateRunner("Cities should ban bikes", epochs=1, llm="stub",
+                                     use_tools=True)
+    with pytest.raises(LLMCacheMiss):
+        list(runner.run_debate())
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), ttl_seconds=10)
+    with patch("autodebater.llm_cache.time.time", return_value=1000.0):
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+    with patch("autodebater.llm_cache.time.time", return_value=1011.0):
+        assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), max_bytes=10)
+    for t, key in enumerate("abc"):
+        with patch("autodebater.llm_cache.time.time", return_value=float(t)):
+            cache.put(key, "xxxx")
+        if key == "b":
+            with patch("autodebater.llm_cache.time.time", return_value=1.5):
+                assert cache.get("a") == "xxxx"  # "a" is now more recent than "b"
+    assert cache.get("b") is None
+    assert cache.get("a") == "xxxx" and cache.get("c") == "xxxx"
+    assert cache.stats()["bytes"] <= 10
+
+
+def test_running_total_follows_every_write(tmp_path):
+    db = str(tmp_path / "llm_cache.db")
+    cache = LLMResponseCache(db_path=db, max_bytes=100)
+    cache.put("a", "xxxx")
+    cache.put("a", "xxxxxx")  # replaced, not added
+    cache.put("b", "yyyy")
+    assert cache.stats() == {"entries": 2, "bytes": 10, "max_bytes": 100}
+    # persisted, not rescanned
+    assert LLMResponseCache(db_path=db).stats()["bytes"] == 10
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+def test_writes_under_the_limit_do_not_scan_for_victims(tmp_path, monkeypatch):
+    cache = LLMResponseCache(db_path=str(tmp_path / "llm_cache.db"), max_bytes=10)
+    evictions = []
+    evict = cache._evict  # pylint: disable=protected-access
+    monkeypatch.setattr(cache, "_evict", lambda *a: evictions.append(a) or evict(*a))
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    assert not evictions
+    cache.put("c", "xxxx")
+    assert len(evictions) == 1 and cache.stats()["bytes"] == 8
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -2,9 +2,29 @@
 Test the math functions
 """
 
-from autodebater.scoring import geometric_mean
+import pytest
+
+from autodebater.scoring import JudgingCadence, geometric_mean
 
 
 def test_geometric_means():
     scores = [70, 50]
     assert 60 > geometric_mean(scores) > 59
+
+
+def _due_turns(spec, steps=6, debaters=2):
+    cadence = JudgingCadence(spec)
+    return [turn for turn in range(1, steps + 1) if cadence.due(turn, steps, debaters)]
+
+
+def test_judging_cadence():
+    assert _due_turns("message") == [1, 2, 3, 4, 5, 6]
+    assert _due_turns("epoch") == [2, 4, 6]
+    assert _due_turns("every:4") == [4, 6]  # the final turn is always scored
+    assert _due_turns("end") == [6]
+
+
+@pytest.mark.parametrize("spec", ["weekly", "every:0", "every:x", "end:2"])
+def test_judging_cadence_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        JudgingCadence(spec)
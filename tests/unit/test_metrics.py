@@ -0,0 +1,41 @@
+"""Unit tests for the Prometheus metrics module."""
+
+import pytest
+
+from autodebater import metrics
+from autodebater.hooks import HookEvent
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("t_seconds", "Test.", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, op="q")
+    lines = histogram.render()
+    assert 't_seconds_bucket{op="q",le="0.1"} 1' in lines
+    assert 't_seconds_bucket{op="q",le="1.0"} 3' in lines
+    assert 't_seconds_bucket{op="q",le="+Inf"} 4' in lines
+    assert 't_seconds_count{op="q"} 4' in lines
+    assert 't_seconds_sum{op="q"} 6.05' in lines
+
+
+def test_counter_labels_are_escaped():
+    counter = metrics.Counter("t_total", "Test.", ("name",))
+    counter.inc(2, name='say "hi"')
+    assert 't_total{name="say \\"hi\\""} 2' in counter.render()
+
+
+def test_hook_events_feed_metrics():
+    hits = metrics.LLM_CACHE_REQUESTS.value(result="hit")
+    retries = metrics.JUDGE_RETRIES.value()
+    labels = {"provider": "openai", "model": "gpt-4o", "role": "judge"}
+    data = {**labels, "duration_ms": 250.0, "input_tokens": 100, "cache_hit": True}
+    metrics._on_event(HookEvent("llm_call_end", data))  # pylint: disable=protected-access
+    metrics._on_event(HookEvent("judge_retry", {"participant": "J"}))  # pylint: disable=protected-access
+    assert metrics.LLM_CACHE_REQUESTS.value(result="hit") == hits + 1
+    assert metrics.JUDGE_RETRIES.value() == retries + 1
+    assert metrics.LLM_TOKENS.value(kind="input", **labels) >= 100
+    assert "autodebater_llm_cache_hit_ratio" in metrics.render()
+
+
+if __name__ == "__main__":
+    pytest.main()
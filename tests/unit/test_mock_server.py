@@ -0,0 +1,104 @@
+"""Unit tests for the local OpenAI/Anthropic mock server, through the real clients."""
+
+import threading
+import time
+
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+from langchain_core.tools import tool
+
+from autodebater.llm import AnthropicLLMWrapper, OpenAILLMWrapper
+from autodebater.mock_server import create_app
+from autodebater.participants import Debater, Judge
+from autodebater.stub_llm import StubConfig
+
+
+@tool
+def search(query: str) -> str:
+    """Look something up."""
+    return f"facts about {query}"
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    app = create_app(StubConfig(seed=1))
+    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join(5)
+
+
+@pytest.fixture
+def point_clients(monkeypatch, server_url):
+    monkeypatch.setenv("OPENAI_API_KEY", "mock")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "mock")
+    monkeypatch.setenv("AUTODEBATER_OPENAI_BASE_URL", f"{server_url}/v1")
+    monkeypatch.setenv("AUTODEBATER_ANTHROPIC_BASE_URL", server_url)
+
+
+@pytest.mark.parametrize("wrapper_cls", [OpenAILLMWrapper, AnthropicLLMWrapper])
+def test_generate_through_real_client(point_clients, wrapper_cls):  # pylint: disable=unused-argument
+    wrapper = wrapper_cls()
+    assert wrapper.model_params["base_url"].startswith("http://127.0.0.1")
+    judge = Judge("J", "Cities should ban cars")
+    turn = ("user", "A (debater - FOR): x")
+    reply = wrapper.generate_text_from_messages(judge.chat_history + [turn])
+    score, _, justification = reply.partition(" ")
+    assert 0 <= int(score) <= 100 and justification
+
+
+@pytest.mark.parametrize("wrapper_cls", [OpenAILLMWrapper, AnthropicLLMWrapper])
+def test_streaming(point_clients, wrapper_cls):  # pylint: disable=unused-argument
+    prompt = [("system", 'arguing for the motion: "Cars"'), ("user", "Begin")]
+    chunks = list(wrapper_cls().llm.stream(prompt))
+    assert len(chunks) > 2
+    text = "".join(c.content if isinstance(c.content, str) else "" for c in chunks)
+    assert text.startswith("Point 1")
+
+
+@pytest.mark.parametrize("provider", ["openai", "anthropic"])
+def test_tool_loop(point_clients, provider):  # pylint: disable=unused-argument
+    debater = Debater(
+        "D", "Cities should ban cars", "for", llm_provider=provider, tools=[search]
+    )
+    reply = debater.respond([])
+    assert reply.startswith("Point 1 for")
+
+
+def test_explicit_base_url_wins(point_clients):  # pylint: disable=unused-argument
+    wrapper = OpenAILLMWrapper(model="gpt-4o", base_url="http://elsewhere/v1")
+    assert wrapper.model_params["base_url"] == "http://elsewhere/v1"
+
+
+def test_simulated_errors_are_http_500():
+    client = TestClient(create_app(StubConfig(error_rate=1.0)))
+    messages = [{"role": "user", "content": "hi"}]
+    response = client.post(
+        "/v1/chat/completions", json={"model": "m", "messages": messages}
+    )
+    assert response.status_code == 500
+    assert response.json()["error"]["type"] == "server_error"
+    response = client.post(
+        "/v1/messages", json={"model": "m", "max_tokens": 10, "messages": messages}
+    )
+    assert response.status_code == 500 and response.json()["type"] == "error"
+
+
+def test_latency_is_applied():
+    client = TestClient(create_app(StubConfig(latency_ms=100)))
+    start = time.monotonic()
+    messages = [{"role": "user", "content": "hi"}]
+    client.post("/v1/chat/completions", json={"model": "m", "messages": messages})
+    assert time.monotonic() - start >= 0.1
+
+
+if __name__ == "__main__":
+    pytest.main()
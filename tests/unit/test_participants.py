@@ -2,12 +2,16 @@
 Test module for the participants module.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
 
+from autodebater.concurrency import CancellationToken
 from autodebater.defaults import EXPERT_JUDGE_PROMPT, LLM_PROVIDER
 from autodebater.dialogue import DialogueMessage
+from autodebater.errors import DebateCancelled
 from autodebater.participants import Debater, DynamicExpertJudge, Judge, Moderator
 
 
@@ -180,5 +184,70 @@ def test_moderator_opening(mocker):
     assert result == "Welcome to this debate."
 
 
+def test_tool_loop_checks_cancellation(mocker):
+    """A cancelled debate stops a participant between tool iterations."""
+    mock_llm = MagicMock()
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=mock_llm,
+    )
+    tool = MagicMock()
+    tool.name = "search"
+    token = CancellationToken()
+
+    def run_tool(args):  # pylint: disable=unused-argument
+        token.cancel("stop")
+        return "result"
+
+    tool.run.side_effect = run_tool
+    mock_llm.llm.bind_tools.return_value = mock_llm.llm
+    mock_llm.invoke_messages.return_value = AIMessage(
+        content="", tool_calls=[{"name": "search", "args": {"query": "x"}, "id": "1"}]
+    )
+
+    debater = Debater("D", "motion", "for", llm_provider="openai", tools=[tool])
+    debater.cancel_token = token
+    msg = DialogueMessage(name="mod", role="moderator", message="go", debate_id="1")
+    with pytest.raises(DebateCancelled):
+        debater.respond([msg])
+    assert mock_llm.invoke_messages.call_count == 1
+
+
+def test_observe_records_without_generating(mocker):
+    mock_llm = MagicMock()
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=mock_llm,
+    )
+    judge = Judge("J", "motion", llm_provider="openai")
+    judge.observe([
+        DialogueMessage(
+            name="A", role="debater", message="First", debate_id="1", stance="for"
+        ),
+        DialogueMessage(name="K", role="judge", message="70 ok", debate_id="1"),
+    ])
+    assert judge.chat_history[-1] == ("user", "A (debater - FOR): First")
+    assert len(judge.chat_history) == 2
+    mock_llm.generate_text_from_messages.assert_not_called()
+
+
+def test_dynamic_judge_prepare_runs_discovery_once(mocker):
+    mock_llm = MagicMock()
+    mock_llm.generate_text_from_messages.return_value = "ethics"
+    mocker.patch(
+        "autodebater.participants.LLMWrapperFactory.create_llm_wrapper",
+        return_value=mock_llm,
+    )
+    judge = DynamicExpertJudge("J", "motion", llm_provider="openai")
+    assert not judge.prepared
+    threads = [threading.Thread(target=judge.prepare) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert judge.prepared and judge.expertise == "ethics"
+    assert mock_llm.generate_text_from_messages.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main()
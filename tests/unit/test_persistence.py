@@ -1,12 +1,15 @@
 """Unit tests for the persistence module."""
 
 import json
+import multiprocessing
 import os
+import sqlite3
 import tempfile
 
 import pytest
 
-from autodebater.dialogue import DialogueHistory, DialogueMessage
+from autodebater import persistence
+from autodebater.dialogue import DialogueHistory, DialogueMessage, TurnMetrics
 from autodebater.persistence import DebateExporter, DebateStore
 
 
@@ -81,3 +84,309 @@ def test_export_file_md(tmp_path, sample_history):
     assert os.path.exists(path)
     content = open(path).read()
     assert "# Debate Transcript" in content
+
+
+def test_schema_indexes_and_wal(store):
+    conn = store._connect()  # pylint: disable=protected-access
+    rows = conn.execute("SELECT type, name FROM sqlite_master WHERE type = 'index'")
+    indexes = {r[1] for r in rows}
+    assert "idx_messages_debate_id" in indexes
+    assert "idx_debates_created_at" in indexes
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA user_version").fetchone()[0] > 0
+
+
+def test_connection_reused_per_thread(store):
+    assert store._connect() is store._connect()  # pylint: disable=protected-access
+
+
+def test_migrations_run_once_per_db(tmp_path, mocker):
+    db_file = str(tmp_path / "once.db")
+    DebateStore(db_path=db_file)
+    spy = mocker.spy(DebateStore, "_connect")
+    DebateStore(db_path=db_file)
+    spy.assert_not_called()
+
+
+def test_load_uses_debate_id_index(store, sample_history):
+    store.save(sample_history, "Test motion")
+    plan = (
+        store._connect()  # pylint: disable=protected-access
+        .execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM messages WHERE debate_id = ? ORDER BY id",
+            ("test-id",),
+        )
+        .fetchall()
+    )
+    assert any("idx_messages_debate_id" in row[-1] for row in plan)
+
+
+def _history(debate_id, judgements=()):
+    h = DialogueHistory()
+    h.add_message(
+        DialogueMessage(
+            name="mod", role="moderator", message="Please begin", debate_id=debate_id
+        )
+    )
+    for score in judgements:
+        h.add_message(
+            DialogueMessage(
+                name="J",
+                role="judge",
+                message=f"{score} ok",
+                debate_id=debate_id,
+                judgement=score,
+            )
+        )
+    return h
+
+
+def test_save_records_summary_columns(store):
+    store.save(_history("d1", [40.0, 90.0]), "Summary motion", mode="judged")
+    meta = store.get_debate_meta("d1")
+    assert meta["mode"] == "judged"
+    assert meta["status"] == "completed"
+    assert meta["message_count"] == 3
+    assert meta["final_score"] == pytest.approx(60.0)
+    assert store.get_debate_meta("missing") is None
+
+
+def test_resave_keeps_created_at(store, sample_history):
+    store.save(sample_history, "Motion")
+    first = store.get_debate_meta("test-id")["created_at"]
+    store.save(sample_history, "Motion", status="failed")
+    meta = store.get_debate_meta("test-id")
+    assert meta["created_at"] == first
+    assert meta["status"] == "failed"
+
+
+def test_page_debates_keyset(store):
+    for n in range(5):
+        store.save(
+            _history(f"d{n}"), f"Motion {n}", mode="simple" if n % 2 else "judged"
+        )
+    seen = []
+    page = store.page_debates(limit=2)
+    while True:
+        seen.extend(d["debate_id"] for d in page["items"])
+        if not page["next_cursor"]:
+            break
+        page = store.page_debates(limit=2, cursor=page["next_cursor"])
+    assert sorted(seen) == [f"d{n}" for n in range(5)]
+    assert len(seen) == len(set(seen))
+
+
+def test_list_debates_filters(store):
+    store.save(_history("a"), "Cats are better", mode="judged")
+    store.save(_history("b"), "Dogs are better", mode="simple")
+    store.save(_history("c"), "Cats_and 100% dogs", mode="simple")
+    assert {d["debate_id"] for d in store.list_debates(mode="simple")} == {"b", "c"}
+    cats = store.list_debates(motion_prefix="cats")
+    assert {d["debate_id"] for d in cats} == {"a", "c"}
+    assert [d["debate_id"] for d in store.list_debates(motion_prefix="Cats_")] == ["c"]
+    assert store.list_debates(since="9999") == []
+
+
+def test_invalid_cursor(store):
+    with pytest.raises(ValueError):
+        store.page_debates(cursor="not-a-cursor")
+
+
+def test_migrates_legacy_database(tmp_path):
+    db_file = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_file)
+    conn.executescript(
+        """
+        CREATE TABLE debates (debate_id TEXT PRIMARY KEY, motion TEXT NOT NULL,
+            created_at TEXT NOT NULL);
+        CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT,
+            debate_id TEXT NOT NULL, timestamp TEXT NOT NULL, name TEXT NOT NULL,
+            role TEXT NOT NULL, stance TEXT, judgement REAL, message TEXT NOT NULL);
+        INSERT INTO debates VALUES ('old', 'Old motion', '2024-01-01T00:00:00');
+        INSERT INTO messages
+            (debate_id, timestamp, name, role, stance, judgement, message)
+            VALUES ('old', '2024-01-01T00:00:00', 'J', 'judge', NULL, 80.0, '80 fine');
+        """
+    )
+    conn.close()
+    meta = DebateStore(db_path=db_file).get_debate_meta("old")
+    assert meta["message_count"] == 1
+    assert meta["final_score"] == 80.0
+
+
+def test_search_messages_and_motions(store, sample_history):
+    store.save(sample_history, "Humans versus machines", mode="judged")
+    hits = store.search("surpass")
+    assert {h["name"] for h in hits} == {"Alice", "Bob"}
+    assert all("<mark>surpass</mark>" in h["snippet"] for h in hits)
+    motion_hits = store.search("machines")
+    assert motion_hits[0]["kind"] == "motion"
+    assert motion_hits[0]["debate_id"] == "test-id"
+
+
+def test_search_stays_in_sync_on_resave(store, sample_history):
+    store.save(sample_history, "Motion")
+    store.save(sample_history, "Motion")
+    assert len(store.search("surpass")) == 2
+    store.save(_history("test-id"), "Motion")
+    assert store.search("surpass") == []
+
+
+def test_search_paginates_and_tolerates_syntax(store, sample_history):
+    store.save(sample_history, "Motion")
+    assert len(store.search("surpass", limit=1)) == 1
+    assert len(store.search("surpass", limit=1, offset=1)) == 1
+    assert store.search('AND ( "') == []
+    assert len(store.search("surp*")) == 2
+
+
+def test_seq_roundtrip_and_after_seq(store, sample_history):
+    for n, msg in enumerate(sample_history.messages):
+        msg.seq = n * 2  # gaps where live-only messages were yielded
+    store.save(sample_history, "Motion")
+    assert [m.seq for m in store.load("test-id")] == [0, 2, 4, 6]
+    assert [m.seq for m in store.load("test-id", after_seq=2)] == [4, 6]
+
+
+def test_job_claim_lease_and_reclaim(store):
+    store.enqueue_job("j1", {"motion": "M"}, max_attempts=2)
+    # lease already lapsed: worker "died"
+    job = store.claim_job("worker-a", lease_seconds=-1)
+    assert job["state"] == "running" and job["attempts"] == 1
+    assert job["request"] == {"motion": "M"}
+
+    job = store.claim_job("worker-b", lease_seconds=60)
+    assert job["lease_owner"] == "worker-b" and job["attempts"] == 2
+    assert store.claim_job("worker-c", lease_seconds=60) is None
+    assert not store.renew_lease("j1", "worker-a", 60)
+    assert store.renew_lease("j1", "worker-b", 60)
+    assert not store.complete_job("j1", "worker-a")
+    assert store.complete_job("j1", "worker-b")
+    assert store.get_job("j1")["state"] == "completed"
+
+
+def test_job_lease_expiry_on_final_attempt_fails(store):
+    store.enqueue_job("j1", {}, max_attempts=1)
+    store.claim_job("worker-a", lease_seconds=-1)
+    assert store.claim_job("worker-b", lease_seconds=60) is None
+    assert store.get_job("j1")["state"] == "failed"
+
+
+def test_fail_job_requeues_until_attempts_exhausted(store):
+    store.enqueue_job("j1", {}, max_attempts=2)
+    store.claim_job("w", 60)
+    assert store.fail_job("j1", "w", "boom") == "queued"
+    store.claim_job("w", 60)
+    assert store.fail_job("j1", "w", "boom again") == "failed"
+    assert store.get_job("j1")["error"] == "boom again"
+
+
+def test_fail_job_retry_delay(store):
+    store.enqueue_job("j1", {}, max_attempts=2)
+    store.claim_job("w", 60)
+    store.fail_job("j1", "w", "boom", retry_delay=60)
+    assert store.claim_job("w", 60) is None
+
+
+def test_cancel_job_and_stats(store):
+    store.enqueue_job("a", {})
+    store.enqueue_job("b", {})
+    store.enqueue_job("c", {})
+    store.claim_job("w", 60)
+    assert store.cancel_job("b")
+    assert not store.cancel_job("a")  # already running
+    stats = store.job_stats()
+    counts = {"queued": 1, "running": 1, "completed": 0, "failed": 0, "cancelled": 1}
+    assert stats["counts"] == counts
+    assert stats["oldest_queued_at"] == store.get_job("c")["created_at"]
+    assert [j["job_id"] for j in store.list_jobs(state="queued")] == ["c"]
+
+
+def test_batch_jobs_keep_order_and_scores(store):
+    store.enqueue_batch("b1", [("z", {"motion": "first"}), ("a", {"motion": "second"})])
+    store.enqueue_job("other", {})
+    job = store.claim_job("w", 60)
+    h = DialogueHistory()
+    h.add_message(
+        DialogueMessage(
+            name="J", role="judge", message="70", debate_id=job["job_id"],
+            judgement=70.0,
+        )
+    )
+    store.save(h, "second")
+    store.complete_job(job["job_id"], "w")
+
+    assert store.cancel_batch("b1") == 1
+    jobs = store.batch_jobs("b1")
+    assert [(j["job_id"], j["batch_index"], j["state"]) for j in jobs] == [
+        ("z", 0, "cancelled"), ("a", 1, "completed")]
+    assert [j["final_score"] for j in jobs] == [None, 70.0]
+    assert store.get_job("other")["batch_id"] is None
+    assert store.batch_jobs("nope") == []
+
+
+def test_checkpoint_roundtrip(store):
+    state = {"turn": 3, "history": [{"message": "x" * 1000}] * 20}
+    store.save_checkpoint("d1", state, mode="judged", config={"motion": "M"})
+    loaded = store.load_checkpoint("d1")
+    assert loaded["state"] == state
+    assert loaded["turn"] == 3 and loaded["mode"] == "judged"
+    assert loaded["config"] == {"motion": "M"}
+    blob = store._connect().execute("SELECT state FROM checkpoints").fetchone()[0]  # pylint: disable=protected-access
+    assert len(blob) < 1000  # compressed
+
+    store.save_checkpoint("d1", {"turn": 4})
+    assert store.load_checkpoint("d1")["turn"] == 4
+    store.delete_checkpoint("d1")
+    assert store.load_checkpoint("d1") is None
+
+
+def test_metrics_roundtrip_and_markdown(store, sample_history):
+    metrics = TurnMetrics(
+        latency_ms=1234.0,
+        input_tokens=500,
+        output_tokens=120,
+        llm_calls=1,
+        cost_usd=0.0025,
+    )
+    sample_history.messages[1].metrics = metrics
+    store.save(sample_history, "AI will surpass human intelligence")
+    loaded = store.load("test-id")
+    assert loaded[1].metrics == metrics
+    assert loaded[0].metrics is None
+    md = DebateExporter.to_markdown(sample_history)
+    assert "1234 ms · 500 in / 120 out tokens · $0.0025" in md
+
+
+def _open_store(db_file, barrier):
+    barrier.wait()
+    DebateStore(db_path=db_file).enqueue_job(f"job-{os.getpid()}", {"motion": "m"})
+
+
+def test_concurrent_processes_migrate_once(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    db_file = str(tmp_path / "shared.db")
+    barrier = ctx.Barrier(4)
+    procs = [ctx.Process(target=_open_store, args=(db_file, barrier)) for _ in range(4)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(30)
+    assert [proc.exitcode for proc in procs] == [0, 0, 0, 0]
+    assert DebateStore(db_path=db_file).job_stats()["counts"]["queued"] == 4
+
+
+def test_failed_migration_rolls_back(tmp_path, monkeypatch):
+    def broken(conn):
+        conn.execute("CREATE TABLE half_done (x INTEGER)")
+        raise RuntimeError("migration failed")
+
+    migrations = persistence._MIGRATIONS  # pylint: disable=protected-access
+    monkeypatch.setattr(persistence, "_MIGRATIONS", migrations + [broken])
+    db_file = str(tmp_path / "rollback.db")
+    with pytest.raises(RuntimeError):
+        DebateStore(db_path=db_file)
+    conn = sqlite3.connect(db_file)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+    half_done = "SELECT name FROM sqlite_master WHERE name = 'half_done'"
+    assert conn.execute(half_done).fetchone() is None
@@ -0,0 +1,25 @@
+"""Unit tests for LLM cost estimates."""
+
+import pytest
+
+from autodebater.pricing import estimate_cost, model_price
+
+
+def test_longest_prefix_wins():
+    assert model_price("gpt-4o-mini-2024-07-18") == model_price("gpt-4o-mini")
+    assert model_price("gpt-4o-mini") != model_price("gpt-4o")
+    assert model_price("some-local-model") is None
+
+
+def test_estimate_cost():
+    input_price, output_price, cached_price = model_price("gpt-4o")
+    cost = estimate_cost(
+        "openai", "gpt-4o", 1_000_000, 1_000_000, cached_tokens=500_000
+    )
+    assert cost == pytest.approx(input_price / 2 + cached_price / 2 + output_price)
+    assert estimate_cost("openai", "unknown", 10, 10) is None
+    assert estimate_cost("stub", "anything", 10, 10) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,56 @@
+"""Unit tests for the profile store and its process-level cache."""
+
+import os
+
+from autodebater.participants import Debater, Judge
+from autodebater.profile import ProfileStore, context_message
+
+
+def test_load_missing_returns_none(tmp_path):
+    assert ProfileStore(str(tmp_path / "absent.md")).load() is None
+
+
+def test_save_and_load(tmp_path):
+    store = ProfileStore(str(tmp_path / "profile.md"))
+    store.save("  I study bees.  \n")
+    assert store.load() == "I study bees."
+    assert store.exists()
+
+
+def test_load_is_cached_until_file_changes(tmp_path, mocker):
+    path = tmp_path / "profile.md"
+    path.write_text("first", encoding="utf-8")
+    store = ProfileStore(str(path))
+    assert store.load() == "first"
+
+    spy = mocker.spy(type(path), "read_text")
+    assert ProfileStore(str(path)).load() == "first"
+    spy.assert_not_called()
+
+    path.write_text("second version", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert ProfileStore(str(path)).load() == "second version"
+
+
+def test_deleted_profile_is_not_served_from_cache(tmp_path):
+    path = tmp_path / "profile.md"
+    store = ProfileStore(str(path))
+    store.save("cached")
+    path.unlink()
+    assert store.load() is None
+
+
+def test_participants_share_one_context_message():
+    context = "".join(["shared ", "context"])
+    debater = Debater("D", "motion", "for", llm_provider="stub", context=context)
+    judge = Judge("J", "motion", llm_provider="stub")
+    other = Debater(
+        "E", "motion", "against", llm_provider="stub", context="shared context"
+    )
+    assert debater.chat_history[1] is other.chat_history[1] is context_message(context)
+    assert debater.chat_history[1] == ("system", "## User Context\nshared context")
+    assert "User Context" not in debater.system_prompt and len(judge.chat_history) == 1
+
+    other.load_state(debater.state())  # a resumed checkpoint shares it again
+    assert other.chat_history[1] is context_message(context)
@@ -0,0 +1,109 @@
+"""Unit tests for early-termination policies."""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from autodebater.debate import ExpertPanelDebate, JudgedDebate
+from autodebater.participants import Judge, Moderator
+from autodebater.stopping import (ConfidenceInterval, ScoreStability, ScoreThreshold,
+                                  from_spec)
+
+
+def test_score_stability():
+    policy = ScoreStability(window=3, tolerance=2)
+    assert policy.check([50, 60], []) is None
+    assert policy.check([30, 60, 61, 62], []) is not None
+    assert policy.check([60, 61, 65], []) is None
+
+
+def test_score_threshold():
+    policy = ScoreThreshold(high=80, low=20)
+    assert policy.check([], []) is None
+    assert policy.check([50], []) is None
+    assert "reached 80" in policy.check([81.5], [])
+    assert "fell to 20" in policy.check([15], [])
+
+
+def test_confidence_interval():
+    policy = ConfidenceInterval(max_width=10, min_scores=4)
+    assert policy.check([], [70, 70, 70]) is None
+    assert policy.check([], [70, 71, 69, 70]) is not None
+    assert policy.check([], [10, 90, 20, 80]) is None
+
+
+def test_from_spec():
+    policy = from_spec("stability:window=4,tolerance=1.5")
+    assert isinstance(policy, ScoreStability)
+    assert (policy.window, policy.tolerance) == (4, 1.5)
+    assert from_spec(policy.spec()).spec() == policy.spec()
+    assert isinstance(from_spec({"policy": "threshold", "high": 90}), ScoreThreshold)
+    with pytest.raises(ValueError):
+        from_spec("nope")
+    with pytest.raises(ValueError):
+        from_spec("ci:bogus=1")
+    with pytest.raises(ValueError):
+        from_spec("ci:max_width")
+
+
+def _judge(reply):
+    judge = create_autospec(Judge, instance=True)
+    judge.name, judge.role = "Judge", "judge"
+    judge.respond.return_value = reply
+    return judge
+
+
+def _moderator():
+    mod = create_autospec(Moderator, instance=True)
+    mod.name, mod.role = "Moderator", "moderator"
+    mod.opening_statement.return_value = "Welcome."
+    mod.generate_question.return_value = "A question?"
+    mod.closing_statement.return_value = "Closing."
+    return mod
+
+
+def test_judged_debate_stops_when_scores_settle(mock_debater1, mock_debater2):
+    judge = _judge("70 Solid.")
+    debate = JudgedDebate(motion="m", epochs=5)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(judge)
+    mod = _moderator()
+    debate.add_moderator(mod)
+    debate.add_stopping_policy(ScoreStability(window=2, tolerance=0))
+
+    msgs = list(debate.debate())
+
+    assert debate.turn == 2
+    assert judge.respond.call_count == 2
+    assert "stable" in debate.stop_reason
+    stop = debate.dialogue_history.messages[-2]
+    assert stop.role == "moderator" and stop.message.startswith("Ending after 2 turns")
+    assert msgs[-1].message == "Closing."
+    # the closing replaces the epoch's question
+    mod.generate_question.assert_not_called()
+
+
+def test_policies_wait_for_every_debater(mock_debater1, mock_debater2, mock_judge1):
+    debate = JudgedDebate(motion="m", epochs=2)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(mock_judge1)
+    debate.add_stopping_policy(ScoreThreshold(high=50))
+    list(debate.debate())
+    assert debate.turn == 2
+
+
+def test_panel_stops_at_convergence_threshold(mock_debater1, mock_debater2):
+    judge = _judge("90 Strong agreement.")
+    debate = ExpertPanelDebate(motion="m", epochs=3)
+    debate.add_debaters(mock_debater1)
+    debate.add_debaters(mock_debater2)
+    debate.add_judge(judge)
+    debate.add_moderator(_moderator())
+    debate.add_stopping_policy(from_spec({"policy": "threshold", "high": 85}))
+
+    msgs = list(debate.debate())
+    assert debate.turn == 2
+    assert "reached 85" in debate.stop_reason
+    assert msgs[-1].message == "Closing."
@@ -0,0 +1,127 @@
+"""Unit tests for the offline stub LLM provider."""
+
+import time
+
+import pytest
+from langchain_core.tools import tool
+
+from autodebater.debate_runners import BasicJudgedDebateRunner
+from autodebater import llm as llm_module
+from autodebater.errors import SimulatedLLMError
+from autodebater.llm import LLMWrapperFactory, StubLLMWrapper
+from autodebater.participants import Debater, Judge
+from autodebater.stub_llm import StubConfig
+
+
+@pytest.fixture(autouse=True)
+def no_stub_env(monkeypatch):
+    for name in ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE",
+                 "TOOL_CALL_RATE", "SEED"):
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+
+
+def test_stub_is_registered_and_needs_no_keys(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    wrapper = LLMWrapperFactory.create_llm_wrapper("stub", model="any")
+    assert isinstance(wrapper, StubLLMWrapper)
+
+
+def test_config_from_env_and_overrides(monkeypatch):
+    monkeypatch.setenv("AUTODEBATER_STUB_LATENCY_MS", "250")
+    monkeypatch.setenv("AUTODEBATER_STUB_SEED", "7")
+    config = StubConfig.from_env(error_rate=0.1, model="ignored")
+    assert (config.latency_ms, config.seed, config.error_rate) == (250.0, 7, 0.1)
+
+
+def test_judged_debate_runs_end_to_end():
+    runner = BasicJudgedDebateRunner("Cities should ban cars", epochs=1, llm="stub",
+                                     expertise_cache=False)
+    messages = list(runner.run_debate())
+    judgements = [m.judgement for m in messages if m.role == "judge"]
+    assert judgements and all(0 <= j <= 100 for j in judgements)
+    debater_lines = [m.message for m in messages if m.role == "debater"]
+    assert any(" for " in line for line in debater_lines)
+    assert any(" against " in line for line in debater_lines)
+    assert all(score is not None for _, score, _ in runner.get_judgements())
+
+
+def test_seeded_judges_are_reproducible():
+    def scores():
+        judge = Judge("J", "motion", llm_provider="stub", seed=3)
+        generate = judge.llm.generate_text_from_messages
+        return [generate(judge.chat_history, coalesce=False) for _ in range(3)]
+    assert scores() == scores()
+
+
+def test_tool_enabled_debater_calls_tools():
+    calls = []
+
+    @tool
+    def search(query: str) -> str:
+        """Look something up."""
+        calls.append(query)
+        return "a fact"
+
+    debater = Debater(
+        "D", "Cities should ban cars", "for", llm_provider="stub", tools=[search]
+    )
+    reply = debater.respond([])
+    assert calls == ["Cities should ban cars"]
+    assert reply.startswith("Point")
+
+
+def test_simulated_errors_and_latency():
+    failing = StubLLMWrapper(error_rate=1.0)
+    with pytest.raises(SimulatedLLMError):
+        failing.generate_text_from_messages([("user", "hi")])
+
+    slow = StubLLMWrapper(latency_ms=50, tokens_per_second=1000)
+    start = time.monotonic()
+    slow.generate_text_from_messages([("user", "hi")], coalesce=False)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_messages_carry_turn_metrics():
+    runner = BasicJudgedDebateRunner("Cities should ban cars", epochs=1, llm="stub",
+                                     expertise_cache=False)
+    messages = list(runner.run_debate())
+    debater = next(m for m in messages if m.role == "debater")
+    judge = next(m for m in messages if m.role == "judge")
+    for msg in (debater, judge):
+        assert msg.metrics.llm_calls == 1
+        assert msg.metrics.input_tokens > 0 and msg.metrics.output_tokens > 0
+        assert msg.metrics.cost_usd == 0.0
+    per_participant = runner.debate.dialogue_history.metrics_by_participant()
+    assert debater.name in per_participant and judge.name in per_participant
+
+
+def test_streaming_records_time_to_first_token(monkeypatch):
+    monkeypatch.setattr(llm_module, "STREAM_RESPONSES", True)
+    wrapper = StubLLMWrapper(latency_ms=30, tokens_per_second=500)
+    text = wrapper.generate_text_from_messages(
+        [("system", 'arguing for the motion: "Cars"'), ("user", "Begin")],
+        coalesce=False,
+    )
+    assert text.startswith("Point 1 for")
+    call = wrapper.last_call
+    assert call["ttft_ms"] >= 30 and call["latency_ms"] >= call["ttft_ms"]
+    assert call["output_tokens"] > 0
+
+
+def test_tool_iterations_are_counted():
+    @tool
+    def search(query: str) -> str:
+        """Look something up."""
+        return f"a fact about {query}"
+
+    debater = Debater(
+        "D", "Cities should ban cars", "for", llm_provider="stub", tools=[search]
+    )
+    debater.respond([])
+    assert debater.last_metrics.tool_iterations == 1
+    assert debater.last_metrics.llm_calls == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
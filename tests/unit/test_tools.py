@@ -55,7 +55,7 @@ def test_tool_enabled_debater_with_tool_call(mocker):
     ai_final = AIMessage(content="AI is advancing rapidly.")
     mock_llm_instance.llm = MagicMock()
     mock_llm_instance.llm.bind_tools.return_value = mock_llm_instance.llm
-    mock_llm_instance.llm.invoke.side_effect = [ai_with_tool, ai_final]
+    mock_llm_instance.invoke_messages.side_effect = [ai_with_tool, ai_final]
 
     # A mock tool
     mock_tool = MagicMock()
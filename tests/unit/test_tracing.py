@@ -0,0 +1,114 @@
+"""Unit tests for span tracing and the trace exporters."""
+
+import json
+
+import pytest
+from langchain_core.tools import tool
+
+from autodebater.debate import JudgedDebate
+from autodebater.debate_runners import BasicJudgedDebateRunner
+from autodebater.participants import Debater, Judge
+from autodebater.tracing import Tracer, to_chrome_trace
+
+MOTION = "Cities should ban cars"
+
+
+@pytest.fixture(autouse=True)
+def no_stub_env(monkeypatch):
+    settings = ("LATENCY_MS", "TOKENS_PER_SECOND", "JITTER", "ERROR_RATE",
+                "TOOL_CALL_RATE", "SEED")
+    for name in settings:
+        monkeypatch.delenv(f"AUTODEBATER_STUB_{name}", raising=False)
+
+
+def _traced_debate(**tracer_kwargs):
+    runner = BasicJudgedDebateRunner(MOTION, epochs=1, llm="stub",
+                                     expertise_cache=False)
+    tracer = Tracer(**tracer_kwargs).attach(runner.debate.hooks)
+    list(runner.run_debate())
+    tracer.detach()
+    return runner.debate, tracer
+
+
+def test_span_tree_is_nested_under_the_debate():
+    debate, tracer = _traced_debate()
+    spans = tracer.spans(debate.debate_id)
+    by_id = {s.span_id: s for s in spans}
+    assert tracer.trace_ids() == [debate.debate_id]
+    assert all(s.trace_id == debate.debate_id and s.end is not None for s in spans)
+
+    (root,) = [s for s in spans if s.parent_id is None]
+    assert root.name == "debate" and root.attributes["turns"] == 2
+    turns = [s for s in spans if s.name == "turn"]
+    assert len(turns) == 2 and all(t.parent_id == root.span_id for t in turns)
+    for span in spans:
+        if span.parent_id:
+            parent = by_id[span.parent_id]
+            assert parent.start <= span.start and span.end <= parent.end
+        if span.name == "llm_call":
+            # expertise discovery runs on a warm-up thread, directly under the debate
+            expected = "respond" if span.thread_id == root.thread_id else "debate"
+            assert by_id[span.parent_id].name == expected
+            assert span.attributes["output_tokens"] > 0
+    responds = [s for s in spans if s.name == "respond"]
+    # judges answer outside turns
+    assert {by_id[s.parent_id].name for s in responds} == {"turn", "debate"}
+    assert any(e["name"] == "score_update" for e in root.events)
+
+
+def test_tool_calls_and_retries_are_traced():
+    @tool
+    def search(query: str) -> str:
+        """Look something up."""
+        return f"a fact about {query}"
+
+    debate = JudgedDebate(MOTION, epochs=1)
+    debate.add_debaters(Debater("A", MOTION, "for", llm_provider="stub",
+                                tools=[search]))
+    debate.add_debaters(Debater("B", MOTION, "against", llm_provider="stub"))
+    judge = Judge("J", MOTION, llm_provider="stub")
+    replies = iter(["not a score", "60 fine"])
+    judge.respond = lambda _msgs: next(replies, "55 fine")
+    debate.add_judge(judge)
+    tracer = Tracer().attach(debate.hooks)
+    list(debate.run())
+
+    spans = tracer.spans(debate.debate_id)
+    by_id = {s.span_id: s for s in spans}
+    (tool_span,) = [s for s in spans if s.name == "tool_call"]
+    assert tool_span.attributes["tool"] == "search"
+    assert by_id[tool_span.parent_id].name == "respond"
+    root = next(s for s in spans if s.name == "debate")
+    assert root.attributes["retries"] == 1
+
+
+def test_exports_are_well_formed(tmp_path):
+    debate, tracer = _traced_debate()
+    jsonl = tmp_path / "trace.jsonl"
+    tracer.export(debate.debate_id, str(jsonl))
+    rows = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert len(rows) == len(tracer.spans(debate.debate_id))
+    ids = {r["span_id"] for r in rows}
+    assert all(r["parent_id"] in ids for r in rows if r["parent_id"])
+
+    chrome = tmp_path / "trace.json"
+    tracer.export(debate.debate_id, str(chrome))
+    trace = json.loads(chrome.read_text())
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len(complete) == len(rows)
+    assert all(e["ts"] >= 0 and e["dur"] >= 0 for e in complete)
+    assert trace["otherData"]["trace_id"] == debate.debate_id
+    assert not to_chrome_trace([])["traceEvents"]
+
+
+def test_output_dir_writes_one_file_per_debate(tmp_path):
+    debate, tracer = _traced_debate(output_dir=str(tmp_path), fmt="jsonl")
+    path = tmp_path / f"{debate.debate_id}.trace.jsonl"
+    assert path.exists() and path.read_text().count("\n") > 5
+    assert not tracer.trace_ids()
+    with pytest.raises(ValueError):
+        Tracer(fmt="xml")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,51 @@
+"""Unit tests for the completed-transcript payload cache."""
+
+from datetime import datetime
+
+from autodebater.dialogue import DialogueMessage
+from autodebater.transcript_cache import (
+    TranscriptCache,
+    choose_encoding,
+    render_transcript,
+)
+
+
+def _entry(text="hello"):
+    msgs = [
+        DialogueMessage(
+            name="A", role="debater", message=text, debate_id="d", seq=0,
+            timestamp=datetime(2024, 1, 1),
+        )
+    ]
+    return render_transcript({"debate_id": "d"}, msgs, lambda p: f"id: {p['seq']}\n\n")
+
+
+def test_choose_encoding():
+    available = {"identity": b"", "gzip": b""}
+    assert choose_encoding(None, available) == "identity"
+    assert choose_encoding("gzip, deflate", available) == "gzip"
+    assert choose_encoding("gzip;q=0, deflate", available) == "identity"
+    assert choose_encoding("br", available) == "identity"
+    assert choose_encoding("*", available) == "gzip"
+
+
+def test_etags_are_strong_and_per_encoding():
+    entry = _entry()
+    assert entry.etag_for("identity") != entry.etag_for("gzip")
+    assert entry.matches(entry.etag_for("gzip"))
+    assert entry.matches(f"W/{entry.etag}")
+    assert not entry.matches('"other"')
+    assert _entry().etag == entry.etag
+
+
+def test_lru_evicts_by_size():
+    entry = _entry("x" * 1000)
+    cache = TranscriptCache(max_bytes=entry.size * 2 + 64)
+    cache.put("a", entry)
+    cache.put("b", _entry("y" * 1000))
+    cache.get("a")
+    cache.put("c", _entry("z" * 1000))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    cache.invalidate("a")
+    assert cache.get("a") is None
@@ -13,8 +13,18 @@ export async function createDebate(payload) {
   return res.json();
 }
 
-export async function listDebates() {
-  const res = await fetch(`${BASE}/debates`);
+/**
+ * Fetch one page of debate summaries, newest first.
+ * @param {{limit?: number, cursor?: string, mode?: string, motion_prefix?: string}} params
+ * @returns {Promise<{items: object[], next_cursor: string|null}>}
+ */
+export async function listDebates(params = {}) {
+  const query = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== undefined && value !== null && value !== "") query.set(key, value);
+  }
+  const qs = query.toString();
+  const res = await fetch(`${BASE}/debates${qs ? `?${qs}` : ""}`);
   if (!res.ok) throw new Error(`HTTP ${res.status}`);
   return res.json();
 }
@@ -25,6 +35,19 @@ export async function getDebate(debateId) {
   return res.json();
 }
 
+/**
+ * Ask the server to stop a running debate. The partial transcript is kept.
+ * @param {string} debateId
+ */
+export async function cancelDebate(debateId) {
+  const res = await fetch(`${BASE}/debates/${debateId}`, { method: "DELETE" });
+  if (!res.ok) {
+    const err = await res.json().catch(() => ({}));
+    throw new Error(err.detail || `HTTP ${res.status}`);
+  }
+  return res.json();
+}
+
 export async function getProfile() {
   const res = await fetch(`${BASE}/profile`);
   if (!res.ok) throw new Error(`HTTP ${res.status}`);
@@ -43,13 +66,17 @@ export async function saveProfile(content) {
 
 /**
  * Opens an SSE connection to stream debate messages.
+ * Each event carries the message sequence number as its id, so when the
+ * browser reconnects after a dropped connection it sends Last-Event-ID and
+ * the server resumes where the stream left off.
  * @param {string} debateId
  * @param {(msg: object) => void} onMessage  called with each parsed message
  * @param {(err: string) => void} onError
  * @param {() => void} onDone
+ * @param {(reason: string) => void} [onCancelled]  called if the debate was stopped
  * @returns {EventSource} caller can call .close() to abort
  */
-export function streamDebate(debateId, onMessage, onError, onDone) {
+export function streamDebate(debateId, onMessage, onError, onDone, onCancelled) {
   const es = new EventSource(`${BASE}/debates/${debateId}/stream`);
 
   es.onmessage = (event) => {
@@ -64,6 +91,8 @@ export function streamDebate(debateId, onMessage, onError, onDone) {
       if (obj.error) {
         es.close();
         onError(obj.error);
+      } else if (obj.cancelled) {
+        onCancelled?.(obj.cancelled);
       } else {
         onMessage(obj);
       }
@@ -73,8 +102,11 @@ export function streamDebate(debateId, onMessage, onError, onDone) {
   };
 
   es.onerror = () => {
-    es.close();
-    onError("Connection lost");
+    // CONNECTING means the browser is retrying (with Last-Event-ID); only a
+    // closed stream is a real failure.
+    if (es.readyState === EventSource.CLOSED) {
+      onError("Connection lost");
+    }
   };
 
   return es;
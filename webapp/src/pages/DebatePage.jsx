@@ -1,6 +1,6 @@
 import { useEffect, useRef, useState } from "react";
 import { useParams } from "react-router-dom";
-import { streamDebate } from "../api.js";
+import { cancelDebate, streamDebate } from "../api.js";
 import MessageCard from "../components/MessageCard.jsx";
 import ScoreBar from "../components/ScoreBar.jsx";
 
@@ -9,6 +9,8 @@ export default function DebatePage() {
   const [messages, setMessages] = useState([]);
   const [done, setDone] = useState(false);
   const [error, setError] = useState(null);
+  const [cancelled, setCancelled] = useState(null);
+  const [stopping, setStopping] = useState(false);
   const [motion, setMotion] = useState("");
   const [mode, setMode] = useState("judged");
   const bottomRef = useRef(null);
@@ -40,7 +42,8 @@ export default function DebatePage() {
         }, 50);
       },
       (err) => setError(err),
-      () => setDone(true)
+      () => setDone(true),
+      (reason) => setCancelled(reason)
     );
     esRef.current = es;
 
@@ -54,6 +57,16 @@ export default function DebatePage() {
     }
   }, [messages]);
 
+  const handleStop = async () => {
+    setStopping(true);
+    try {
+      await cancelDebate(debateId);
+    } catch (err) {
+      setError(err.message);
+      setStopping(false);
+    }
+  };
+
   const motionText =
     messages.find((m) => m.role === "moderator")?.message?.replace(/^Panel discussion on:\s*/i, "").replace(/\.\s*Please begin\.$/, "") ||
     `Debate ${debateId.slice(0, 8)}`;
@@ -77,9 +90,13 @@ export default function DebatePage() {
           <>
             <span className="spinner" />
             {mode === "panel" ? "Discussion in progress…" : "Debate in progress…"}
+            <button className="btn btn-ghost" onClick={handleStop} disabled={stopping}>
+              {stopping ? "Stopping…" : "Stop"}
+            </button>
           </>
         )}
-        {done && !error && (mode === "panel" ? "Discussion complete." : "Debate complete.")}
+        {done && !error && cancelled && `Stopped: ${cancelled}.`}
+        {done && !error && !cancelled && (mode === "panel" ? "Discussion complete." : "Debate complete.")}
         {error && <span className="error">Error: {error}</span>}
       </div>
 
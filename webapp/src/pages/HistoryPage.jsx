@@ -2,15 +2,20 @@ import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { listDebates } from "../api.js";
 
+const PAGE_SIZE = 50;
+
 export default function HistoryPage() {
   const [debates, setDebates] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
-    listDebates()
+    listDebates({ limit: PAGE_SIZE })
       .then((data) => {
-        setDebates(data);
+        setDebates(data.items);
+        setNextCursor(data.next_cursor);
         setLoading(false);
       })
       .catch((err) => {
@@ -19,6 +24,20 @@ export default function HistoryPage() {
       });
   }, []);
 
+  function loadMore() {
+    setLoadingMore(true);
+    listDebates({ limit: PAGE_SIZE, cursor: nextCursor })
+      .then((data) => {
+        setDebates((prev) => [...prev, ...data.items]);
+        setNextCursor(data.next_cursor);
+        setLoadingMore(false);
+      })
+      .catch((err) => {
+        setError(err.message);
+        setLoadingMore(false);
+      });
+  }
+
   if (loading) {
     return (
       <div className="status">
@@ -68,6 +87,16 @@ export default function HistoryPage() {
           </Link>
         ))}
       </div>
+      {nextCursor && (
+        <button
+          className="btn btn-ghost"
+          style={{ marginTop: "1rem" }}
+          onClick={loadMore}
+          disabled={loadingMore}
+        >
+          {loadingMore ? "Loading…" : "Load more"}
+        </button>
+      )}
     </div>
   );
 }